@@ -0,0 +1,406 @@
+"""
+Бенчмарк основных endpoints API задач.
+
+Создает отдельную тестовую базу данных (test_<DATABASE_NAME> или SQLite
+в памяти, рабочие данные не затрагиваются), заполняет ее задачами через bulk_create и измеряет
+пропускную способность и перцентили задержки операций через настоящий
+URLconf (tasks/urls.py) и цепочку middleware с помощью django.test.Client:
+первая и глубокая страница списка (по номеру страницы и курсором),
+детальный просмотр, создание, обновление и удаление задачи.
+
+С --accept-encoding запросы отправляются с этим заголовком Accept-Encoding,
+чтобы измерить сжатие ответов (размер в отчете - байты после сжатия).
+С TASKS_METRICS_ENABLED=true в отчет добавляется среднее время рендеринга
+ответа из заголовка Server-Timing.
+
+Глубокая страница курсором измеряется переходами по настоящим ссылкам
+next из ответов, начиная с курсора около конца списка.
+
+База данных - PostgreSQL из настроек (--database postgresql, по умолчанию
+при заданной DATABASE_NAME) или SQLite в памяти (--database sqlite).
+
+Результаты сохраняются в JSON; с --compare текущий прогон сравнивается
+с сохраненным, и при замедлении p50 больше порога скрипт завершается с кодом 1.
+
+Usage:
+    python benchmarks/api_bench.py --sizes 10000,100000,1000000 --json bench.json
+    python benchmarks/api_bench.py --sizes 10000 --database sqlite
+    python benchmarks/api_bench.py --sizes 10000 --compare bench.json --threshold 0.2
+    python benchmarks/api_bench.py --sizes 10000 --accept-encoding br
+"""
+
+import argparse
+import datetime
+import json
+import os
+import platform
+import random
+import re
+import statistics
+import sys
+import time
+from contextlib import contextmanager
+from functools import partial
+from pathlib import Path
+
+BASE_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(BASE_DIR))
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "config.settings")
+
+DATABASES = ("postgresql", "sqlite")
+
+
+def get_database_choice(argv):
+    """
+    База данных бенчмарка из --database до django.setup().
+
+    По умолчанию PostgreSQL, если задана DATABASE_NAME, иначе SQLite:
+    без имени базы create_test_db для PostgreSQL не может создать test_<имя>.
+    """
+    parser = argparse.ArgumentParser(add_help=False)
+    parser.add_argument(
+        "--database",
+        choices=DATABASES,
+        default="postgresql" if os.getenv("DATABASE_NAME") else "sqlite",
+    )
+    return parser.parse_known_args(argv)[0].database
+
+
+# isort: off
+import django  # noqa: E402
+from django.conf import settings  # noqa: E402
+
+DATABASE = get_database_choice(sys.argv[1:])
+if DATABASE == "sqlite":
+    # Тестовая база SQLite создается в памяти.
+    settings.DATABASES["default"] = {
+        "ENGINE": "django.db.backends.sqlite3",
+        "NAME": BASE_DIR / "bench_db.sqlite3",
+    }
+elif not settings.DATABASES["default"].get("NAME"):
+    sys.exit("Для --database postgresql задайте DATABASE_NAME.")
+
+django.setup()
+
+from django.db import connection  # noqa: E402
+from django.test import Client  # noqa: E402
+from django.test.utils import setup_test_environment  # noqa: E402
+from django.test.utils import teardown_test_environment  # noqa: E402
+from django.urls import reverse  # noqa: E402
+from django.utils import timezone  # noqa: E402
+from rest_framework.pagination import Cursor  # noqa: E402
+
+from tasks.cache import get_task_cache  # noqa: E402
+from tasks.counters import reconcile_status_counters  # noqa: E402
+from tasks.models import Task  # noqa: E402
+from tasks.paginations import CustomPagination, TaskCursorPagination  # noqa: E402
+
+# isort: on
+
+STATUSES = [status for status, _ in Task.STATUS_CHOICES]
+
+# Время рендеринга из заголовка Server-Timing (при TASKS_METRICS_ENABLED).
+RENDER_TIMING = re.compile(r"render;dur=([0-9.]+)")
+
+
+@contextmanager
+def explicit_created_at():
+    """
+    Отключает auto_now_add, чтобы задачи получили разные created_at.
+
+    Иначе bulk_create проставит всем строкам одно время, и порядок
+    списка (-created_at, uuid) не будет похож на рабочие данные.
+    """
+    field = Task._meta.get_field("created_at")
+    field.auto_now_add = False
+    try:
+        yield
+    finally:
+        field.auto_now_add = True
+
+
+def seed(size, batch_size):
+    """Заполняет таблицу задач до size строк пачками bulk_create."""
+    existing = Task.objects.count()
+    now = timezone.now()
+    started = time.perf_counter()
+    with explicit_created_at():
+        for offset in range(existing, size, batch_size):
+            Task.objects.bulk_create(
+                Task(
+                    title=f"Задача {index}",
+                    description=f"Описание задачи номер {index}",
+                    status=STATUSES[index % len(STATUSES)],
+                    created_at=now - datetime.timedelta(seconds=index),
+                )
+                for index in range(offset, min(size, offset + batch_size))
+            )
+    reconcile_status_counters()
+    return time.perf_counter() - started
+
+
+def percentile(values, fraction):
+    """Перцентиль по отсортированному списку значений."""
+    index = min(len(values) - 1, int(round(fraction * (len(values) - 1))))
+    return values[index]
+
+
+def measure(requests, warmup):
+    """
+    Выполняет запросы и возвращает статистику задержки.
+
+    Args:
+        requests (list[Callable[[], HttpResponse]]): Запросы по одному на итерацию
+        warmup (int): Количество первых запросов, не попадающих в статистику
+    """
+    latencies, sizes, renders = [], [], []
+    for index, request in enumerate(requests):
+        started = time.perf_counter()
+        response = request()
+        elapsed = time.perf_counter() - started
+        if response.status_code >= 400:
+            raise RuntimeError(f"Запрос завершился с кодом {response.status_code}")
+        if index >= warmup:
+            latencies.append(elapsed)
+            sizes.append(len(getattr(response, "content", b"")))
+            render = RENDER_TIMING.search(response.get("Server-Timing", ""))
+            if render:
+                renders.append(float(render.group(1)))
+    latencies.sort()
+    total = sum(latencies)
+    stats = {
+        "iterations": len(latencies),
+        "rps": round(len(latencies) / total, 1) if total else 0.0,
+        "latency_ms": {
+            "mean": round(statistics.fmean(latencies) * 1000, 3),
+            "p50": round(percentile(latencies, 0.50) * 1000, 3),
+            "p99": round(percentile(latencies, 0.99) * 1000, 3),
+        },
+        "response_bytes": round(statistics.fmean(sizes)) if sizes else 0,
+    }
+    if renders:
+        stats["render_ms"] = round(statistics.fmean(renders), 3)
+    return stats
+
+
+def get_deep_link(client, size, pages):
+    """
+    Настоящая ссылка next около конца списка задач.
+
+    Курсор строится на задачу за pages + 1 страниц до конца, а ссылка
+    next берется из ответа на него, поэтому дальше бенчмарк идет
+    только по ссылкам, которые выдает API.
+    """
+    page_size = TaskCursorPagination.page_size
+    ordering = TaskCursorPagination.ordering
+    row = Task.objects.order_by(*ordering).values(
+        *(field.lstrip("-") for field in ordering)
+    )[max(0, size - (pages + 2) * page_size)]
+    paginator = TaskCursorPagination()
+    paginator.base_url = "http://testserver" + reverse("tasks:tasks_list")
+    paginator.cursor_query_param = TaskCursorPagination.cursor_query_param
+    position = paginator._get_position_from_instance(row, ordering)
+    link = paginator.encode_cursor(Cursor(offset=0, reverse=False, position=position))
+    return client.get(link + "&pagination=cursor").data["next"]
+
+
+def follow_next(client, link, count):
+    """
+    Запросы, каждый из которых переходит по ссылке next предыдущего ответа.
+
+    Проверяет, что переходы не повторяют задачи: при зацикливании курсора
+    бенчмарк завершается ошибкой, а не измеряет одну и ту же страницу.
+    """
+    state = {"link": link, "seen": set()}
+
+    def request():
+        if state["link"] is None:
+            raise RuntimeError("Ссылки next закончились раньше итераций")
+        response = client.get(state["link"])
+        uuids = {task["uuid"] for task in response.data["results"]}
+        if uuids & state["seen"]:
+            raise RuntimeError("Ссылка next вернула уже полученные задачи")
+        state["seen"] |= uuids
+        state["link"] = response.data["next"]
+        return response
+
+    return [request] * count
+
+
+def run_operations(client, size, iterations, warmup):
+    """Измеряет все операции на таблице из size задач."""
+    count = iterations + warmup
+    list_url = reverse("tasks:tasks_list")
+    last_page = max(1, -(-size // CustomPagination.page_size))
+    uuids = list(
+        Task.objects.order_by("?").values_list("uuid", flat=True)[: max(count, 1000)]
+    )
+    deep_link = get_deep_link(client, size, count)
+
+    def repeat(request, *args, **kwargs):
+        return [partial(request, *args, **kwargs)] * count
+
+    results = {
+        "list_first": measure(repeat(client.get, list_url), warmup),
+        "list_deep": measure(repeat(client.get, list_url, {"page": last_page}), warmup),
+        "list_cursor_first": measure(
+            repeat(client.get, list_url, {"pagination": "cursor"}), warmup
+        ),
+        "list_cursor_deep": measure(follow_next(client, deep_link, count), warmup),
+    }
+
+    get_task_cache().clear()
+    results["retrieve"] = measure(
+        [
+            partial(
+                client.get, reverse("tasks:task_detail", args=[random.choice(uuids)])
+            )
+            for _ in range(count)
+        ],
+        warmup,
+    )
+    results["create"] = measure(
+        repeat(
+            client.post,
+            reverse("tasks:task_create"),
+            {"title": "Новая задача", "description": "Описание"},
+            content_type="application/json",
+        ),
+        warmup,
+    )
+    results["update"] = measure(
+        [
+            partial(
+                client.patch,
+                reverse("tasks:task_update", args=[pk]),
+                {"status": "underway"},
+                content_type="application/json",
+            )
+            for pk in uuids[:count]
+        ],
+        warmup,
+    )
+    created = Task.objects.filter(title="Новая задача").values_list("uuid", flat=True)
+    results["delete"] = measure(
+        [
+            partial(client.delete, reverse("tasks:task_delete", args=[pk]))
+            for pk in created[:count]
+        ],
+        warmup,
+    )
+    return results
+
+
+def compare(results, baseline, threshold):
+    """
+    Сравнивает p50 текущего прогона с сохраненным.
+
+    Returns:
+        list[str]: Операции, замедлившиеся больше чем на threshold
+    """
+    regressions = []
+    for size, operations in results.items():
+        for name, stats in operations.items():
+            before = baseline.get(size, {}).get(name)
+            if not before:
+                continue
+            old, new = before["latency_ms"]["p50"], stats["latency_ms"]["p50"]
+            change = (new - old) / old if old else 0.0
+            line = f"{size:>8} {name:<18} p50 {old:.3f} -> {new:.3f} ms ({change:+.0%})"
+            print(line)
+            if change > threshold:
+                regressions.append(line)
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument(
+        "--sizes",
+        default="10000,100000,1000000",
+        help="Количество задач в таблице через запятую",
+    )
+    parser.add_argument("--iterations", type=int, default=200)
+    parser.add_argument("--warmup", type=int, default=20)
+    parser.add_argument("--batch-size", type=int, default=5000)
+    parser.add_argument(
+        "--accept-encoding",
+        default="",
+        help="Заголовок Accept-Encoding запросов, например gzip или br",
+    )
+    parser.add_argument(
+        "--database",
+        choices=DATABASES,
+        default=DATABASE,
+        help="postgresql (из настроек) или sqlite (в памяти); по умолчанию "
+        "postgresql при заданной DATABASE_NAME",
+    )
+    parser.add_argument("--json", help="Сохранить результаты в JSON-файл")
+    parser.add_argument("--compare", help="JSON-файл предыдущего прогона")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.2,
+        help="Допустимое замедление p50 при --compare (доля, по умолчанию 0.2)",
+    )
+    args = parser.parse_args()
+    sizes = sorted(int(size) for size in args.sizes.split(","))
+
+    setup_test_environment()
+    old_name = connection.creation.create_test_db(verbosity=0)
+    try:
+        headers = (
+            {"Accept-Encoding": args.accept_encoding} if args.accept_encoding else {}
+        )
+        client = Client(headers=headers)
+        results = {}
+        for size in sizes:
+            seconds = seed(size, args.batch_size)
+            print(f"{size} задач, заполнение {seconds:.1f} с")
+            results[str(size)] = run_operations(
+                client, size, args.iterations, args.warmup
+            )
+            for name, stats in results[str(size)].items():
+                latency = stats["latency_ms"]
+                render = (
+                    f", рендеринг {stats['render_ms']} ms"
+                    if "render_ms" in stats
+                    else ""
+                )
+                print(
+                    f"  {name:<18} {stats['rps']:>8} req/s, p50 {latency['p50']} ms, "
+                    f"p99 {latency['p99']} ms, {stats['response_bytes']} байт{render}"
+                )
+    finally:
+        connection.creation.destroy_test_db(old_name, verbosity=0)
+        teardown_test_environment()
+
+    regressions = []
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as file:
+            baseline = json.load(file)["results"]
+        regressions = compare(results, baseline, args.threshold)
+
+    if args.json:
+        report = {
+            "meta": {
+                "date": timezone.now().isoformat(),
+                "python": platform.python_version(),
+                "django": django.get_version(),
+                "database": connection.vendor,
+                "iterations": args.iterations,
+                "accept_encoding": args.accept_encoding,
+            },
+            "results": results,
+        }
+        with open(args.json, "w", encoding="utf-8") as file:
+            json.dump(report, file, ensure_ascii=False, indent=2)
+
+    if regressions:
+        print(f"Замедление больше {args.threshold:.0%}:")
+        print("\n".join(regressions))
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,144 @@
+"""
+Нагрузочный HTTP-клиент для сравнения режимов запуска сервера.
+
+Открывает заданное количество keep-alive соединений и в течение заданного
+времени отправляет GET-запросы, после чего печатает пропускную способность
+и перцентили задержки. Использует только стандартную библиотеку.
+
+Usage:
+    python benchmarks/http_load.py http://127.0.0.1:8000/tasks/ -c 32 -d 20
+    python benchmarks/http_load.py http://127.0.0.1:8000/tasks/ --json result.json
+"""
+
+import argparse
+import asyncio
+import json
+import statistics
+import time
+from urllib.parse import urlsplit
+
+
+async def read_response(reader):
+    """Читает HTTP/1.1 ответ с Content-Length или chunked-телом, возвращает статус."""
+    status_line = await reader.readline()
+    if not status_line:
+        raise ConnectionError("Соединение закрыто сервером")
+    status = int(status_line.split()[1])
+    headers = {}
+    while True:
+        line = await reader.readline()
+        if line in (b"\r\n", b"\n", b""):
+            break
+        name, _, value = line.decode("latin-1").partition(":")
+        headers[name.strip().lower()] = value.strip()
+
+    if "content-length" in headers:
+        await reader.readexactly(int(headers["content-length"]))
+    elif headers.get("transfer-encoding") == "chunked":
+        while True:
+            size = int((await reader.readline()).strip(), 16)
+            await reader.readexactly(size + 2)
+            if size == 0:
+                break
+    return status, headers.get("connection", "").lower() != "close"
+
+
+async def worker(url, deadline, latencies, errors, headers):
+    """Одно keep-alive соединение, отправляющее запросы до истечения времени."""
+    parts = urlsplit(url)
+    path = parts.path or "/"
+    if parts.query:
+        path = f"{path}?{parts.query}"
+    extra = "".join(f"{name}: {value}\r\n" for name, value in headers)
+    request = f"GET {path} HTTP/1.1\r\nHost: {parts.netloc}\r\n{extra}\r\n".encode()
+
+    reader = writer = None
+    while time.perf_counter() < deadline:
+        try:
+            if writer is None:
+                reader, writer = await asyncio.open_connection(
+                    parts.hostname, parts.port or 80
+                )
+            started = time.perf_counter()
+            writer.write(request)
+            await writer.drain()
+            status, keep_alive = await read_response(reader)
+            latencies.append(time.perf_counter() - started)
+            if status >= 400:
+                errors.append(status)
+            if not keep_alive:
+                writer.close()
+                writer = None
+        except (ConnectionError, OSError, asyncio.IncompleteReadError) as error:
+            errors.append(type(error).__name__)
+            if writer is not None:
+                writer.close()
+            writer = None
+    if writer is not None:
+        writer.close()
+
+
+def percentile(values, fraction):
+    """Перцентиль по отсортированному списку значений."""
+    if not values:
+        return 0.0
+    index = min(len(values) - 1, int(round(fraction * (len(values) - 1))))
+    return values[index]
+
+
+async def run(url, concurrency, duration, headers):
+    latencies, errors = [], []
+    started = time.perf_counter()
+    deadline = started + duration
+    await asyncio.gather(
+        *(worker(url, deadline, latencies, errors, headers) for _ in range(concurrency))
+    )
+    elapsed = time.perf_counter() - started
+    latencies.sort()
+    return {
+        "url": url,
+        "concurrency": concurrency,
+        "duration": round(elapsed, 2),
+        "requests": len(latencies),
+        "errors": len(errors),
+        "rps": round(len(latencies) / elapsed, 1),
+        "latency_ms": {
+            "mean": round(statistics.fmean(latencies) * 1000, 2) if latencies else 0,
+            "p50": round(percentile(latencies, 0.50) * 1000, 2),
+            "p99": round(percentile(latencies, 0.99) * 1000, 2),
+        },
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("urls", nargs="+", help="URL для нагрузки (по очереди)")
+    parser.add_argument("-c", "--concurrency", type=int, default=32)
+    parser.add_argument("-d", "--duration", type=float, default=10.0)
+    parser.add_argument(
+        "-H",
+        "--header",
+        action="append",
+        default=[],
+        help="Дополнительный заголовок 'Name: value'",
+    )
+    parser.add_argument("--json", help="Сохранить результаты в JSON-файл")
+    args = parser.parse_args()
+
+    headers = [tuple(part.strip() for part in h.split(":", 1)) for h in args.header]
+    results = []
+    for url in args.urls:
+        result = asyncio.run(run(url, args.concurrency, args.duration, headers))
+        results.append(result)
+        latency = result["latency_ms"]
+        print(
+            f"{url}: {result['rps']} req/s, p50 {latency['p50']} ms, "
+            f"p99 {latency['p99']} ms, errors {result['errors']}"
+        )
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as file:
+            json.dump(results, file, ensure_ascii=False, indent=2)
+
+
+if __name__ == "__main__":
+    main()
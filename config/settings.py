@@ -11,9 +11,9 @@ load_dotenv()
 SECRET_KEY = os.getenv("SECRET_KEY")
 
 
-DEBUG = True
+DEBUG = (os.getenv("DEBUG") or "True").lower() in ("true", "1", "yes")
 
-ALLOWED_HOSTS = []
+ALLOWED_HOSTS = [host for host in os.getenv("ALLOWED_HOSTS", "").split(",") if host]
 
 
 INSTALLED_APPS = [
@@ -30,6 +30,10 @@ INSTALLED_APPS = [
 
 
 MIDDLEWARE = [
+    # Метрики запросов, включаются переменной TASKS_METRICS_ENABLED.
+    "tasks.middleware.TaskMetricsMiddleware",
+    # Сжатие ответов brotli/gzip, должно стоять до middleware, меняющих тело.
+    "tasks.middleware.CompressionMiddleware",
     "django.middleware.security.SecurityMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
     "django.middleware.common.CommonMiddleware",
@@ -75,6 +79,9 @@ else:
             "PASSWORD": os.getenv("DATABASE_PASSWORD"),
             "HOST": os.getenv("DATABASE_HOST", "db"),
             "PORT": os.getenv("DATABASE_PORT", "5432"),
+            # Постоянные соединения вместо переподключения на каждый запрос.
+            "CONN_MAX_AGE": int(os.getenv("DATABASE_CONN_MAX_AGE") or 60),
+            "CONN_HEALTH_CHECKS": True,
         }
     }
 
@@ -106,5 +113,111 @@ USE_TZ = True
 
 STATIC_URL = "static/"
 
+STATIC_ROOT = BASE_DIR / "staticfiles"
+
 
 DEFAULT_AUTO_FIELD = "django.db.models.BigAutoField"
+
+
+TASKS_CACHE_BACKEND = os.getenv("TASKS_CACHE_BACKEND", "tasks.cache.LRUCache")
+TASKS_CACHE_MAX_ENTRIES = int(os.getenv("TASKS_CACHE_MAX_ENTRIES", 10000))
+
+# Внутрипроцессный кэш годится только для одного процесса: при нескольких
+# процессах gunicorn и воркере заданий сброс записи в одном процессе не виден
+# другим. Для production задается общий бэкенд, например
+# TASKS_CACHE_BACKEND=django.core.cache.backends.redis.RedisCache
+# и TASKS_CACHE_LOCATION=redis://redis:6379/0 (см. docker-compose.yaml).
+CACHES = {
+    "default": {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+    },
+    "tasks": {
+        "BACKEND": TASKS_CACHE_BACKEND,
+        "LOCATION": os.getenv("TASKS_CACHE_LOCATION", "tasks"),
+        "TIMEOUT": int(os.getenv("TASKS_CACHE_TIMEOUT", 300)),
+    },
+}
+
+if TASKS_CACHE_BACKEND in (
+    "tasks.cache.LRUCache",
+    "django.core.cache.backends.locmem.LocMemCache",
+):
+    # OPTIONS Redis и Memcached передаются клиенту, поэтому размер задается
+    # только внутрипроцессному кэшу.
+    CACHES["tasks"]["OPTIONS"] = {
+        "MAX_ENTRIES": TASKS_CACHE_MAX_ENTRIES,
+        # Вытеснять по одной самой старой записи, а не треть кэша.
+        "CULL_FREQUENCY": TASKS_CACHE_MAX_ENTRIES,
+    }
+
+TASKS_CACHE_ALIAS = "tasks"
+
+
+TASKS_PAGINATION_MODE = os.getenv("TASKS_PAGINATION_MODE", "page")
+
+# Режим pagination=estimated: оценка count планировщиком для больших таблиц.
+TASKS_COUNT_ESTIMATE_THRESHOLD = int(
+    os.getenv("TASKS_COUNT_ESTIMATE_THRESHOLD") or 100000
+)
+
+TASKS_COUNT_ESTIMATE_TIMEOUT = int(os.getenv("TASKS_COUNT_ESTIMATE_TIMEOUT") or 60)
+
+TASKS_BULK_MAX_ITEMS = int(os.getenv("TASKS_BULK_MAX_ITEMS", 10000))
+
+TASKS_BULK_BATCH_SIZE = int(os.getenv("TASKS_BULK_BATCH_SIZE", 1000))
+
+TASKS_BULK_RETRIEVE_MAX_ITEMS = int(os.getenv("TASKS_BULK_RETRIEVE_MAX_ITEMS") or 1000)
+
+TASKS_EXPORT_CHUNK_SIZE = int(os.getenv("TASKS_EXPORT_CHUNK_SIZE", 2000))
+
+# Журнал изменений задач (endpoint changes/).
+TASKS_CHANGES_MAX_WAIT = float(os.getenv("TASKS_CHANGES_MAX_WAIT") or 30)
+
+TASKS_CHANGES_POLL_INTERVAL = float(os.getenv("TASKS_CHANGES_POLL_INTERVAL") or 0.5)
+
+TASKS_CHANGES_GAP_TIMEOUT = float(os.getenv("TASKS_CHANGES_GAP_TIMEOUT") or 10)
+
+TASKS_CHANGES_RETENTION_DAYS = int(os.getenv("TASKS_CHANGES_RETENTION_DAYS") or 7)
+
+# Поток событий (endpoint events/, Server-Sent Events).
+TASKS_EVENTS_HEARTBEAT = float(os.getenv("TASKS_EVENTS_HEARTBEAT") or 15)
+
+TASKS_EVENTS_MAX_DURATION = float(os.getenv("TASKS_EVENTS_MAX_DURATION") or 300)
+
+TASKS_EVENTS_RETRY = int(os.getenv("TASKS_EVENTS_RETRY") or 3000)
+
+# Срок хранения ответов по заголовку Idempotency-Key (в секундах).
+TASKS_IDEMPOTENCY_TTL = int(os.getenv("TASKS_IDEMPOTENCY_TTL") or 86400)
+
+# Фоновые задания (endpoint jobs/, команда run_task_worker).
+TASKS_JOBS_CONCURRENCY = int(os.getenv("TASKS_JOBS_CONCURRENCY") or 2)
+
+TASKS_JOBS_POOL = os.getenv("TASKS_JOBS_POOL") or "thread"
+
+TASKS_JOBS_POLL_INTERVAL = float(os.getenv("TASKS_JOBS_POLL_INTERVAL") or 1)
+
+TASKS_JOBS_TIMEOUT = int(os.getenv("TASKS_JOBS_TIMEOUT") or 600)
+
+TASKS_JOBS_MAX_ATTEMPTS = int(os.getenv("TASKS_JOBS_MAX_ATTEMPTS") or 3)
+
+TASKS_JOBS_EXPORT_DIR = Path(os.getenv("TASKS_JOBS_EXPORT_DIR") or BASE_DIR / "exports")
+
+TASKS_METRICS_ENABLED = os.getenv("TASKS_METRICS_ENABLED", "").lower() in (
+    "true",
+    "1",
+    "yes",
+)
+
+# Каталог, через который суммируются метрики процессов gunicorn
+# (gunicorn.conf.py задает его сам); без него метрики - одного процесса.
+TASKS_METRICS_DIR = os.getenv("TASKS_METRICS_DIR") or None
+
+TASKS_METRICS_FLUSH_INTERVAL = float(os.getenv("TASKS_METRICS_FLUSH_INTERVAL", 1.0))
+
+# Только компактный JSON: без Browsable API и отступов, в том числе при DEBUG.
+REST_FRAMEWORK = {
+    "DEFAULT_RENDERER_CLASSES": ["tasks.renderers.CompactJSONRenderer"],
+}
+
+# Ответы короче этого размера (в байтах) не сжимаются.
+TASKS_COMPRESSION_MIN_SIZE = int(os.getenv("TASKS_COMPRESSION_MIN_SIZE") or 1024)
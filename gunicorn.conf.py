@@ -0,0 +1,47 @@
+"""
+Конфигурация gunicorn для production-режима.
+
+Параметры задаются переменными окружения:
+    GUNICORN_APP: config.wsgi:application (WSGI) или config.asgi:application (ASGI)
+    GUNICORN_WORKER_CLASS: gthread для WSGI, uvicorn_worker.UvicornWorker для ASGI
+    WEB_CONCURRENCY: количество процессов (по умолчанию 2 * CPU + 1)
+    GUNICORN_THREADS: количество потоков в процессе для gthread
+    TASKS_METRICS_DIR: каталог для суммирования метрик процессов
+        (по умолчанию <tmp>/tasks-metrics)
+"""
+
+import glob
+import multiprocessing
+import os
+import tempfile
+
+wsgi_app = os.getenv("GUNICORN_APP") or "config.wsgi:application"
+bind = os.getenv("GUNICORN_BIND") or "0.0.0.0:8000"
+
+worker_class = os.getenv("GUNICORN_WORKER_CLASS") or "gthread"
+workers = int(os.getenv("WEB_CONCURRENCY") or multiprocessing.cpu_count() * 2 + 1)
+threads = int(os.getenv("GUNICORN_THREADS") or 4)
+
+timeout = int(os.getenv("GUNICORN_TIMEOUT") or 30)
+graceful_timeout = int(os.getenv("GUNICORN_GRACEFUL_TIMEOUT") or 30)
+keepalive = int(os.getenv("GUNICORN_KEEPALIVE") or 5)
+
+# Периодический перезапуск процессов ограничивает рост памяти.
+max_requests = int(os.getenv("GUNICORN_MAX_REQUESTS") or 10000)
+max_requests_jitter = int(os.getenv("GUNICORN_MAX_REQUESTS_JITTER") or 1000)
+
+accesslog = os.getenv("GUNICORN_ACCESSLOG", "-") or None
+errorlog = "-"
+
+# Метрики /tasks/metrics/ суммируются по файлам процессов в общем каталоге,
+# иначе Prometheus получал бы агрегаты случайного процесса.
+metrics_dir = os.environ.setdefault(
+    "TASKS_METRICS_DIR", os.path.join(tempfile.gettempdir(), "tasks-metrics")
+)
+
+
+def on_starting(server):
+    """Удаляет файлы метрик процессов прошлого запуска."""
+    os.makedirs(metrics_dir, exist_ok=True)
+    for path in glob.glob(os.path.join(metrics_dir, "*.json*")):
+        os.remove(path)
@@ -0,0 +1,473 @@
+import asyncio
+import json
+import math
+import time
+
+from django.conf import settings
+from django.core.handlers.asgi import ASGIRequest
+from django.http import HttpResponse, StreamingHttpResponse
+from django.utils.decorators import method_decorator
+from django.views import View
+from django.views.decorators.csrf import csrf_exempt
+from rest_framework.exceptions import ValidationError
+from rest_framework.utils.urls import remove_query_param, replace_query_param
+
+from tasks.broker import get_broker
+from tasks.cache import aget_cached_task, aset_cached_task
+from tasks.conditional import (get_not_modified_response, get_task_validators,
+                               set_validator_headers)
+from tasks.exceptions import TaskPreconditionFailed, TaskVersionConflict
+from tasks.feed import (CHANGES_DEFAULT_LIMIT, CHANGES_MAX_LIMIT,
+                        TaskChangesExpired, aget_task_changes,
+                        await_task_changes)
+from tasks.filters import TaskFilterBackend, TaskOrderingFilter
+from tasks.models import Task
+from tasks.paginations import CustomPagination
+from tasks.renderers import CompactJSONRenderer
+from tasks.serializers import (TASK_FIELDS, TaskSerializer,
+                               task_to_representation)
+
+NOT_FOUND = {"detail": "Not found."}
+
+_renderer = CompactJSONRenderer()
+
+
+def json_response(data, status=200):
+    """JSON-ответ в формате CompactJSONRenderer, как у синхронных endpoints."""
+    return HttpResponse(
+        _renderer.render(data), status=status, content_type=_renderer.media_type
+    )
+
+
+@method_decorator(csrf_exempt, name="dispatch")
+class AsyncTaskView(View):
+    """
+    Базовый асинхронный view задач для ASGI-стека.
+
+    Запросы к PostgreSQL выполняются асинхронными методами ORM
+    (aget, acreate, aupdate, async for), поэтому во время ожидания базы
+    данных процесс обслуживает другие запросы, а не блокирует поток.
+    Формат ответов совпадает с синхронными endpoints из tasks.views.
+    """
+
+    async def get_task_data(self, pk):
+        """Сериализованная задача из кэша или базы данных, None если не найдена."""
+        data = await aget_cached_task(pk)
+        if data is None:
+            row = await Task.objects.values(*TASK_FIELDS).filter(pk=pk).afirst()
+            if row is None:
+                return None
+            data = task_to_representation(row)
+            await aset_cached_task(pk, data)
+        return data
+
+    @staticmethod
+    def parse_body(request):
+        """Разбирает JSON-тело запроса."""
+        try:
+            return json.loads(request.body or b"{}"), None
+        except ValueError:
+            return None, json_response({"detail": "JSON parse error."}, status=400)
+
+
+class AsyncTaskListView(AsyncTaskView):
+    """
+    Асинхронный endpoint списка задач с пагинацией по страницам.
+
+    Methods:
+        GET: Получение списка задач
+
+    Query Parameters:
+        - page (int): Номер страницы
+        - page_size (int): Количество задач на странице (макс. 10)
+        - status, exclude_status, title_prefix, title_contains: фильтры как у списка
+        - ordering (str): Сортировка как у списка (по умолчанию -created_at)
+
+    Response:
+        - 200 OK: Пагинированный список задач
+        - 400 Bad Request: Недопустимый статус в фильтре или сортировка
+        - 404 Not Found: Несуществующая страница
+    """
+
+    async def get(self, request, *args, **kwargs):
+        try:
+            queryset = TaskFilterBackend.filter_by_params(
+                Task.objects.order_by(
+                    *TaskOrderingFilter.get_ordering_by_params(request.GET)
+                ),
+                request.GET,
+            )
+        except ValidationError as error:
+            return json_response(error.detail, status=400)
+
+        page_size = self.get_page_size(request)
+        try:
+            page_number = int(request.GET.get("page", 1))
+        except ValueError:
+            page_number = 0
+        count = await queryset.acount()
+        last_page = max(1, -(-count // page_size))
+        if not 1 <= page_number <= last_page:
+            return json_response({"detail": "Invalid page."}, status=404)
+
+        offset = (page_number - 1) * page_size
+        results = [
+            task_to_representation(row)
+            async for row in queryset.values(*TASK_FIELDS)[offset : offset + page_size]
+        ]
+        url = request.build_absolute_uri()
+        return json_response(
+            {
+                "count": count,
+                "next": (
+                    replace_query_param(url, "page", page_number + 1)
+                    if page_number < last_page
+                    else None
+                ),
+                "previous": (
+                    None
+                    if page_number == 1
+                    else (
+                        remove_query_param(url, "page")
+                        if page_number == 2
+                        else replace_query_param(url, "page", page_number - 1)
+                    )
+                ),
+                "results": results,
+            }
+        )
+
+    @staticmethod
+    def get_page_size(request):
+        """Размер страницы с ограничениями CustomPagination."""
+        try:
+            page_size = int(request.GET[CustomPagination.page_size_query_param])
+        except (KeyError, ValueError):
+            return CustomPagination.page_size
+        if page_size <= 0:
+            return CustomPagination.page_size
+        return min(page_size, CustomPagination.max_page_size)
+
+
+class AsyncTaskRetrieveView(AsyncTaskView):
+    """
+    Асинхронный endpoint детальной информации о задаче.
+
+    Methods:
+        GET: Получение информации о задаче (через кэш, с ETag/Last-Modified)
+
+    Response:
+        - 200 OK: Данные задачи
+        - 304 Not Modified: Задача не изменилась
+        - 404 Not Found: Задача не найдена
+    """
+
+    async def get(self, request, pk, *args, **kwargs):
+        data = await self.get_task_data(pk)
+        if data is None:
+            return json_response(NOT_FOUND, status=404)
+        etag, last_modified = get_task_validators(data["version"], data["updated_at"])
+        response = get_not_modified_response(request, etag, last_modified)
+        if response is not None:
+            return response
+        return set_validator_headers(json_response(data), etag, last_modified)
+
+
+class AsyncTaskCreateView(AsyncTaskView):
+    """
+    Асинхронный endpoint создания задачи.
+
+    Methods:
+        POST: Создание новой задачи
+
+    Response:
+        - 201 Created: Задача успешно создана
+        - 400 Bad Request: Невалидные данные
+    """
+
+    async def post(self, request, *args, **kwargs):
+        data, error = self.parse_body(request)
+        if error:
+            return error
+        serializer = TaskSerializer(data=data)
+        if not serializer.is_valid():
+            return json_response(serializer.errors, status=400)
+        task = await Task.objects.acreate(**serializer.validated_data)
+        return json_response(TaskSerializer(task).data, status=201)
+
+
+class AsyncTaskUpdateView(AsyncTaskView):
+    """
+    Асинхронный endpoint обновления задачи с оптимистичной блокировкой.
+
+    Methods:
+        PUT: Полное обновление задачи
+        PATCH: Частичное обновление задачи
+
+    Response:
+        - 200 OK: Задача успешно обновлена
+        - 400 Bad Request: Невалидные данные
+        - 404 Not Found: Задача не найдена
+        - 409 Conflict: Задача изменена параллельным запросом
+        - 412 Precondition Failed: Версия не совпадает с If-Match
+    """
+
+    async def put(self, request, pk, *args, **kwargs):
+        return await self.update(request, pk, partial=False)
+
+    async def patch(self, request, pk, *args, **kwargs):
+        return await self.update(request, pk, partial=True)
+
+    async def update(self, request, pk, partial):
+        try:
+            task = await Task.objects.aget(pk=pk)
+        except Task.DoesNotExist:
+            return json_response(NOT_FOUND, status=404)
+
+        data, error = self.parse_body(request)
+        if error:
+            return error
+        serializer = TaskSerializer(task, data=data, partial=partial)
+        if not serializer.is_valid():
+            return json_response(serializer.errors, status=400)
+
+        etag, last_modified = get_task_validators(task.version, task.updated_at)
+        if get_not_modified_response(request, etag, last_modified) is not None:
+            return json_response(
+                {"detail": TaskPreconditionFailed.default_detail},
+                status=TaskPreconditionFailed.status_code,
+            )
+
+        expected_version = task.version
+        for attr, value in serializer.validated_data.items():
+            setattr(task, attr, value)
+        if not await task.asave_versioned(
+            expected_version, serializer.validated_data.keys()
+        ):
+            return json_response(
+                {"detail": TaskVersionConflict.default_detail},
+                status=TaskVersionConflict.status_code,
+            )
+        return set_validator_headers(
+            json_response(TaskSerializer(task).data),
+            *get_task_validators(task.version, task.updated_at),
+        )
+
+
+class AsyncTaskDeleteView(AsyncTaskView):
+    """
+    Асинхронный endpoint удаления задачи.
+
+    Methods:
+        DELETE: Удаление задачи
+
+    Response:
+        - 204 No Content: Задача успешно удалена
+        - 404 Not Found: Задача не найдена
+    """
+
+    async def delete(self, request, pk, *args, **kwargs):
+        try:
+            task = await Task.objects.aget(pk=pk)
+        except Task.DoesNotExist:
+            return json_response(NOT_FOUND, status=404)
+        await task.adelete()
+        return HttpResponse(status=204)
+
+
+class AsyncTaskChangesView(AsyncTaskView):
+    """
+    Асинхронный endpoint журнала изменений задач (change feed) с long-poll.
+
+    Клиент, хранящий копию задач, получает текущую позицию журнала запросом
+    без since, загружает задачи списком и дальше запрашивает только изменения
+    после последнего полученного seq (поле next ответа).
+
+    Methods:
+        GET: Изменения задач после since
+
+    Query Parameters:
+        - since (int): Последний полученный seq; без него возвращается только
+          текущая позиция журнала (next)
+        - limit (int): Количество изменений в ответе (по умолчанию 100, макс. 1000)
+        - wait (float): Сколько секунд ждать изменений, если их еще нет
+          (long-poll, по умолчанию 0, макс. TASKS_CHANGES_MAX_WAIT)
+
+    Response:
+        - 200 OK: changes (seq, action, uuid, changed_at, task), next, has_more
+        - 400 Bad Request: Некорректные параметры
+        - 410 Gone: Изменения после since удалены из журнала,
+          нужна полная синхронизация
+    """
+
+    async def get(self, request, *args, **kwargs):
+        params, errors = self.get_params(request)
+        if errors:
+            return json_response(errors, status=400)
+        try:
+            result = await await_task_changes(**params)
+        except TaskChangesExpired as error:
+            return self.expired_response(error)
+        return json_response(result)
+
+    @staticmethod
+    def expired_response(error):
+        """410 Gone: изменения после since удалены из журнала."""
+        return json_response(
+            {
+                "detail": f"Изменения до seq {error.first} удалены из журнала, "
+                "требуется полная синхронизация."
+            },
+            status=410,
+        )
+
+    @staticmethod
+    def get_params(request):
+        """Параметры since, limit и wait с ограничениями и ошибками валидации."""
+        max_wait = getattr(settings, "TASKS_CHANGES_MAX_WAIT", 30)
+        params, errors = {}, {}
+        for name, cast, default, minimum, maximum in (
+            ("since", int, None, 0, None),
+            ("limit", int, CHANGES_DEFAULT_LIMIT, 1, CHANGES_MAX_LIMIT),
+            ("wait", float, 0, 0, max_wait),
+        ):
+            value = request.GET.get(name, "")
+            if value == "":
+                params[name] = default
+                continue
+            try:
+                value = cast(value)
+            except ValueError:
+                value = None
+            if value is None or not math.isfinite(value) or value < minimum:
+                errors[name] = [f"Ожидается число не меньше {minimum}."]
+                continue
+            params[name] = value if maximum is None else min(value, maximum)
+        return params, errors
+
+
+class AsyncTaskEventsView(AsyncTaskChangesView):
+    """
+    Асинхронный endpoint событий изменения задач (Server-Sent Events).
+
+    Поток text/event-stream с событиями created, updated и deleted,
+    id события - seq из журнала изменений, data - изменение в формате
+    changes/. События рассылает брокер процесса (tasks.broker), поэтому
+    тысячи простаивающих подписчиков не создают нагрузки на базу данных.
+    Endpoint обслуживается только через ASGI (см. ниже).
+
+    Поток закрывается через TASKS_EVENTS_MAX_DURATION секунд (и если
+    клиент не успевает читать события); EventSource переподключается
+    сам и передает Last-Event-ID, пропущенные события дочитываются
+    из журнала.
+
+    Methods:
+        GET: Подписка на изменения задач
+
+    Headers:
+        - Last-Event-ID (int): seq последнего полученного события
+
+    Query Parameters:
+        - since (int): То же, что Last-Event-ID, для первого подключения;
+          без него отправляются только новые изменения
+
+    Response:
+        - 200 OK: Поток событий
+        - 400 Bad Request: Некорректный since или Last-Event-ID
+        - 410 Gone: Изменения после since удалены из журнала,
+          нужна полная синхронизация
+        - 501 Not Implemented: Приложение запущено через WSGI
+
+    Под WSGI Django выполняет асинхронный view в отдельном цикле событий
+    на каждый запрос: ответ буферизуется до TASKS_EVENTS_MAX_DURATION,
+    а брокер создается на каждое подключение. Поэтому вне ASGI поток
+    не открывается, а возвращается явная ошибка 501.
+    """
+
+    async def get(self, request, *args, **kwargs):
+        if not isinstance(request, ASGIRequest):
+            return json_response(
+                {
+                    "detail": "Поток событий доступен только при запуске через ASGI "
+                    "(config.asgi:application)."
+                },
+                501,
+            )
+        since = request.headers.get("Last-Event-ID") or request.GET.get("since", "")
+        try:
+            since = int(since) if since != "" else None
+        except ValueError:
+            since = -1
+        if since is not None and since < 0:
+            return json_response({"since": ["Ожидается число не меньше 0."]}, 400)
+
+        backlog = None
+        if since is not None:
+            try:
+                backlog = await aget_task_changes(since, CHANGES_MAX_LIMIT)
+            except TaskChangesExpired as error:
+                return self.expired_response(error)
+
+        response = StreamingHttpResponse(
+            self.stream(since, backlog), content_type="text/event-stream"
+        )
+        response["Cache-Control"] = "no-cache"
+        response["X-Accel-Buffering"] = "no"
+        return response
+
+    async def stream(self, since, backlog):
+        """
+        События изменений: сначала пропущенные из журнала, затем новые от брокера.
+
+        Журнал читается в get() до подписки, чтобы 410 Gone вернулся до начала
+        потока, поэтому после подписки он дочитывается до позиции брокера:
+        изменения, зафиксированные между чтением журнала и подпиской, брокер
+        уже не разошлет. События брокера с seq не больше последнего
+        отправленного отбрасываются, поэтому изменения не теряются
+        и не повторяются.
+        """
+        broker = get_broker()
+        queue, position = await broker.subscribe()
+        heartbeat = getattr(settings, "TASKS_EVENTS_HEARTBEAT", 15)
+        deadline = time.monotonic() + getattr(
+            settings, "TASKS_EVENTS_MAX_DURATION", 300
+        )
+        try:
+            yield f"retry: {getattr(settings, 'TASKS_EVENTS_RETRY', 3000)}\n\n".encode()
+            last = position if since is None else since
+            after_subscribe = False
+            while backlog is not None:
+                for change in backlog["changes"]:
+                    yield self.format_event(change)
+                last = backlog["next"]
+                if not (backlog["has_more"] or last < position) or (
+                    after_subscribe and not backlog["changes"]
+                ):
+                    break
+                backlog = await aget_task_changes(last, CHANGES_MAX_LIMIT)
+                after_subscribe = True
+
+            while (remaining := deadline - time.monotonic()) > 0:
+                try:
+                    change = await asyncio.wait_for(
+                        queue.get(), min(heartbeat, remaining)
+                    )
+                except asyncio.TimeoutError:
+                    yield b": keepalive\n\n"
+                    continue
+                if change is None:
+                    break
+                if change["seq"] > last:
+                    yield self.format_event(change)
+                    last = change["seq"]
+        finally:
+            broker.unsubscribe(queue)
+
+    @staticmethod
+    def format_event(change):
+        """Событие SSE: id - seq изменения, event - тип изменения."""
+        return (
+            f"id: {change['seq']}\nevent: {change['action']}\ndata: ".encode()
+            + _renderer.render(change)
+            + b"\n\n"
+        )
@@ -0,0 +1,125 @@
+import asyncio
+import logging
+import weakref
+
+from django.conf import settings
+
+from tasks.changes import add_change_listener, remove_change_listener
+from tasks.feed import CHANGES_MAX_LIMIT, TaskChangesExpired, aget_task_changes
+
+logger = logging.getLogger(__name__)
+
+# Количество событий, которое может накопиться у медленного подписчика.
+SUBSCRIBER_QUEUE_SIZE = 1000
+
+_brokers = weakref.WeakKeyDictionary()
+
+
+class TaskChangeBroker:
+    """
+    Брокер событий изменения задач внутри одного процесса (event loop).
+
+    Одна фоновая корутина читает журнал изменений (tasks.feed) и рассылает
+    новые изменения в очереди подписчиков, поэтому нагрузка на базу данных
+    не зависит от количества подписчиков: один запрос MIN/MAX(seq) раз
+    в TASKS_CHANGES_POLL_INTERVAL секунд, пока есть хотя бы один подписчик.
+    Изменения, зафиксированные в этом же процессе, будят брокер сразу
+    (add_change_listener); изменения других процессов и узлов приходят
+    со следующим опросом. Простаивающий подписчик - это одна asyncio.Queue.
+
+    Подписчик, который не успевает читать события, получает None и должен
+    закрыть поток: клиент переподключится с Last-Event-ID и дочитает
+    пропущенное из журнала.
+    """
+
+    def __init__(self):
+        self.subscribers = set()
+        self.position = None
+        self.task = None
+        self.wakeup = asyncio.Event()
+        self.loop = None
+
+    async def subscribe(self):
+        """
+        Подписка на изменения.
+
+        Returns:
+            tuple: Очередь изменений и seq, начиная с которого (исключительно)
+                все изменения попадут в очередь
+        """
+        if self.position is None:
+            position = (await aget_task_changes(None))["next"]
+            if self.position is None:
+                self.position = position
+        queue = asyncio.Queue(maxsize=SUBSCRIBER_QUEUE_SIZE)
+        self.subscribers.add(queue)
+        if self.task is None:
+            self.loop = asyncio.get_running_loop()
+            add_change_listener(self.wake)
+            self.task = asyncio.create_task(self.run())
+        return queue, self.position
+
+    def unsubscribe(self, queue):
+        """Отписка; брокер останавливается после ухода последнего подписчика."""
+        self.subscribers.discard(queue)
+        if not self.subscribers:
+            self.wakeup.set()
+
+    def wake(self):
+        """Будит брокер из любого потока (после COMMIT записей журнала)."""
+        try:
+            self.loop.call_soon_threadsafe(self.wakeup.set)
+        except RuntimeError:
+            # Event loop уже закрыт.
+            remove_change_listener(self.wake)
+
+    def publish(self, change):
+        """Кладет изменение в очереди подписчиков, отключая отстающих."""
+        for queue in list(self.subscribers):
+            try:
+                queue.put_nowait(change)
+            except asyncio.QueueFull:
+                self.subscribers.discard(queue)
+                while not queue.empty():
+                    queue.get_nowait()
+                queue.put_nowait(None)
+
+    async def run(self):
+        """Читает журнал изменений, пока есть подписчики."""
+        interval = getattr(settings, "TASKS_CHANGES_POLL_INTERVAL", 0.5)
+        try:
+            while self.subscribers:
+                self.wakeup.clear()
+                try:
+                    result = await aget_task_changes(self.position, CHANGES_MAX_LIMIT)
+                except TaskChangesExpired as error:
+                    # Журнал очищен дальше позиции брокера: подписчики
+                    # переподключатся и получат 410 Gone.
+                    self.position = error.first - 1
+                    self.publish(None)
+                    continue
+                except Exception:
+                    logger.exception("Ошибка чтения журнала изменений задач")
+                    result = {"changes": [], "has_more": False}
+                for change in result["changes"]:
+                    self.publish(change)
+                    self.position = change["seq"]
+                if result["has_more"]:
+                    continue
+                try:
+                    await asyncio.wait_for(self.wakeup.wait(), interval)
+                except asyncio.TimeoutError:
+                    pass
+        finally:
+            remove_change_listener(self.wake)
+            self.task = None
+            self.position = None
+
+
+def get_broker():
+    """Брокер текущего event loop (один на процесс под ASGI)."""
+    loop = asyncio.get_running_loop()
+    broker = _brokers.get(loop)
+    if broker is None:
+        broker = _brokers[loop] = TaskChangeBroker()
+    return broker
@@ -0,0 +1,207 @@
+from threading import Lock
+
+from django.conf import settings
+from django.core.cache import caches
+from django.core.cache.backends.locmem import LocMemCache
+from django.db import transaction
+
+_stats_lock = Lock()
+_stats = {"hits": 0, "misses": 0}
+_evictions = {}
+
+# Ключ отметки сброса задачи в кэше (поля задачи так не называются).
+INVALIDATED_KEY = "invalidated"
+
+
+class LRUCache(LocMemCache):
+    """
+    Внутрипроцессный LRU-кэш с ограничением размера.
+
+    Расширяет LocMemCache подсчетом вытесненных записей, чтобы по метрикам
+    можно было подобрать MAX_ENTRIES. Счетчик общий для всех потоков процесса,
+    как и само хранилище LocMemCache.
+    """
+
+    def __init__(self, name, params):
+        super().__init__(name, params)
+        self._name = name
+
+    def _cull(self):
+        size = len(self._cache)
+        super()._cull()
+        with _stats_lock:
+            _evictions[self._name] = (
+                _evictions.get(self._name, 0) + size - len(self._cache)
+            )
+
+    @property
+    def evictions(self):
+        """Количество записей, вытесненных при переполнении."""
+        return _evictions.get(self._name, 0)
+
+    def __len__(self):
+        return len(self._cache)
+
+
+def get_task_cache():
+    """Бэкенд кэша задач (алиас задается настройкой TASKS_CACHE_ALIAS)."""
+    return caches[getattr(settings, "TASKS_CACHE_ALIAS", "default")]
+
+
+def task_cache_key(pk):
+    """Ключ кэша для сериализованной задачи."""
+    return f"tasks:task:{pk}"
+
+
+def is_invalidated(data):
+    """Запись кэша - отметка сброса, а не задача (см. invalidate_tasks)."""
+    return data is not None and INVALIDATED_KEY in data
+
+
+def is_stale(data, current):
+    """
+    Данные задачи старее записи, уже лежащей в кэше.
+
+    Args:
+        data (dict): Сериализованная задача
+        current (dict | None): Текущая запись кэша: задача или отметка сброса
+    """
+    if current is None:
+        return False
+    if is_invalidated(current):
+        return current["version"] is None or data["version"] < current["version"]
+    return data["version"] <= current["version"]
+
+
+def get_cached_task(pk):
+    """Возвращает сериализованную задачу из кэша или None, учитывая попадания."""
+    data = get_task_cache().get(task_cache_key(pk))
+    if is_invalidated(data):
+        data = None
+    with _stats_lock:
+        _stats["hits" if data is not None else "misses"] += 1
+    return data
+
+
+def set_cached_task(pk, data):
+    """
+    Сохраняет сериализованную задачу в кэш, если в нем нет более новой версии.
+
+    Пустой ключ заполняется атомарным add; запись, прочитанная до
+    параллельного изменения, не заменяет отметку сброса с новой версией.
+    """
+    cache = get_task_cache()
+    key = task_cache_key(pk)
+    if not cache.add(key, dict(data)) and not is_stale(data, cache.get(key)):
+        cache.set(key, dict(data))
+
+
+def get_cached_tasks(pks):
+    """
+    Сериализованные задачи из кэша одним get_many.
+
+    Returns:
+        dict: Задачи, найденные в кэше, по UUID; отсутствующие не включаются
+    """
+    keys = {task_cache_key(pk): pk for pk in pks}
+    found = {
+        key: data
+        for key, data in get_task_cache().get_many(keys).items()
+        if not is_invalidated(data)
+    }
+    with _stats_lock:
+        _stats["hits"] += len(found)
+        _stats["misses"] += len(keys) - len(found)
+    return {keys[key]: data for key, data in found.items()}
+
+
+def set_cached_tasks(tasks):
+    """
+    Сохраняет сериализованные задачи (словарь по UUID) одним set_many.
+
+    Задачи, для которых в кэше уже есть более новая версия или отметка
+    сброса, не записываются (см. set_cached_task).
+    """
+    cache = get_task_cache()
+    keys = {task_cache_key(pk): data for pk, data in tasks.items()}
+    current = cache.get_many(keys)
+    cache.set_many(
+        {
+            key: dict(data)
+            for key, data in keys.items()
+            if not is_stale(data, current.get(key))
+        }
+    )
+
+
+async def aget_cached_task(pk):
+    """Асинхронная версия get_cached_task."""
+    data = await get_task_cache().aget(task_cache_key(pk))
+    if is_invalidated(data):
+        data = None
+    with _stats_lock:
+        _stats["hits" if data is not None else "misses"] += 1
+    return data
+
+
+async def aset_cached_task(pk, data):
+    """Асинхронная версия set_cached_task."""
+    cache = get_task_cache()
+    key = task_cache_key(pk)
+    if not await cache.aadd(key, dict(data)) and not is_stale(
+        data, await cache.aget(key)
+    ):
+        await cache.aset(key, dict(data))
+
+
+def invalidate_tasks(versions):
+    """
+    Сбрасывает задачи в кэше после изменения или удаления.
+
+    Записи удаляются сразу, чтобы транзакция не читала из кэша свои
+    старые данные, а после фиксации заменяются отметкой сброса с новой
+    версией. Параллельное чтение, получившее строку до фиксации, могло бы
+    записать ее в кэш уже после удаления и отдавать устаревшие данные
+    и ETag до TASKS_CACHE_TIMEOUT; отметка не дает записать версию
+    старее новой (для удаленной задачи - никакую).
+
+    Args:
+        versions (dict): Новые версии задач по UUID; None - задача удалена
+    """
+    keys = [task_cache_key(pk) for pk in versions]
+    if not keys:
+        return
+    invalidated = {
+        task_cache_key(pk): {INVALIDATED_KEY: True, "version": version}
+        for pk, version in versions.items()
+    }
+    get_task_cache().delete_many(keys)
+    transaction.on_commit(lambda: get_task_cache().set_many(invalidated))
+
+
+def get_cache_stats():
+    """
+    Счетчики кэша задач текущего процесса.
+
+    Returns:
+        dict: hits, misses, hit_ratio, а для LRUCache также evictions,
+        size и max_entries
+    """
+    with _stats_lock:
+        stats = dict(_stats)
+    lookups = stats["hits"] + stats["misses"]
+    stats["hit_ratio"] = stats["hits"] / lookups if lookups else 0.0
+
+    cache = get_task_cache()
+    if isinstance(cache, LRUCache):
+        stats["evictions"] = cache.evictions
+        stats["size"] = len(cache)
+        stats["max_entries"] = cache._max_entries
+    return stats
+
+
+def reset_cache_stats():
+    """Обнуляет счетчики попаданий, промахов и вытеснений."""
+    with _stats_lock:
+        _stats.update(hits=0, misses=0)
+        _evictions.clear()
@@ -0,0 +1,103 @@
+import threading
+from contextlib import contextmanager
+
+from django.db import transaction
+from django.utils import timezone
+
+from tasks.models import TaskChange
+
+_local = threading.local()
+_listeners = set()
+
+
+def record_task_changes(action, uuids):
+    """
+    Записывает изменения задач в журнал TaskChange.
+
+    Все записи добавляются одним bulk_create в текущей транзакции, поэтому
+    при откате записи задач откатывается и журнал. Внутри defer_task_changes
+    изменения накапливаются и записываются одним INSERT при выходе из блока.
+
+    Args:
+        action (str): Тип изменения: created, updated или deleted
+        uuids (Iterable[UUID]): UUID измененных задач
+    """
+    pending = getattr(_local, "pending", None)
+    if pending is not None:
+        pending.extend((action, pk) for pk in uuids)
+        return
+    write_task_changes([(action, pk) for pk in uuids])
+
+
+def write_task_changes(changes):
+    """Добавляет в журнал пары (тип изменения, UUID задачи) одним INSERT."""
+    if not changes:
+        return
+    now = timezone.now()
+    TaskChange.objects.bulk_create(
+        TaskChange(task_uuid=pk, action=action, changed_at=now)
+        for action, pk in changes
+    )
+    if _listeners:
+        transaction.on_commit(notify_change_listeners)
+
+
+def add_change_listener(listener):
+    """
+    Подписывает функцию на фиксацию новых записей журнала в этом процессе.
+
+    Слушатель вызывается без аргументов после COMMIT транзакции с записями
+    журнала, из того потока, где она выполнялась. Используется брокером
+    событий (tasks.broker), чтобы не ждать следующего опроса журнала.
+    """
+    _listeners.add(listener)
+
+
+def remove_change_listener(listener):
+    """Отписывает функцию, подписанную add_change_listener."""
+    _listeners.discard(listener)
+
+
+def notify_change_listeners():
+    """Вызывает всех слушателей журнала изменений."""
+    for listener in list(_listeners):
+        listener()
+
+
+@contextmanager
+def defer_task_changes():
+    """
+    Накапливает изменения, отправляемые сигналами внутри блока.
+
+    Используется пакетными операциями: удаление N задач отправляет N сигналов
+    post_delete, но в журнал они записываются одним INSERT.
+    При исключении накопленные изменения отбрасываются.
+    """
+    if getattr(_local, "pending", None) is not None:
+        yield
+        return
+    _local.pending = []
+    try:
+        yield
+    except BaseException:
+        _local.pending = None
+        raise
+    pending, _local.pending = _local.pending, None
+    write_task_changes(pending)
+
+
+def prune_task_changes(before):
+    """
+    Удаляет записи журнала старше before.
+
+    Последняя запись сохраняется всегда: иначе на SQLite нумерация seq
+    начнется заново, а клиенты не смогут отличить новые изменения от старых.
+
+    Returns:
+        int: Количество удаленных записей
+    """
+    last = TaskChange.objects.order_by("-seq").values_list("seq", flat=True).first()
+    if last is None:
+        return 0
+    deleted, _ = TaskChange.objects.filter(changed_at__lt=before, seq__lt=last).delete()
+    return deleted
@@ -0,0 +1,92 @@
+import copy
+import hashlib
+
+from django.http import HttpResponse
+from django.utils.cache import get_conditional_response
+from django.utils.dateparse import parse_datetime
+from django.utils.http import http_date, quote_etag
+
+
+def to_datetime(value):
+    """Приводит updated_at из модели или сериализованных данных к datetime."""
+    if isinstance(value, str):
+        return parse_datetime(value)
+    return value
+
+
+def get_task_validators(version, updated_at):
+    """
+    Валидаторы ответа для одной задачи.
+
+    Returns:
+        tuple: ETag по версии задачи (его же принимает If-Match при обновлении)
+        и Last-Modified в секундах Unix
+    """
+    return quote_etag(str(version)), int(to_datetime(updated_at).timestamp())
+
+
+def get_page_validators(rows, *extra):
+    """
+    Валидаторы ответа для страницы списка задач.
+
+    ETag строится по UUID и updated_at задач страницы, а также по
+    дополнительным значениям (count, ссылки пагинации), поэтому меняется
+    при изменении, добавлении и удалении задач на странице.
+    Last-Modified - максимальный updated_at среди задач страницы.
+    """
+    digest = hashlib.md5(usedforsecurity=False)
+    last_modified = None
+    for row in rows:
+        updated_at = to_datetime(
+            row["updated_at"] if isinstance(row, dict) else row.updated_at
+        )
+        pk = row["uuid"] if isinstance(row, dict) else row.pk
+        digest.update(f"{pk}:{updated_at.timestamp()};".encode())
+        timestamp = int(updated_at.timestamp())
+        last_modified = max(last_modified or timestamp, timestamp)
+    for value in extra:
+        digest.update(f"{value};".encode())
+    return quote_etag(digest.hexdigest()), last_modified
+
+
+def set_validator_headers(response, etag, last_modified=None):
+    """Устанавливает заголовки ETag и Last-Modified."""
+    response["ETag"] = etag
+    if last_modified is not None:
+        response["Last-Modified"] = http_date(last_modified)
+    return response
+
+
+def get_not_modified_response(request, etag, last_modified=None):
+    """
+    Проверяет условные заголовки запроса (If-None-Match, If-Modified-Since, If-Match).
+
+    Returns:
+        HttpResponse: 304 Not Modified или 412 Precondition Failed
+        с заголовками валидаторов, либо None, если нужен полный ответ
+    """
+    if_match = request.META.get("HTTP_IF_MATCH")
+    if if_match and "W/" in if_match:
+        # CompressionMiddleware ослабляет ETag сжатого ответа, а версия задачи
+        # от кодирования не зависит: слабый ETag версии принимается в If-Match.
+        # Заголовок нормализуется в копии запроса, исходный META не меняется.
+        request = copy.copy(request)
+        request.META = {**request.META, "HTTP_IF_MATCH": if_match.replace("W/", "")}
+    validators = set_validator_headers(HttpResponse(), etag, last_modified)
+    response = get_conditional_response(
+        request, etag=etag, last_modified=last_modified, response=validators
+    )
+    return None if response is validators else response
+
+
+def has_conditional_headers(request):
+    """Есть ли в запросе заголовки условного GET."""
+    return any(
+        header in request.META
+        for header in (
+            "HTTP_IF_NONE_MATCH",
+            "HTTP_IF_MODIFIED_SINCE",
+            "HTTP_IF_MATCH",
+            "HTTP_IF_UNMODIFIED_SINCE",
+        )
+    )
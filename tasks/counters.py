@@ -0,0 +1,123 @@
+import threading
+from collections import Counter
+from contextlib import contextmanager
+
+from django.db import transaction
+from django.db.models import Count, F
+
+from tasks.models import Task, TaskStatusCounter
+
+_local = threading.local()
+
+
+def update_status_counts(deltas):
+    """
+    Изменяет счетчики задач по статусам на заданные приращения.
+
+    Каждый статус обновляется одним UPDATE ... SET count = count + delta
+    в текущей транзакции, поэтому при откате записи задач откатываются
+    и счетчики. Внутри defer_status_counts приращения накапливаются
+    и применяются одним обновлением на статус при выходе из блока.
+    Статусы обновляются в порядке сортировки, чтобы параллельные
+    транзакции блокировали строки счетчиков в одном порядке.
+
+    Args:
+        deltas (Mapping[str, int]): Приращение количества задач по статусам
+    """
+    pending = getattr(_local, "pending", None)
+    if pending is not None:
+        pending.update(deltas)
+        return
+    for status, delta in sorted(deltas.items()):
+        if not delta:
+            continue
+        updated = TaskStatusCounter.objects.filter(status=status).update(
+            count=F("count") + delta
+        )
+        if not updated:
+            TaskStatusCounter.objects.bulk_create(
+                [TaskStatusCounter(status=status)], ignore_conflicts=True
+            )
+            TaskStatusCounter.objects.filter(status=status).update(
+                count=F("count") + delta
+            )
+
+
+@contextmanager
+def defer_status_counts():
+    """
+    Накапливает приращения счетчиков, отправляемые сигналами внутри блока.
+
+    Используется пакетными операциями: удаление N задач отправляет N сигналов
+    post_delete, но счетчики обновляются не более чем одним UPDATE на статус.
+    При исключении накопленные приращения отбрасываются.
+    """
+    if getattr(_local, "pending", None) is not None:
+        yield
+        return
+    _local.pending = Counter()
+    try:
+        yield
+    except BaseException:
+        _local.pending = None
+        raise
+    pending, _local.pending = _local.pending, None
+    update_status_counts(pending)
+
+
+def get_status_deltas(previous, current):
+    """Приращения счетчиков при смене статуса задачи previous -> current."""
+    if previous == current:
+        return {}
+    deltas = Counter({current: 1})
+    if previous is not None:
+        deltas[previous] -= 1
+    return deltas
+
+
+def get_status_summary():
+    """
+    Количество задач по каждому статусу и общее количество.
+
+    Читает не более len(Task.STATUS_CHOICES) строк TaskStatusCounter,
+    время ответа не зависит от количества задач.
+    """
+    counts = dict(TaskStatusCounter.objects.values_list("status", "count"))
+    summary = {status: counts.get(status, 0) for status, _ in Task.STATUS_CHOICES}
+    summary["total"] = sum(summary.values())
+    return summary
+
+
+def reconcile_status_counters():
+    """
+    Пересчитывает счетчики одним GROUP BY по задачам.
+
+    Строки счетчиков блокируются до подсчета: записи, изменившие счетчик
+    раньше, успевают зафиксироваться и попадают в подсчет, а более поздние
+    применят свои приращения уже после пересчета.
+
+    Returns:
+        dict: Расхождение по статусам (фактическое количество минус счетчик),
+            только для статусов, где счетчик был неверным
+    """
+    with transaction.atomic():
+        stored = dict(
+            TaskStatusCounter.objects.select_for_update()
+            .order_by("status")
+            .values_list("status", "count")
+        )
+        actual = dict(
+            Task.objects.order_by()
+            .values_list("status")
+            .annotate(total=Count("pk"))
+            .values_list("status", "total")
+        )
+        drift = {}
+        for status in {status for status, _ in Task.STATUS_CHOICES} | actual.keys():
+            count = actual.get(status, 0)
+            if stored.get(status) != count:
+                drift[status] = count - stored.get(status, 0)
+                TaskStatusCounter.objects.update_or_create(
+                    status=status, defaults={"count": count}
+                )
+    return drift
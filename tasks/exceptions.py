@@ -0,0 +1,26 @@
+from rest_framework import status
+from rest_framework.exceptions import APIException
+
+
+class TaskVersionConflict(APIException):
+    """Задача была изменена параллельным запросом между чтением и записью."""
+
+    status_code = status.HTTP_409_CONFLICT
+    default_detail = "Задача была изменена другим запросом, повторите обновление."
+    default_code = "version_conflict"
+
+
+class TaskPreconditionFailed(APIException):
+    """Версия задачи не совпадает с переданной в If-Match."""
+
+    status_code = status.HTTP_412_PRECONDITION_FAILED
+    default_detail = "Версия задачи не совпадает с If-Match."
+    default_code = "precondition_failed"
+
+
+class TaskIdempotencyKeyReused(APIException):
+    """Idempotency-Key уже использован с другим методом или телом запроса."""
+
+    status_code = status.HTTP_422_UNPROCESSABLE_ENTITY
+    default_detail = "Idempotency-Key уже использован для другого запроса."
+    default_code = "idempotency_key_reused"
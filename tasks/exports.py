@@ -0,0 +1,100 @@
+import csv
+import json
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+
+from tasks.serializers import TASK_FIELDS, task_to_representation
+
+EXPORT_FORMATS = {
+    "ndjson": "application/x-ndjson; charset=utf-8",
+    "csv": "text/csv; charset=utf-8",
+}
+
+
+class Echo:
+    """Псевдобуфер для csv.writer: возвращает записанную строку вместо хранения."""
+
+    def write(self, value):
+        return value
+
+
+def get_export_chunk_size():
+    """Размер пачки строк, читаемых серверным курсором за один раз."""
+    return getattr(settings, "TASKS_EXPORT_CHUNK_SIZE", 2000)
+
+
+def iter_task_rows(queryset):
+    """
+    Построчно читает задачи серверным курсором.
+
+    .iterator(chunk_size=...) не кэширует результаты QuerySet, поэтому
+    потребление памяти не зависит от размера таблицы.
+    """
+    return queryset.values(*TASK_FIELDS).iterator(chunk_size=get_export_chunk_size())
+
+
+def iter_chunks(lines):
+    """Объединяет строки в пачки, чтобы не отдавать каждую строку отдельным чанком."""
+    chunk = []
+    chunk_size = get_export_chunk_size()
+    for line in lines:
+        chunk.append(line)
+        if len(chunk) >= chunk_size:
+            yield "".join(chunk)
+            chunk = []
+    if chunk:
+        yield "".join(chunk)
+
+
+def iter_ndjson(queryset):
+    """Задачи в формате NDJSON: один JSON-объект на строку."""
+    for row in iter_task_rows(queryset):
+        yield json.dumps(
+            task_to_representation(row), ensure_ascii=False, separators=(",", ":")
+        ) + "\n"
+
+
+def iter_csv(queryset):
+    """Задачи в формате CSV с заголовком из имен полей."""
+    writer = csv.writer(Echo())
+    yield writer.writerow(TASK_FIELDS)
+    for row in iter_task_rows(queryset):
+        yield writer.writerow(task_to_representation(row).values())
+
+
+def stream_tasks(queryset, export_format):
+    """Потоковое представление задач в указанном формате."""
+    lines = iter_csv(queryset) if export_format == "csv" else iter_ndjson(queryset)
+    return iter_chunks(lines)
+
+
+async def astream_tasks(queryset, export_format):
+    """
+    Асинхронный вариант stream_tasks для ASGI.
+
+    Синхронный итератор StreamingHttpResponse под ASGI Django читает
+    целиком до отправки первого байта. Здесь каждая пачка читается
+    отдельным sync_to_async в потоке запроса (thread_sensitive), где
+    открыт серверный курсор, и отправляется сразу.
+    """
+    chunks = stream_tasks(queryset, export_format)
+    next_chunk = sync_to_async(next, thread_sensitive=True)
+    try:
+        while (chunk := await next_chunk(chunks, None)) is not None:
+            yield chunk
+    finally:
+        # Курсор закрывается в том же потоке, даже если клиент отключился.
+        await sync_to_async(chunks.close, thread_sensitive=True)()
+
+
+async def aread_file(file, block_size):
+    """
+    Асинхронное чтение файла блоками для FileResponse под ASGI.
+
+    Синхронный итератор FileResponse под ASGI Django тоже читает целиком
+    до отправки; здесь каждый блок читается отдельным sync_to_async.
+    """
+    read = sync_to_async(file.read)
+    while block := await read(block_size):
+        yield block
@@ -0,0 +1,174 @@
+import asyncio
+import time
+from datetime import timedelta
+
+from django.conf import settings
+from django.db.models import Max, Min
+from django.utils import timezone
+from rest_framework.fields import DateTimeField
+
+from tasks.models import Task, TaskChange
+from tasks.serializers import TASK_FIELDS, task_to_representation
+
+CHANGES_DEFAULT_LIMIT = 100
+CHANGES_MAX_LIMIT = 1000
+
+_datetime_field = DateTimeField()
+
+
+class TaskChangesExpired(Exception):
+    """Часть изменений после since уже удалена из журнала (prune_task_changes)."""
+
+    def __init__(self, first):
+        super().__init__(first)
+        self.first = first
+
+
+def get_visible_changes(rows, since, now):
+    """
+    Отбрасывает изменения после пропуска в нумерации seq.
+
+    Номер seq выдается при INSERT, а видимой запись становится при COMMIT,
+    поэтому параллельная транзакция может зафиксировать seq=11 раньше,
+    чем другая - seq=10. Клиент, получивший 11, пропустил бы 10 навсегда.
+    Изменения после пропуска возвращаются, только когда пропуск старше
+    TASKS_CHANGES_GAP_TIMEOUT: тогда он считается номером откаченной
+    транзакции.
+
+    Args:
+        rows (list[dict]): Записи журнала после since в порядке seq
+        since (int): Последний полученный клиентом seq
+        now (datetime): Текущее время
+    """
+    timeout = timedelta(seconds=getattr(settings, "TASKS_CHANGES_GAP_TIMEOUT", 10))
+    visible = []
+    expected = since + 1
+    for row in rows:
+        if row["seq"] != expected and row["changed_at"] > now - timeout:
+            break
+        visible.append(row)
+        expected = row["seq"] + 1
+    return visible
+
+
+async def aget_start_position(first, last, now):
+    """
+    Позиция журнала для клиента без since.
+
+    MAX(seq) для этого не годится: транзакция с меньшим seq может быть
+    еще не зафиксирована, и клиент, начавший с MAX(seq), пропустил бы
+    ее изменение навсегда. По правилу get_visible_changes позиция - seq
+    перед первым пропуском в нумерации, который моложе
+    TASKS_CHANGES_GAP_TIMEOUT. Последняя запись старше таймаута
+    находится обратным проходом по первичному ключу; если она же
+    последняя в журнале, второго запроса нет.
+
+    Args:
+        first (int): Минимальный seq журнала
+        last (int): Максимальный seq журнала
+        now (datetime): Текущее время
+    """
+    timeout = timedelta(seconds=getattr(settings, "TASKS_CHANGES_GAP_TIMEOUT", 10))
+    settled = await (
+        TaskChange.objects.filter(changed_at__lte=now - timeout)
+        .order_by("-seq")
+        .values_list("seq", flat=True)
+        .afirst()
+    )
+    if settled == last:
+        return last
+    if settled is None:
+        settled = first - 1
+    rows = [
+        row
+        async for row in TaskChange.objects.filter(seq__gt=settled)
+        .order_by("seq")
+        .values("seq", "changed_at")
+    ]
+    visible = get_visible_changes(rows, settled, now)
+    return visible[-1]["seq"] if visible else settled
+
+
+async def aget_task_changes(since, limit=CHANGES_DEFAULT_LIMIT):
+    """
+    Изменения задач после since.
+
+    Первый запрос читает минимальный и максимальный seq (по primary key),
+    и если новых изменений нет, на этом все. Иначе читается не более limit
+    записей журнала и текущие данные измененных задач одним запросом
+    по UUID, поэтому стоимость зависит от количества изменений, а не от
+    размера таблицы задач.
+
+    Args:
+        since (int | None): Последний полученный seq; None - только текущая
+            позиция журнала (next) без изменений, см. aget_start_position
+        limit (int): Максимальное количество изменений в ответе
+
+    Returns:
+        dict: changes (seq, action, uuid, changed_at и task - текущие данные
+            задачи или None, если она удалена), next - seq для следующего
+            запроса, has_more - в журнале есть еще изменения
+
+    Raises:
+        TaskChangesExpired: Изменения после since уже удалены из журнала
+    """
+    bounds = await TaskChange.objects.aaggregate(first=Min("seq"), last=Max("seq"))
+    last = bounds["last"] or 0
+    if since is None:
+        if bounds["last"] is not None:
+            last = await aget_start_position(bounds["first"], last, timezone.now())
+        return {"changes": [], "next": last, "has_more": False}
+    if bounds["first"] is not None and since < bounds["first"] - 1:
+        raise TaskChangesExpired(bounds["first"])
+    if since >= last:
+        return {"changes": [], "next": since, "has_more": False}
+
+    rows = [
+        row
+        async for row in TaskChange.objects.filter(seq__gt=since)
+        .order_by("seq")
+        .values("seq", "action", "task_uuid", "changed_at")[:limit]
+    ]
+    rows = get_visible_changes(rows, since, timezone.now())
+    uuids = {row["task_uuid"] for row in rows if row["action"] != "deleted"}
+    tasks = {}
+    if uuids:
+        tasks = {
+            task["uuid"]: task_to_representation(task)
+            async for task in Task.objects.filter(pk__in=uuids).values(*TASK_FIELDS)
+        }
+
+    changes = [
+        {
+            "seq": row["seq"],
+            "action": row["action"],
+            "uuid": str(row["task_uuid"]),
+            "changed_at": _datetime_field.to_representation(row["changed_at"]),
+            "task": tasks.get(row["task_uuid"]),
+        }
+        for row in rows
+    ]
+    next_seq = rows[-1]["seq"] if rows else since
+    return {
+        "changes": changes,
+        "next": next_seq,
+        "has_more": len(rows) == limit and next_seq < last,
+    }
+
+
+async def await_task_changes(since, limit=CHANGES_DEFAULT_LIMIT, wait=0):
+    """
+    Long-poll: ждет изменений после since не дольше wait секунд.
+
+    Пока изменений нет, журнал проверяется одним запросом MIN/MAX(seq)
+    раз в TASKS_CHANGES_POLL_INTERVAL секунд. Под ASGI ожидание
+    не занимает поток.
+    """
+    deadline = time.monotonic() + wait
+    interval = getattr(settings, "TASKS_CHANGES_POLL_INTERVAL", 0.5)
+    while True:
+        result = await aget_task_changes(since, limit)
+        remaining = deadline - time.monotonic()
+        if result["changes"] or since is None or remaining <= 0:
+            return result
+        await asyncio.sleep(min(interval, remaining))
@@ -0,0 +1,103 @@
+from rest_framework.exceptions import ValidationError
+from rest_framework.filters import BaseFilterBackend, OrderingFilter
+
+from tasks.models import Task
+
+
+class TaskFilterBackend(BaseFilterBackend):
+    """
+    Серверная фильтрация списка задач.
+
+    Query Parameters:
+        - status (str): Один или несколько статусов через запятую
+        - exclude_status (str): Исключаемые статусы через запятую
+          (например, exclude_status=completed - открытые задачи)
+        - title_prefix (str): Название начинается с подстроки (с учетом регистра)
+        - title_contains (str): Название содержит подстроку (без учета регистра)
+
+    Каждому фильтру соответствует индекс из миграции 0003_task_filter_indexes.
+    """
+
+    def filter_queryset(self, request, queryset, view):
+        return self.filter_by_params(queryset, request.query_params)
+
+    @classmethod
+    def filter_by_params(cls, queryset, params):
+        """Применяет фильтры из словаря параметров запроса (QueryDict)."""
+        statuses = cls.get_statuses(params, "status")
+        if statuses:
+            queryset = queryset.filter(status__in=statuses)
+
+        excluded_statuses = cls.get_statuses(params, "exclude_status")
+        if excluded_statuses:
+            queryset = queryset.exclude(status__in=excluded_statuses)
+
+        title_prefix = params.get("title_prefix")
+        if title_prefix:
+            queryset = queryset.filter(title__startswith=title_prefix)
+
+        title_contains = params.get("title_contains")
+        if title_contains:
+            queryset = queryset.filter(title__icontains=title_contains)
+
+        return queryset
+
+    @staticmethod
+    def get_statuses(params, name):
+        """Разбирает список статусов из параметра запроса и проверяет значения."""
+        value = params.get(name)
+        if not value:
+            return []
+        statuses = [status.strip() for status in value.split(",") if status.strip()]
+        allowed = dict(Task.STATUS_CHOICES)
+        invalid = [status for status in statuses if status not in allowed]
+        if invalid:
+            raise ValidationError(
+                {name: [f'"{status}" is not a valid choice.' for status in invalid]}
+            )
+        return statuses
+
+
+class TaskOrderingFilter(OrderingFilter):
+    """
+    Сортировка списка задач по параметру ordering.
+
+    Query Parameters:
+        - ordering (str): created_at, title или status, с "-" для
+          сортировки по убыванию (например, ordering=-title)
+
+    Каждому значению соответствует полный порядок с uuid для однозначности:
+    страницы не пропускают и не повторяют задачи с одинаковым значением поля.
+    Направление uuid выбрано так, чтобы порядок совпадал с btree-индексом
+    (миграция 0008_task_ordering_indexes) при прямом или обратном сканировании,
+    и PostgreSQL не сортировал всю таблицу в памяти. В режиме pagination=cursor
+    позиция курсора содержит оба поля порядка (см. TaskCursorPagination),
+    поэтому сортировка по status или title с повторами тоже однозначна.
+    """
+
+    ORDERINGS = {
+        "created_at": ("created_at", "-uuid"),
+        "-created_at": ("-created_at", "uuid"),
+        "title": ("title", "uuid"),
+        "-title": ("-title", "-uuid"),
+        "status": ("status", "uuid"),
+        "-status": ("-status", "-uuid"),
+    }
+    DEFAULT_ORDERING = ORDERINGS["-created_at"]
+
+    ordering_fields = ("created_at", "title", "status")
+
+    def get_ordering(self, request, queryset, view):
+        return self.get_ordering_by_params(request.query_params)
+
+    @classmethod
+    def get_ordering_by_params(cls, params):
+        """Порядок сортировки из словаря параметров запроса (QueryDict)."""
+        value = params.get(cls.ordering_param, "").strip()
+        if not value:
+            return cls.DEFAULT_ORDERING
+        if value not in cls.ORDERINGS:
+            raise ValidationError(
+                {cls.ordering_param: [f'"{value}" is not a valid choice.']}
+            )
+        return cls.ORDERINGS[value]
@@ -0,0 +1,138 @@
+import hashlib
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import IntegrityError, transaction
+from django.utils import timezone
+from rest_framework.exceptions import ValidationError
+from rest_framework.response import Response
+from rest_framework.status import is_success
+
+from tasks.exceptions import TaskIdempotencyKeyReused
+from tasks.models import TaskIdempotencyKey
+
+IDEMPOTENCY_KEY_HEADER = "Idempotency-Key"
+REPLAYED_HEADER = "Idempotent-Replayed"
+
+# Заголовки, которые добавляет не view, а DRF и middleware; при повторе
+# они выставляются заново.
+SKIPPED_HEADERS = {"content-type", "content-length", "vary", "allow"}
+
+
+def get_idempotency_ttl():
+    """Срок хранения ответов по Idempotency-Key."""
+    return timedelta(seconds=getattr(settings, "TASKS_IDEMPOTENCY_TTL", 86400))
+
+
+def get_idempotency_key(request):
+    """
+    Значение заголовка Idempotency-Key.
+
+    Returns:
+        str: Ключ или None, если заголовок не передан
+
+    Raises:
+        ValidationError: Пустой ключ или длиннее 255 символов
+    """
+    key = request.headers.get(IDEMPOTENCY_KEY_HEADER)
+    if key is None:
+        return None
+    key = key.strip()
+    max_length = TaskIdempotencyKey._meta.get_field("key").max_length
+    if not key or len(key) > max_length:
+        raise ValidationError(
+            {
+                IDEMPOTENCY_KEY_HEADER: [
+                    f"Ожидается непустая строка до {max_length} символов."
+                ]
+            }
+        )
+    return key
+
+
+def get_request_fingerprint(request):
+    """SHA-256 метода и тела запроса; тело читается до разбора request.data."""
+    digest = hashlib.sha256(request.method.encode())
+    digest.update(b"\n")
+    digest.update(request.body)
+    return digest.hexdigest()
+
+
+def get_stored_response(key, scope, fingerprint):
+    """
+    Сохраненный ответ на запрос с тем же ключом к тому же пути.
+
+    Просроченная запись удаляется, чтобы ключ можно было использовать снова.
+
+    Returns:
+        Response: Сохраненный ответ с заголовком Idempotent-Replayed
+        или None, если ключ еще не использовался
+
+    Raises:
+        TaskIdempotencyKeyReused: Ключ использован с другим методом или телом
+    """
+    stored = TaskIdempotencyKey.objects.filter(key=key, scope=scope).first()
+    if stored is None:
+        return None
+    if stored.created_at < timezone.now() - get_idempotency_ttl():
+        stored.delete()
+        return None
+    if stored.fingerprint != fingerprint:
+        raise TaskIdempotencyKeyReused()
+    response = Response(
+        stored.response, status=stored.status_code, headers=stored.headers
+    )
+    response[REPLAYED_HEADER] = "true"
+    return response
+
+
+def store_response(key, scope, fingerprint, response):
+    """Сохраняет успешный ответ view в текущей транзакции."""
+    TaskIdempotencyKey.objects.create(
+        key=key,
+        scope=scope,
+        fingerprint=fingerprint,
+        status_code=response.status_code,
+        response=response.data,
+        headers={
+            name: value
+            for name, value in response.items()
+            if name.lower() not in SKIPPED_HEADERS
+        },
+    )
+
+
+class IdempotentViewMixin:
+    """
+    Поддержка заголовка Idempotency-Key для view создания и изменения задач.
+
+    Успешный ответ сохраняется в TaskIdempotencyKey в одной транзакции
+    с записью задачи. Повтор запроса с тем же ключом к тому же пути
+    возвращает сохраненный ответ одним SELECT, без валидации и записи.
+    Если параллельный запрос с тем же ключом успел зафиксироваться первым,
+    INSERT ключа нарушает уникальный индекс, запись задачи откатывается
+    и возвращается ответ первого запроса. Ответы с ошибками не сохраняются:
+    повтор после 400 или 409 выполняется заново.
+    """
+
+    def idempotent(self, handler, request, *args, **kwargs):
+        """Выполняет handler(request, ...) с учетом Idempotency-Key."""
+        key = get_idempotency_key(request)
+        if key is None:
+            return handler(request, *args, **kwargs)
+        scope = request.path
+        fingerprint = get_request_fingerprint(request)
+        replayed = get_stored_response(key, scope, fingerprint)
+        if replayed is not None:
+            return replayed
+        try:
+            with transaction.atomic():
+                response = handler(request, *args, **kwargs)
+                if is_success(response.status_code):
+                    store_response(key, scope, fingerprint, response)
+        except IntegrityError:
+            replayed = get_stored_response(key, scope, fingerprint)
+            if replayed is None:
+                raise
+            return replayed
+        return response
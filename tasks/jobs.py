@@ -0,0 +1,296 @@
+import logging
+import os
+from datetime import timedelta
+from pathlib import Path
+
+from django.conf import settings
+from django.db import close_old_connections, connections, transaction
+from django.db.models import Q
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
+from rest_framework.exceptions import ValidationError
+
+from tasks.changes import defer_task_changes
+from tasks.counters import defer_status_counts
+from tasks.exports import (EXPORT_FORMATS, get_export_chunk_size, iter_csv,
+                           iter_ndjson)
+from tasks.filters import TaskFilterBackend
+from tasks.models import Task, TaskJob
+from tasks.serializers import TaskSerializer
+
+logger = logging.getLogger(__name__)
+
+# Параметры фильтра, которые принимают задания (как у списка и выгрузки).
+FILTER_PARAMS = ("status", "exclude_status", "title_prefix", "title_contains")
+
+
+def get_batch_size():
+    """Количество задач, обрабатываемых заданием в одной транзакции."""
+    return getattr(settings, "TASKS_BULK_BATCH_SIZE", 1000)
+
+
+def get_jobs_timeout():
+    """Время без heartbeat, после которого задание считается прерванным."""
+    return timedelta(seconds=getattr(settings, "TASKS_JOBS_TIMEOUT", 600))
+
+
+def get_export_dir():
+    """Каталог файлов выгрузки, создаваемых заданиями export."""
+    return Path(getattr(settings, "TASKS_JOBS_EXPORT_DIR", "exports"))
+
+
+def get_export_path(job):
+    """Путь к файлу выгрузки задания."""
+    return get_export_dir() / f"tasks-{job.pk}.{job.params['export_format']}"
+
+
+def clean_filters(params):
+    """Проверяет фильтры задания так же, как фильтры списка задач."""
+    filters = params.get("filters", {})
+    if not isinstance(filters, dict) or set(filters).difference(FILTER_PARAMS):
+        raise ValidationError(
+            {"filters": [f"Допустимые фильтры: {', '.join(FILTER_PARAMS)}."]}
+        )
+    filters = {name: str(value) for name, value in filters.items()}
+    TaskFilterBackend.filter_by_params(Task.objects.none(), filters)
+    return filters
+
+
+def clean_bulk_status(params):
+    """Параметры bulk_status: новый статус status и фильтры filters."""
+    status = params.get("status")
+    if status not in dict(Task.STATUS_CHOICES):
+        raise ValidationError({"status": [f'"{status}" is not a valid choice.']})
+    return {"status": status, "filters": clean_filters(params)}
+
+
+def clean_export(params):
+    """Параметры export: формат export_format (ndjson или csv) и фильтры filters."""
+    export_format = params.get("export_format", "ndjson")
+    if export_format not in EXPORT_FORMATS:
+        raise ValidationError(
+            {"export_format": [f'"{export_format}" is not a valid choice.']}
+        )
+    return {"export_format": export_format, "filters": clean_filters(params)}
+
+
+def clean_purge_completed(params):
+    """Параметры purge_completed: необязательная граница before по updated_at."""
+    before = params.get("before")
+    if before is not None:
+        parsed = parse_datetime(str(before))
+        if parsed is None:
+            raise ValidationError({"before": ["Ожидается дата и время в ISO 8601."]})
+        before = parsed.isoformat()
+    return {"before": before}
+
+
+def clean_job_params(kind, params):
+    """
+    Проверяет и нормализует параметры задания до постановки в очередь.
+
+    Raises:
+        ValidationError: Ошибки по параметрам в ключе params
+    """
+    if not isinstance(params, dict):
+        raise ValidationError({"params": ["Ожидается объект."]})
+    try:
+        return JOB_KINDS[kind][0](params)
+    except ValidationError as error:
+        raise ValidationError({"params": error.detail})
+
+
+def report_progress(job, progress):
+    """Сохраняет прогресс и heartbeat задания отдельным UPDATE."""
+    job.progress = progress
+    job.heartbeat_at = timezone.now()
+    TaskJob.objects.filter(pk=job.pk).update(
+        progress=job.progress, heartbeat_at=job.heartbeat_at
+    )
+
+
+def run_bulk_status(job):
+    """
+    Смена статуса задач, подходящих под фильтры.
+
+    Задачи обрабатываются пачками по TASKS_BULK_BATCH_SIZE в порядке uuid,
+    каждая пачка - отдельная короткая транзакция через TaskListSerializer
+    (bulk_update, счетчики, журнал изменений, сброс кэша), поэтому строки
+    не блокируются на все время задания. Как и пакетное обновление,
+    версии задач не проверяются.
+    """
+    status = job.params["status"]
+    queryset = TaskFilterBackend.filter_by_params(
+        Task.objects.exclude(status=status), job.params["filters"]
+    ).order_by("uuid")
+    updated = 0
+    last = None
+    while True:
+        batch = queryset if last is None else queryset.filter(uuid__gt=last)
+        tasks = list(batch[: get_batch_size()])
+        if not tasks:
+            break
+        serializer = TaskSerializer(
+            tasks, data=[{"status": status}] * len(tasks), many=True, partial=True
+        )
+        serializer.is_valid(raise_exception=True)
+        with transaction.atomic():
+            serializer.save()
+        updated += len(tasks)
+        last = tasks[-1].pk
+        report_progress(job, updated)
+    return {"updated": updated}
+
+
+def run_export(job):
+    """
+    Выгрузка задач в файл TASKS_JOBS_EXPORT_DIR/tasks-<uuid>.<формат>.
+
+    Строки читаются серверным курсором, как в потоковой выгрузке export/.
+    Файл пишется под временным именем и переименовывается после записи,
+    поэтому endpoint скачивания не отдает недописанный файл.
+    """
+    export_format = job.params["export_format"]
+    queryset = TaskFilterBackend.filter_by_params(
+        Task.objects.order_by("-created_at", "uuid"), job.params["filters"]
+    )
+    lines = iter_csv(queryset) if export_format == "csv" else iter_ndjson(queryset)
+    path = get_export_path(job)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    partial = path.with_name(path.name + ".part")
+    rows = 0
+    try:
+        with open(partial, "w", encoding="utf-8", newline="") as file:
+            if export_format == "csv":
+                file.write(next(lines))
+            for line in lines:
+                file.write(line)
+                rows += 1
+                if rows % get_export_chunk_size() == 0:
+                    report_progress(job, rows)
+    except BaseException:
+        partial.unlink(missing_ok=True)
+        raise
+    os.replace(partial, path)
+    report_progress(job, rows)
+    return {"export_format": export_format, "rows": rows, "size": path.stat().st_size}
+
+
+def run_purge_completed(job):
+    """
+    Удаление завершенных задач, измененных до before (или всех завершенных).
+
+    Задачи удаляются пачками по TASKS_BULK_BATCH_SIZE, каждая пачка - одна
+    транзакция с одним обновлением счетчиков и одной записью в журнал,
+    как в пакетном удалении.
+    """
+    queryset = Task.objects.filter(status="completed")
+    if job.params["before"]:
+        queryset = queryset.filter(updated_at__lt=job.params["before"])
+    deleted = 0
+    while True:
+        pks = list(queryset.values_list("pk", flat=True)[: get_batch_size()])
+        if not pks:
+            break
+        with transaction.atomic(), defer_status_counts(), defer_task_changes():
+            count, _ = queryset.filter(pk__in=pks).delete()
+        deleted += count
+        report_progress(job, deleted)
+    return {"deleted": deleted}
+
+
+# Тип задания: (проверка параметров, выполнение).
+JOB_KINDS = {
+    "bulk_status": (clean_bulk_status, run_bulk_status),
+    "export": (clean_export, run_export),
+    "purge_completed": (clean_purge_completed, run_purge_completed),
+}
+
+
+def enqueue_job(kind, params):
+    """Ставит задание в очередь после проверки параметров."""
+    return TaskJob.objects.create(kind=kind, params=clean_job_params(kind, params))
+
+
+def claim_job():
+    """
+    Забирает из очереди самое старое задание.
+
+    SELECT ... FOR UPDATE SKIP LOCKED пропускает задания, которые в этот
+    момент забирают другие воркеры, а блокировка держится только до
+    отметки running. Задания running без heartbeat дольше TASKS_JOBS_TIMEOUT
+    (воркер остановлен во время выполнения) забираются повторно, после
+    TASKS_JOBS_MAX_ATTEMPTS запусков они завершаются с ошибкой.
+
+    Returns:
+        TaskJob: Задание в состоянии running или None, если очередь пуста
+    """
+    max_attempts = getattr(settings, "TASKS_JOBS_MAX_ATTEMPTS", 3)
+    while True:
+        now = timezone.now()
+        with transaction.atomic():
+            job = (
+                TaskJob.objects.select_for_update(skip_locked=True)
+                .filter(
+                    Q(status="queued")
+                    | Q(status="running", heartbeat_at__lt=now - get_jobs_timeout())
+                )
+                .order_by("created_at")
+                .first()
+            )
+            if job is None:
+                return None
+            if job.attempts >= max_attempts:
+                job.status = "failed"
+                job.error = f"Задание прервано {job.attempts} раз."
+                job.finished_at = now
+                job.save(update_fields=["status", "error", "finished_at"])
+                continue
+            job.status = "running"
+            job.attempts += 1
+            job.started_at = job.heartbeat_at = now
+            job.save(update_fields=["status", "attempts", "started_at", "heartbeat_at"])
+        return job
+
+
+def run_job(job):
+    """Выполняет задание и сохраняет результат или ошибку."""
+    try:
+        result = JOB_KINDS[job.kind][1](job)
+    except Exception as error:
+        logger.exception("Ошибка выполнения задания %s", job.pk)
+        job.status = "failed"
+        job.error = str(error) or type(error).__name__
+    else:
+        job.status = "succeeded"
+        job.result = result
+    job.finished_at = timezone.now()
+    job.save(update_fields=["status", "result", "error", "finished_at"])
+    return job
+
+
+def work(stop, poll_interval):
+    """
+    Цикл воркера: забирает и выполняет задания до установки stop.
+
+    Args:
+        stop (threading.Event | multiprocessing.Event): Сигнал остановки;
+            текущее задание дорабатывается до конца
+        poll_interval (float): Пауза в секундах, если очередь пуста
+    """
+    while not stop.is_set():
+        close_old_connections()
+        try:
+            job = claim_job()
+            if job is not None:
+                logger.info("Задание %s (%s) запущено", job.pk, job.kind)
+                run_job(job)
+                logger.info("Задание %s (%s): %s", job.pk, job.kind, job.status)
+        except Exception:
+            # Ошибка базы данных: задание running будет забрано повторно
+            # после TASKS_JOBS_TIMEOUT.
+            logger.exception("Ошибка обработки очереди заданий")
+            job = None
+        if job is None:
+            stop.wait(poll_interval)
+    connections.close_all()
@@ -0,0 +1,287 @@
+import csv
+import io
+import json
+import sys
+import time
+from datetime import timedelta
+from pathlib import Path
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+from django.utils import timezone
+
+from tasks.changes import record_task_changes
+from tasks.counters import reconcile_status_counters
+from tasks.models import Task
+from tasks.serializers import TaskSerializer
+from tasks.utils import parse_uuid
+
+COPY_COLUMNS = (
+    "uuid",
+    "title",
+    "description",
+    "status",
+    "created_at",
+    "updated_at",
+    "version",
+)
+
+# Временная таблица пачки для COPY (см. Command.copy_batch).
+COPY_STAGING_TABLE = "tasks_task_import"
+
+
+class Command(BaseCommand):
+    """
+    Потоковый импорт задач из NDJSON или CSV.
+
+    Файл читается построчно, строки валидируются пачками через TaskSerializer
+    и записываются bulk_create (или COPY FROM через временную таблицу
+    на PostgreSQL). После каждой
+    зафиксированной пачки номер строки сохраняется в файл контрольной точки,
+    поэтому после сбоя импорт продолжается с места остановки.
+
+    bulk_create с ignore_conflicts и INSERT ... ON CONFLICT DO NOTHING после
+    COPY не сообщают, сколько строк
+    действительно добавлено, поэтому счетчики по статусам пересчитываются
+    один раз в конце импорта, а в журнал изменений каждая пачка попадает
+    целиком как created (повторно импортированные строки тоже).
+
+    Usage:
+        python manage.py import_tasks tasks.ndjson --batch-size 5000
+        python manage.py import_tasks tasks.csv --copy --checkpoint tasks.csv.progress
+    """
+
+    help = "Потоковый импорт задач из NDJSON/CSV пачками через bulk_create или COPY"
+
+    # created_at последней строки, записанной COPY (см. copy_batch).
+    last_created_at = None
+
+    def add_arguments(self, parser):
+        parser.add_argument("path", help="Путь к файлу или '-' для stdin")
+        parser.add_argument(
+            "--format",
+            choices=("ndjson", "csv"),
+            help="Формат файла (по умолчанию определяется по расширению)",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=1000,
+            help="Количество строк в одной пачке и транзакции",
+        )
+        parser.add_argument(
+            "--checkpoint",
+            help="Файл контрольной точки (по умолчанию <path>.progress)",
+        )
+        parser.add_argument(
+            "--copy",
+            action="store_true",
+            help="Запись через COPY FROM STDIN (только PostgreSQL)",
+        )
+        parser.add_argument(
+            "--skip-invalid",
+            action="store_true",
+            help="Пропускать невалидные строки вместо остановки импорта",
+        )
+
+    def handle(self, *args, **options):
+        path = options["path"]
+        batch_size = options["batch_size"]
+        if batch_size < 1:
+            raise CommandError("--batch-size должен быть положительным.")
+        if options["copy"] and connection.vendor != "postgresql":
+            raise CommandError("--copy поддерживается только на PostgreSQL.")
+
+        export_format = options["format"] or (
+            "csv" if path.lower().endswith(".csv") else "ndjson"
+        )
+        checkpoint = None
+        if options["checkpoint"] or path != "-":
+            checkpoint = Path(options["checkpoint"] or f"{path}.progress")
+        skip = int(checkpoint.read_text()) if checkpoint and checkpoint.exists() else 0
+        if skip:
+            self.stdout.write(f"Продолжение импорта со строки {skip + 1}")
+
+        write_batch = self.copy_batch if options["copy"] else self.insert_batch
+        processed = skip
+        imported = 0
+        skipped = 0
+        started = time.monotonic()
+
+        with self.open_source(path) as source:
+            rows = self.read_rows(source, export_format)
+            for batch in self.iter_batches(rows, batch_size, skip):
+                batch_started = time.monotonic()
+                tasks, errors = self.validate_batch(batch)
+                if errors and not options["skip_invalid"]:
+                    raise CommandError(self.format_errors(errors))
+
+                with transaction.atomic():
+                    write_batch(tasks)
+                    record_task_changes("created", [task.pk for task in tasks])
+                processed += len(batch)
+                imported += len(tasks)
+                skipped += len(errors)
+                if checkpoint:
+                    checkpoint.write_text(str(processed))
+
+                elapsed = time.monotonic() - batch_started
+                self.stdout.write(
+                    f"Строк обработано: {processed}, пачка {len(tasks)} "
+                    f"({len(tasks) / elapsed if elapsed else 0:.0f} строк/с)"
+                )
+
+        if imported:
+            reconcile_status_counters()
+        elapsed = time.monotonic() - started
+        if checkpoint and checkpoint.exists():
+            checkpoint.unlink()
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Импортировано {imported} задач, пропущено {skipped} "
+                f"за {elapsed:.1f} с ({imported / elapsed if elapsed else 0:.0f} строк/с)"
+            )
+        )
+
+    @staticmethod
+    def open_source(path):
+        """Открывает файл или stdin для чтения."""
+        if path == "-":
+            return io.TextIOWrapper(sys.stdin.buffer, encoding="utf-8")
+        try:
+            return open(path, encoding="utf-8", newline="")
+        except OSError as error:
+            raise CommandError(f"Не удалось открыть файл {path}: {error}")
+
+    @staticmethod
+    def read_rows(source, export_format):
+        """Построчно читает задачи из NDJSON или CSV, не загружая файл целиком."""
+        if export_format == "csv":
+            for row in csv.DictReader(source):
+                yield {key: value for key, value in row.items() if value != ""}
+            return
+        for line_number, line in enumerate(source, start=1):
+            if not line.strip():
+                continue
+            try:
+                yield json.loads(line)
+            except json.JSONDecodeError as error:
+                raise CommandError(f"Строка {line_number}: некорректный JSON ({error})")
+
+    @staticmethod
+    def iter_batches(rows, batch_size, skip):
+        """Делит строки на пачки, пропуская уже импортированные."""
+        batch = []
+        for index, row in enumerate(rows):
+            if index < skip:
+                continue
+            batch.append((index + 1, row))
+            if len(batch) >= batch_size:
+                yield batch
+                batch = []
+        if batch:
+            yield batch
+
+    @staticmethod
+    def validate_batch(batch):
+        """
+        Валидирует пачку строк одним списочным TaskSerializer.
+
+        UUID из файла сохраняется, чтобы повторный импорт тех же строк
+        не создавал дубликаты.
+
+        Returns:
+            tuple: список Task и список (номер строки, ошибки)
+        """
+        rows = [row for _, row in batch]
+        serializer = TaskSerializer(data=rows, many=True)
+        if serializer.is_valid():
+            results = [(attrs, None) for attrs in serializer.validated_data]
+        else:
+            # При ошибках списочный сериализатор не возвращает validated_data,
+            # поэтому валидные строки пачки валидируются повторно по одной.
+            results = []
+            for row, error in zip(rows, serializer.errors):
+                if error:
+                    results.append((None, error))
+                    continue
+                child = TaskSerializer(data=row)
+                child.is_valid()
+                results.append((child.validated_data, None))
+
+        tasks, errors = [], []
+        now = timezone.now()
+        for (line_number, row), (attrs, error) in zip(batch, results):
+            if error:
+                errors.append((line_number, error))
+                continue
+            task = Task(**attrs, created_at=now, updated_at=now)
+            pk = parse_uuid(row.get("uuid")) if isinstance(row, dict) else None
+            if pk is not None:
+                task.uuid = pk
+            tasks.append(task)
+        return tasks, errors
+
+    @staticmethod
+    def format_errors(errors):
+        """Сообщение об ошибках валидации с номерами строк."""
+        lines = [f"Строка {line_number}: {error}" for line_number, error in errors]
+        return "Невалидные строки, импорт остановлен:\n" + "\n".join(lines)
+
+    @staticmethod
+    def insert_batch(tasks):
+        """Запись пачки одним bulk_create; существующие UUID пропускаются."""
+        Task.objects.bulk_create(tasks, ignore_conflicts=True)
+
+    def copy_batch(self, tasks):
+        """
+        Запись пачки через COPY FROM STDIN во временную таблицу и INSERT в задачи.
+
+        COPY не умеет пропускать конфликты, поэтому строки сначала копируются
+        во временную таблицу (удаляется при фиксации транзакции пачки), а в
+        таблицу задач переносятся INSERT ... SELECT ... ON CONFLICT DO NOTHING:
+        повторный импорт после сбоя пропускает уже записанные UUID, как
+        bulk_create с ignore_conflicts.
+
+        COPY не вызывает auto_now_add, поэтому created_at проставляется здесь:
+        строки получают возрастающее время с шагом в микросекунду в порядке
+        файла, а не одно время на пачку.
+        """
+        start = timezone.now()
+        if self.last_created_at is not None:
+            start = max(start, self.last_created_at + timedelta(microseconds=1))
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        for offset, task in enumerate(tasks):
+            task.created_at = task.updated_at = start + timedelta(microseconds=offset)
+            writer.writerow(
+                [
+                    task.uuid,
+                    task.title,
+                    "\\N" if task.description is None else task.description,
+                    task.status,
+                    task.created_at.isoformat(),
+                    task.updated_at.isoformat(),
+                    task.version,
+                ]
+            )
+        if tasks:
+            self.last_created_at = tasks[-1].created_at
+        buffer.seek(0)
+        columns = ", ".join(COPY_COLUMNS)
+        table = Task._meta.db_table
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"CREATE TEMPORARY TABLE {COPY_STAGING_TABLE} "
+                f"(LIKE {table} INCLUDING DEFAULTS) ON COMMIT DROP"
+            )
+            cursor.copy_expert(
+                f"COPY {COPY_STAGING_TABLE} ({columns}) "
+                "FROM STDIN WITH (FORMAT csv, NULL '\\N')",
+                buffer,
+            )
+            cursor.execute(
+                f"INSERT INTO {table} ({columns}) "
+                f"SELECT {columns} FROM {COPY_STAGING_TABLE} "
+                "ON CONFLICT DO NOTHING"
+            )
@@ -0,0 +1,26 @@
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+from tasks.idempotency import get_idempotency_ttl
+from tasks.models import TaskIdempotencyKey
+
+
+class Command(BaseCommand):
+    """
+    Удаление просроченных ключей идемпотентности.
+
+    Просроченные ключи уже не используются при повторе запросов
+    (TASKS_IDEMPOTENCY_TTL), команда только освобождает место в таблице.
+    Команду можно запускать по расписанию.
+
+    Usage:
+        python manage.py prune_idempotency_keys
+    """
+
+    help = "Удаление ключей идемпотентности (TaskIdempotencyKey) старше TASKS_IDEMPOTENCY_TTL"
+
+    def handle(self, *args, **options):
+        deleted, _ = TaskIdempotencyKey.objects.filter(
+            created_at__lt=timezone.now() - get_idempotency_ttl()
+        ).delete()
+        self.stdout.write(self.style.SUCCESS(f"Удалено ключей: {deleted}"))
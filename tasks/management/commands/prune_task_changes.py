@@ -0,0 +1,38 @@
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.utils import timezone
+
+from tasks.changes import prune_task_changes
+
+
+class Command(BaseCommand):
+    """
+    Удаление старых записей журнала изменений задач.
+
+    Клиенты, чей since старше первой оставшейся записи, получат
+    410 Gone и выполнят полную синхронизацию, поэтому срок хранения
+    должен быть больше максимального перерыва в синхронизации клиентов.
+    Команду можно запускать по расписанию.
+
+    Usage:
+        python manage.py prune_task_changes
+        python manage.py prune_task_changes --days 30
+    """
+
+    help = "Удаление записей журнала изменений задач (TaskChange) старше срока хранения"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--days",
+            type=int,
+            default=getattr(settings, "TASKS_CHANGES_RETENTION_DAYS", 7),
+            help="Срок хранения записей в днях (по умолчанию TASKS_CHANGES_RETENTION_DAYS)",
+        )
+
+    def handle(self, *args, **options):
+        if options["days"] < 0:
+            raise CommandError("--days не может быть отрицательным.")
+        deleted = prune_task_changes(timezone.now() - timedelta(days=options["days"]))
+        self.stdout.write(self.style.SUCCESS(f"Удалено записей журнала: {deleted}"))
@@ -0,0 +1,29 @@
+from django.core.management.base import BaseCommand
+
+from tasks.counters import get_status_summary, reconcile_status_counters
+
+
+class Command(BaseCommand):
+    """
+    Пересчет счетчиков задач по статусам.
+
+    Счетчики TaskStatusCounter обновляются инкрементально и могут разойтись
+    с таблицей задач после записей в обход моделей (update(), raw SQL,
+    ручные правки). Команда пересчитывает их одним GROUP BY и выводит
+    найденные расхождения; ее можно запускать по расписанию.
+
+    Usage:
+        python manage.py reconcile_task_counters
+    """
+
+    help = "Пересчет счетчиков задач по статусам (TaskStatusCounter)"
+
+    def handle(self, *args, **options):
+        drift = reconcile_status_counters()
+        for status, delta in sorted(drift.items()):
+            self.stdout.write(f"Статус {status}: расхождение {delta:+d}")
+        summary = ", ".join(
+            f"{status}={count}" for status, count in get_status_summary().items()
+        )
+        message = "Счетчики исправлены" if drift else "Расхождений нет"
+        self.stdout.write(self.style.SUCCESS(f"{message}: {summary}"))
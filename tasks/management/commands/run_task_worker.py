@@ -0,0 +1,113 @@
+import multiprocessing
+import signal
+import threading
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connections
+
+from tasks.jobs import claim_job, run_job, work
+
+POOLS = {
+    "thread": (threading.Thread, threading.Event),
+    "process": (multiprocessing.Process, multiprocessing.Event),
+}
+
+
+def work_in_process(stop, poll_interval):
+    """Цикл воркера в дочернем процессе: остановкой управляет родитель."""
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    signal.signal(signal.SIGTERM, signal.SIG_IGN)
+    work(stop, poll_interval)
+
+
+class Command(BaseCommand):
+    """
+    Воркер фоновых заданий (TaskJob).
+
+    Запускает --concurrency потоков или процессов, каждый из которых
+    забирает задания из очереди в базе данных и выполняет их. Потоки
+    подходят для заданий, которые в основном ждут базу данных; процессы -
+    если задания упираются в CPU (сериализация выгрузки). Воркеры можно
+    запускать на нескольких узлах: задания распределяются через
+    SELECT ... FOR UPDATE SKIP LOCKED. По SIGINT/SIGTERM воркер
+    дорабатывает текущие задания и завершается.
+
+    Usage:
+        python manage.py run_task_worker
+        python manage.py run_task_worker --concurrency 4 --pool process
+        python manage.py run_task_worker --once
+    """
+
+    help = "Выполнение фоновых заданий над задачами из очереди TaskJob"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--concurrency",
+            type=int,
+            default=getattr(settings, "TASKS_JOBS_CONCURRENCY", 2),
+            help="Количество параллельных воркеров (по умолчанию TASKS_JOBS_CONCURRENCY)",
+        )
+        parser.add_argument(
+            "--pool",
+            choices=sorted(POOLS),
+            default=getattr(settings, "TASKS_JOBS_POOL", "thread"),
+            help="Потоки или процессы (по умолчанию TASKS_JOBS_POOL)",
+        )
+        parser.add_argument(
+            "--poll-interval",
+            type=float,
+            default=getattr(settings, "TASKS_JOBS_POLL_INTERVAL", 1.0),
+            help="Пауза в секундах при пустой очереди (по умолчанию TASKS_JOBS_POLL_INTERVAL)",
+        )
+        parser.add_argument(
+            "--once",
+            action="store_true",
+            help="Выполнить задания, уже стоящие в очереди, и завершиться",
+        )
+
+    def handle(self, *args, **options):
+        if options["concurrency"] < 1:
+            raise CommandError("--concurrency должен быть не меньше 1.")
+        if options["poll_interval"] <= 0:
+            raise CommandError("--poll-interval должен быть больше 0.")
+        if options["once"]:
+            self.run_once()
+            return
+
+        worker_class, event_class = POOLS[options["pool"]]
+        target = work_in_process if options["pool"] == "process" else work
+        stop = event_class()
+
+        def shutdown(signum, frame):
+            stop.set()
+
+        signal.signal(signal.SIGINT, shutdown)
+        signal.signal(signal.SIGTERM, shutdown)
+        # Дочерние процессы не должны наследовать открытые соединения.
+        connections.close_all()
+        workers = [
+            worker_class(target=target, args=(stop, options["poll_interval"]))
+            for _ in range(options["concurrency"])
+        ]
+        for worker in workers:
+            worker.start()
+        self.stdout.write(
+            f"Воркер заданий запущен: {options['concurrency']} ({options['pool']})"
+        )
+        for worker in workers:
+            while worker.is_alive():
+                worker.join(1)
+        self.stdout.write(self.style.SUCCESS("Воркер заданий остановлен"))
+
+    def run_once(self):
+        """Выполняет задания по очереди в текущем процессе, пока очередь не пуста."""
+        processed = 0
+        while True:
+            job = claim_job()
+            if job is None:
+                break
+            run_job(job)
+            processed += 1
+            self.stdout.write(f"Задание {job.pk} ({job.kind}): {job.status}")
+        self.stdout.write(self.style.SUCCESS(f"Выполнено заданий: {processed}"))
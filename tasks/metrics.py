@@ -0,0 +1,346 @@
+import atexit
+import json
+import os
+import threading
+import time
+from contextvars import ContextVar
+from pathlib import Path
+from threading import Lock
+
+from django.conf import settings
+from django.db import connections
+from django.db.backends.signals import connection_created
+
+# Границы корзин гистограммы длительности запроса, в секундах.
+DURATION_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0)
+
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+_current = ContextVar("task_request_metrics", default=None)
+_metrics_lock = Lock()
+_metrics = {}
+
+# Файл агрегатов процесса в TASKS_METRICS_DIR ((pid, каталог), путь), признак
+# того, что агрегаты изменились после последней записи, и поток записи.
+_flush_lock = Lock()
+_flush_state = {"file": None, "dirty": False, "flusher": None}
+
+
+class RequestMetrics:
+    """Счетчики одного запроса: SQL-запросы, время в базе данных и рендеринг."""
+
+    __slots__ = ("started", "queries", "db_time", "render_started", "render_time")
+
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.queries = 0
+        self.db_time = 0.0
+        self.render_started = None
+        self.render_time = 0.0
+
+
+def is_metrics_enabled():
+    """Включен ли сбор метрик (настройка TASKS_METRICS_ENABLED)."""
+    return getattr(settings, "TASKS_METRICS_ENABLED", False)
+
+
+def get_metrics_dir():
+    """
+    Общий каталог агрегатов процессов (настройка TASKS_METRICS_DIR).
+
+    Returns:
+        Path: Каталог или None, если метрики хранятся только в памяти процесса
+    """
+    path = getattr(settings, "TASKS_METRICS_DIR", None)
+    return Path(path) if path else None
+
+
+def record_query(execute, sql, params, many, context):
+    """
+    execute_wrapper, учитывающий SQL-запросы текущего запроса.
+
+    Вне запроса с метриками (команды, миграции) только вызывает execute.
+    """
+    metrics = _current.get()
+    if metrics is None:
+        return execute(sql, params, many, context)
+    started = time.perf_counter()
+    try:
+        return execute(sql, params, many, context)
+    finally:
+        metrics.queries += 1
+        metrics.db_time += time.perf_counter() - started
+
+
+def install_query_wrapper(connection=None, **kwargs):
+    """
+    Подключает record_query к соединению с базой данных.
+
+    Вызывается для уже открытых соединений и обработчиком сигнала
+    connection_created для новых, поэтому обертка действует и в потоках
+    sync_to_async: текущий запрос определяется через ContextVar.
+    """
+    targets = [connection] if connection else connections.all(initialized_only=True)
+    for target in targets:
+        if record_query not in target.execute_wrappers:
+            target.execute_wrappers.append(record_query)
+
+
+def enable_query_metrics():
+    """Включает учет SQL-запросов для всех соединений процесса."""
+    connection_created.connect(install_query_wrapper, dispatch_uid="task_metrics")
+    install_query_wrapper()
+
+
+def start_request():
+    """Начинает сбор метрик запроса, возвращает (метрики, токен ContextVar)."""
+    metrics = RequestMetrics()
+    return metrics, _current.set(metrics)
+
+
+def start_render(metrics):
+    """Отмечает начало рендеринга ответа (сериализации тела)."""
+    metrics.render_started = time.perf_counter()
+
+
+def finish_render(metrics):
+    """Отмечает окончание рендеринга ответа."""
+    if metrics.render_started is not None:
+        metrics.render_time += time.perf_counter() - metrics.render_started
+        metrics.render_started = None
+
+
+def finish_request(metrics, token, view, method):
+    """
+    Завершает сбор метрик запроса и добавляет их в агрегаты процесса.
+
+    Returns:
+        float: Полная длительность запроса в секундах
+    """
+    _current.reset(token)
+    total = time.perf_counter() - metrics.started
+    bucket = next(
+        (i for i, bound in enumerate(DURATION_BUCKETS) if total <= bound),
+        len(DURATION_BUCKETS),
+    )
+    with _metrics_lock:
+        stats = _metrics.get((view, method))
+        if stats is None:
+            stats = _metrics[(view, method)] = {
+                "requests": 0,
+                "duration": 0.0,
+                "queries": 0,
+                "db_time": 0.0,
+                "render_time": 0.0,
+                "buckets": [0] * (len(DURATION_BUCKETS) + 1),
+            }
+        stats["requests"] += 1
+        stats["duration"] += total
+        stats["queries"] += metrics.queries
+        stats["db_time"] += metrics.db_time
+        stats["render_time"] += metrics.render_time
+        stats["buckets"][bucket] += 1
+        _flush_state["dirty"] = True
+    if get_metrics_dir() is not None:
+        start_flusher()
+    return total
+
+
+def get_snapshot():
+    """Копия агрегатов процесса."""
+    with _metrics_lock:
+        return {
+            key: {**stats, "buckets": list(stats["buckets"])}
+            for key, stats in _metrics.items()
+        }
+
+
+def flush_metrics():
+    """
+    Записывает агрегаты процесса в файл <pid>-<время запуска>.json в TASKS_METRICS_DIR.
+
+    Файл пишется под временным именем и переименовывается, поэтому
+    читающий процесс не видит недописанный файл. Файлы завершившихся
+    процессов (перезапуск по max_requests) остаются, и счетчики
+    не уменьшаются; каталог очищается при запуске gunicorn.
+    """
+    directory = get_metrics_dir()
+    if directory is None:
+        return
+    with _flush_lock:
+        with _metrics_lock:
+            _flush_state["dirty"] = False
+        owner, path = _flush_state["file"] or (None, None)
+        if owner != (os.getpid(), directory):
+            # После fork у дочернего процесса свой файл.
+            path = directory / f"{os.getpid()}-{time.time_ns()}.json"
+            _flush_state["file"] = ((os.getpid(), directory), path)
+        snapshot = [[*key, stats] for key, stats in get_snapshot().items()]
+        directory.mkdir(parents=True, exist_ok=True)
+        partial = path.with_name(path.name + ".part")
+        partial.write_text(json.dumps(snapshot))
+        os.replace(partial, path)
+
+
+def start_flusher():
+    """
+    Запускает поток, записывающий агрегаты раз в TASKS_METRICS_FLUSH_INTERVAL секунд.
+
+    Файл не пишется на каждый запрос: запись занимает больше времени,
+    чем сбор метрик, а Prometheus опрашивает endpoint раз в несколько секунд.
+    """
+    flusher = _flush_state["flusher"]
+    if flusher is not None and flusher[0] == os.getpid():
+        return
+    with _flush_lock:
+        flusher = _flush_state["flusher"]
+        if flusher is not None and flusher[0] == os.getpid():
+            return
+        interval = getattr(settings, "TASKS_METRICS_FLUSH_INTERVAL", 1.0)
+
+        def run():
+            while True:
+                time.sleep(interval)
+                if _flush_state["dirty"]:
+                    flush_metrics()
+
+        thread = threading.Thread(target=run, name="task-metrics-flusher", daemon=True)
+        thread.start()
+        _flush_state["flusher"] = (os.getpid(), thread)
+    atexit.register(flush_metrics)
+
+
+def read_metrics_dir(directory):
+    """
+    Суммирует агрегаты всех процессов из файлов каталога.
+
+    Returns:
+        dict: Агрегаты по (view, method) в формате _metrics
+    """
+    merged = {}
+    for path in sorted(directory.glob("*.json")):
+        try:
+            snapshot = json.loads(path.read_text())
+        except (OSError, ValueError):
+            # Файл удален или заменен во время чтения.
+            continue
+        for view, method, stats in snapshot:
+            total = merged.get((view, method))
+            if total is None:
+                merged[(view, method)] = {**stats, "buckets": list(stats["buckets"])}
+                continue
+            for field in ("requests", "duration", "queries", "db_time", "render_time"):
+                total[field] += stats[field]
+            total["buckets"] = [
+                a + b for a, b in zip(total["buckets"], stats["buckets"])
+            ]
+    return merged
+
+
+def get_server_timing(metrics, total):
+    """Значение заголовка Server-Timing для запроса."""
+    return (
+        f'db;dur={metrics.db_time * 1000:.2f};desc="{metrics.queries} queries", '
+        f"render;dur={metrics.render_time * 1000:.2f}, "
+        f"total;dur={total * 1000:.2f}"
+    )
+
+
+def reset_metrics():
+    """Обнуляет накопленные метрики процесса."""
+    with _metrics_lock:
+        _metrics.clear()
+        _flush_state["dirty"] = False
+
+
+def format_value(value):
+    """Значение метрики: целое как есть, секунды с точностью до микросекунды."""
+    return str(value) if isinstance(value, int) else f"{value:.6f}"
+
+
+def render_prometheus():
+    """
+    Метрики в текстовом формате Prometheus.
+
+    Каждый процесс gunicorn/uvicorn хранит свои агрегаты. С TASKS_METRICS_DIR
+    (gunicorn.conf.py задает его при нескольких процессах) агрегаты всех
+    процессов суммируются по файлам каталога, собственные записываются
+    перед чтением; без него возвращаются метрики текущего процесса.
+    """
+    directory = get_metrics_dir()
+    if directory is None:
+        snapshot = get_snapshot()
+    else:
+        flush_metrics()
+        snapshot = read_metrics_dir(directory)
+
+    lines = []
+
+    def add_metric(name, metric_type, description, samples):
+        lines.append(f"# HELP {name} {description}")
+        lines.append(f"# TYPE {name} {metric_type}")
+        lines.extend(samples)
+
+    def labels(view, method, **extra):
+        pairs = {"view": view, "method": method, **extra}
+        return ",".join(f'{key}="{value}"' for key, value in pairs.items())
+
+    items = sorted(snapshot.items())
+    add_metric(
+        "tasks_http_requests_total",
+        "counter",
+        "Количество обработанных запросов.",
+        [
+            f"tasks_http_requests_total{{{labels(*key)}}} {stats['requests']}"
+            for key, stats in items
+        ],
+    )
+
+    samples = []
+    for key, stats in items:
+        cumulative = 0
+        bounds = [*map(str, DURATION_BUCKETS), "+Inf"]
+        for bound, count in zip(bounds, stats["buckets"]):
+            cumulative += count
+            samples.append(
+                "tasks_http_request_duration_seconds_bucket"
+                f"{{{labels(*key, le=bound)}}} {cumulative}"
+            )
+        samples.append(
+            f"tasks_http_request_duration_seconds_sum{{{labels(*key)}}} "
+            f"{format_value(stats['duration'])}"
+        )
+        samples.append(
+            f"tasks_http_request_duration_seconds_count{{{labels(*key)}}} "
+            f"{stats['requests']}"
+        )
+    add_metric(
+        "tasks_http_request_duration_seconds",
+        "histogram",
+        "Полная длительность запроса.",
+        samples,
+    )
+
+    for name, field, description in (
+        ("tasks_db_queries_total", "queries", "Количество SQL-запросов."),
+        (
+            "tasks_db_duration_seconds_total",
+            "db_time",
+            "Время выполнения SQL-запросов.",
+        ),
+        (
+            "tasks_render_duration_seconds_total",
+            "render_time",
+            "Время рендеринга (сериализации) тела ответа.",
+        ),
+    ):
+        add_metric(
+            name,
+            "counter",
+            description,
+            [
+                f"{name}{{{labels(*key)}}} {format_value(stats[field])}"
+                for key, stats in items
+            ],
+        )
+    return "\n".join(lines) + "\n"
@@ -0,0 +1,174 @@
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+from django.core.exceptions import MiddlewareNotUsed
+from django.middleware.gzip import GZipMiddleware
+from django.utils.cache import patch_vary_headers
+
+from tasks.metrics import (enable_query_metrics, finish_render, finish_request,
+                           get_server_timing, is_metrics_enabled, start_render,
+                           start_request)
+
+try:
+    import brotli
+except ImportError:  # brotli не установлен: ответы сжимаются только gzip
+    brotli = None
+
+# Качество 4 - быстрое сжатие для динамических ответов, лучше gzip по размеру.
+BROTLI_QUALITY = 4
+
+
+class TaskMetricsMiddleware:
+    """
+    Метрики запросов: количество SQL-запросов, время в базе данных,
+    время рендеринга ответа и полная длительность.
+
+    Значения запроса возвращаются в заголовке Server-Timing и суммируются
+    по имени view и методу для endpoint /tasks/metrics/ (формат Prometheus).
+    SQL-запросы учитываются через connection.execute_wrapper, поэтому
+    метрики работают и с DEBUG=False.
+
+    Включается настройкой TASKS_METRICS_ENABLED; когда она выключена,
+    Django исключает middleware из цепочки (MiddlewareNotUsed).
+    Поддерживает sync и async режим, чтобы не переключать async views
+    в поток.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        if not is_metrics_enabled():
+            raise MiddlewareNotUsed
+        self.get_response = get_response
+        self.async_mode = iscoroutinefunction(get_response)
+        if self.async_mode:
+            markcoroutinefunction(self)
+        enable_query_metrics()
+
+    def __call__(self, request):
+        if self.async_mode:
+            return self.__acall__(request)
+        metrics, token = start_request()
+        request._task_metrics = metrics
+        response = self.get_response(request)
+        return self.finish(request, response, metrics, token)
+
+    async def __acall__(self, request):
+        metrics, token = start_request()
+        request._task_metrics = metrics
+        response = await self.get_response(request)
+        return self.finish(request, response, metrics, token)
+
+    def process_template_response(self, request, response):
+        """Измеряет рендеринг ответов DRF (Response - это SimpleTemplateResponse)."""
+        metrics = getattr(request, "_task_metrics", None)
+        if metrics is not None:
+            start_render(metrics)
+            response.add_post_render_callback(lambda _: finish_render(metrics))
+        return response
+
+    @staticmethod
+    def finish(request, response, metrics, token):
+        resolver_match = getattr(request, "resolver_match", None)
+        view = resolver_match.view_name if resolver_match else "unresolved"
+        total = finish_request(metrics, token, view, request.method)
+        response["Server-Timing"] = get_server_timing(metrics, total)
+        return response
+
+
+def get_accepted_encoding(header):
+    """
+    Выбирает кодирование ответа по заголовку Accept-Encoding.
+
+    Returns:
+        str | None: "br", если brotli установлен и клиент принимает его
+            не хуже gzip, "gzip" или None
+    """
+    weights = {}
+    for item in header.split(","):
+        name, _, params = item.strip().partition(";")
+        weight = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                weight = float(params[2:])
+            except ValueError:
+                weight = 0.0
+        weights[name.strip().lower()] = weight
+    wildcard = weights.get("*", 0.0)
+    br = weights.get("br", wildcard) if brotli is not None else 0.0
+    gzip = weights.get("gzip", wildcard)
+    if br > 0 and br >= gzip:
+        return "br"
+    if gzip > 0:
+        return "gzip"
+    return None
+
+
+class CompressionMiddleware(GZipMiddleware):
+    """
+    Сжатие ответов brotli или gzip по заголовку Accept-Encoding.
+
+    Сжимаются ответы не короче TASKS_COMPRESSION_MIN_SIZE байт
+    и потоковые ответы (выгрузка задач); text/event-stream не сжимается,
+    чтобы события доходили до клиента сразу. Для gzip используется
+    GZipMiddleware Django, brotli подключается, только если установлен.
+    Как и GZipMiddleware, сильный ETag сжатого ответа становится слабым.
+    """
+
+    def process_response(self, request, response):
+        if response.get("Content-Type", "").startswith("text/event-stream"):
+            return response
+        min_size = getattr(settings, "TASKS_COMPRESSION_MIN_SIZE", 1024)
+        if not response.streaming and len(response.content) < min_size:
+            return response
+        if response.has_header("Content-Encoding"):
+            return response
+
+        encoding = get_accepted_encoding(request.META.get("HTTP_ACCEPT_ENCODING", ""))
+        if encoding == "gzip":
+            return super().process_response(request, response)
+        patch_vary_headers(response, ("Accept-Encoding",))
+        if encoding is None:
+            return response
+
+        if response.streaming:
+            if response.is_async:
+                response.streaming_content = abrotli_sequence(
+                    response.streaming_content
+                )
+            else:
+                response.streaming_content = brotli_sequence(response.streaming_content)
+            del response.headers["Content-Length"]
+        else:
+            compressed = brotli.compress(response.content, quality=BROTLI_QUALITY)
+            if len(compressed) >= len(response.content):
+                return response
+            response.content = compressed
+            response.headers["Content-Length"] = str(len(compressed))
+
+        etag = response.get("ETag")
+        if etag and etag.startswith('"'):
+            response.headers["ETag"] = "W/" + etag
+        response.headers["Content-Encoding"] = "br"
+        return response
+
+
+def brotli_sequence(sequence):
+    """Сжимает поток фрагментов brotli, отдавая данные после каждого фрагмента."""
+    compressor = brotli.Compressor(quality=BROTLI_QUALITY)
+    for chunk in sequence:
+        data = compressor.process(chunk) + compressor.flush()
+        if data:
+            yield data
+    yield compressor.finish()
+
+
+async def abrotli_sequence(sequence):
+    """Асинхронная версия brotli_sequence."""
+    compressor = brotli.Compressor(quality=BROTLI_QUALITY)
+    async for chunk in sequence:
+        data = compressor.process(chunk) + compressor.flush()
+        if data:
+            yield data
+    yield compressor.finish()
@@ -0,0 +1,28 @@
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("tasks", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="task",
+            name="created_at",
+            field=models.DateTimeField(
+                auto_now_add=True,
+                default=django.utils.timezone.now,
+                verbose_name="Дата создания",
+            ),
+            preserve_default=False,
+        ),
+        migrations.AddIndex(
+            model_name="task",
+            index=models.Index(
+                fields=["-created_at", "uuid"], name="task_created_at_uuid_idx"
+            ),
+        ),
+    ]
@@ -0,0 +1,56 @@
+from django.db import migrations, models
+
+TITLE_TRGM_INDEX = "task_title_upper_trgm_idx"
+
+
+def create_title_trgm_index(apps, schema_editor):
+    """
+    GIN-индекс по UPPER(title) для фильтра title_contains (icontains).
+
+    Создается только на PostgreSQL: для других СУБД расширение pg_trgm недоступно.
+    """
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    schema_editor.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    schema_editor.execute(
+        f"CREATE INDEX IF NOT EXISTS {TITLE_TRGM_INDEX} "
+        "ON tasks_task USING gin (UPPER(title) gin_trgm_ops)"
+    )
+
+
+def drop_title_trgm_index(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    schema_editor.execute(f"DROP INDEX IF EXISTS {TITLE_TRGM_INDEX}")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("tasks", "0002_task_created_at"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="task",
+            name="title",
+            field=models.CharField(
+                db_index=True, max_length=100, verbose_name="Название задачи"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="task",
+            index=models.Index(
+                fields=["status", "-created_at"], name="task_status_created_at_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="task",
+            index=models.Index(
+                condition=models.Q(("status", "completed"), _negated=True),
+                fields=["-created_at"],
+                name="task_open_created_at_idx",
+            ),
+        ),
+        migrations.RunPython(create_title_trgm_index, drop_title_trgm_index),
+    ]
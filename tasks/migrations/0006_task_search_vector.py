@@ -0,0 +1,70 @@
+import django.contrib.postgres.search
+from django.db import migrations
+
+SEARCH_INDEX = "task_search_vector_idx"
+SEARCH_TRIGGER = "task_search_vector_trigger"
+SEARCH_FUNCTION = "task_search_vector_update"
+
+
+def create_search_trigger(apps, schema_editor):
+    """
+    GIN-индекс и триггер, поддерживающий search_vector в актуальном состоянии.
+
+    Триггер срабатывает и для bulk_create/bulk_update/COPY, которые
+    не вызывают save(). Название имеет вес A, описание - вес B.
+    Создается только на PostgreSQL.
+    """
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    schema_editor.execute(
+        f"""
+        CREATE OR REPLACE FUNCTION {SEARCH_FUNCTION}() RETURNS trigger AS $$
+        BEGIN
+            NEW.search_vector :=
+                setweight(to_tsvector('russian', coalesce(NEW.title, '')), 'A') ||
+                setweight(to_tsvector('russian', coalesce(NEW.description, '')), 'B');
+            RETURN NEW;
+        END
+        $$ LANGUAGE plpgsql
+        """
+    )
+    schema_editor.execute(
+        f"CREATE TRIGGER {SEARCH_TRIGGER} "
+        "BEFORE INSERT OR UPDATE OF title, description ON tasks_task "
+        f"FOR EACH ROW EXECUTE FUNCTION {SEARCH_FUNCTION}()"
+    )
+    schema_editor.execute(
+        "UPDATE tasks_task SET search_vector = "
+        "setweight(to_tsvector('russian', coalesce(title, '')), 'A') || "
+        "setweight(to_tsvector('russian', coalesce(description, '')), 'B')"
+    )
+    schema_editor.execute(
+        f"CREATE INDEX IF NOT EXISTS {SEARCH_INDEX} "
+        "ON tasks_task USING gin (search_vector)"
+    )
+
+
+def drop_search_trigger(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    schema_editor.execute(f"DROP INDEX IF EXISTS {SEARCH_INDEX}")
+    schema_editor.execute(f"DROP TRIGGER IF EXISTS {SEARCH_TRIGGER} ON tasks_task")
+    schema_editor.execute(f"DROP FUNCTION IF EXISTS {SEARCH_FUNCTION}()")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("tasks", "0005_task_version"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="task",
+            name="search_vector",
+            field=django.contrib.postgres.search.SearchVectorField(
+                editable=False, null=True, verbose_name="Поисковый вектор"
+            ),
+        ),
+        migrations.RunPython(create_search_trigger, drop_search_trigger),
+    ]
@@ -0,0 +1,57 @@
+from django.db import migrations, models
+from django.db.models import Count
+
+
+def fill_status_counters(apps, schema_editor):
+    """Начальные значения счетчиков по существующим задачам."""
+    Task = apps.get_model("tasks", "Task")
+    TaskStatusCounter = apps.get_model("tasks", "TaskStatusCounter")
+    counts = dict(
+        Task.objects.order_by()
+        .values_list("status")
+        .annotate(total=Count("pk"))
+        .values_list("status", "total")
+    )
+    statuses = {"created", "underway", "completed"} | counts.keys()
+    TaskStatusCounter.objects.bulk_create(
+        TaskStatusCounter(status=status, count=counts.get(status, 0))
+        for status in sorted(statuses)
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("tasks", "0006_task_search_vector"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="TaskStatusCounter",
+            fields=[
+                (
+                    "status",
+                    models.CharField(
+                        choices=[
+                            ("created", "создано"),
+                            ("underway", "в работе"),
+                            ("completed", "завершено"),
+                        ],
+                        max_length=20,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="Статус задачи",
+                    ),
+                ),
+                (
+                    "count",
+                    models.BigIntegerField(default=0, verbose_name="Количество задач"),
+                ),
+            ],
+            options={
+                "verbose_name": "Счетчик задач по статусу",
+                "verbose_name_plural": "Счетчики задач по статусам",
+            },
+        ),
+        migrations.RunPython(fill_status_counters, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,50 @@
+from django.db import migrations, models
+
+TITLE_LIKE_INDEX = "task_title_like_idx"
+
+
+def create_title_like_index(apps, schema_editor):
+    """
+    Индекс по title с varchar_pattern_ops для фильтра title_prefix (LIKE 'x%').
+
+    Индекс (title, uuid) заменяет индекс db_index по title для сравнений
+    и сортировки, но при collation, отличной от C, PostgreSQL не использует
+    его для LIKE. Вместо пары индексов db_index остается только этот;
+    на других СУБД отдельный индекс для LIKE не нужен.
+    """
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    schema_editor.execute(
+        f"CREATE INDEX IF NOT EXISTS {TITLE_LIKE_INDEX} "
+        "ON tasks_task (title varchar_pattern_ops)"
+    )
+
+
+def drop_title_like_index(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    schema_editor.execute(f"DROP INDEX IF EXISTS {TITLE_LIKE_INDEX}")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("tasks", "0007_taskstatuscounter"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="task",
+            index=models.Index(fields=["title", "uuid"], name="task_title_uuid_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="task",
+            index=models.Index(fields=["status", "uuid"], name="task_status_uuid_idx"),
+        ),
+        migrations.AlterField(
+            model_name="task",
+            name="title",
+            field=models.CharField(max_length=100, verbose_name="Название задачи"),
+        ),
+        migrations.RunPython(create_title_like_index, drop_title_like_index),
+    ]
@@ -0,0 +1,50 @@
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("tasks", "0008_task_ordering_indexes"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="TaskChange",
+            fields=[
+                (
+                    "seq",
+                    models.BigAutoField(
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="Номер изменения",
+                    ),
+                ),
+                ("task_uuid", models.UUIDField(verbose_name="UUID задачи")),
+                (
+                    "action",
+                    models.CharField(
+                        choices=[
+                            ("created", "создание"),
+                            ("updated", "изменение"),
+                            ("deleted", "удаление"),
+                        ],
+                        max_length=10,
+                        verbose_name="Тип изменения",
+                    ),
+                ),
+                (
+                    "changed_at",
+                    models.DateTimeField(
+                        db_index=True,
+                        default=django.utils.timezone.now,
+                        verbose_name="Время изменения",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "Изменение задачи",
+                "verbose_name_plural": "Изменения задач",
+            },
+        ),
+    ]
@@ -0,0 +1,74 @@
+import django.core.serializers.json
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("tasks", "0009_taskchange"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="TaskIdempotencyKey",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "key",
+                    models.CharField(
+                        max_length=255, verbose_name="Ключ идемпотентности"
+                    ),
+                ),
+                (
+                    "scope",
+                    models.CharField(max_length=255, verbose_name="Путь запроса"),
+                ),
+                (
+                    "fingerprint",
+                    models.CharField(max_length=64, verbose_name="Хэш запроса"),
+                ),
+                (
+                    "status_code",
+                    models.PositiveSmallIntegerField(verbose_name="HTTP-статус"),
+                ),
+                (
+                    "response",
+                    models.JSONField(
+                        encoder=django.core.serializers.json.DjangoJSONEncoder,
+                        null=True,
+                        verbose_name="Данные ответа",
+                    ),
+                ),
+                (
+                    "headers",
+                    models.JSONField(default=dict, verbose_name="Заголовки ответа"),
+                ),
+                (
+                    "created_at",
+                    models.DateTimeField(
+                        db_index=True,
+                        default=django.utils.timezone.now,
+                        verbose_name="Время сохранения",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "Ключ идемпотентности",
+                "verbose_name_plural": "Ключи идемпотентности",
+                "constraints": [
+                    models.UniqueConstraint(
+                        fields=("key", "scope"), name="task_idempotency_key_scope_uniq"
+                    )
+                ],
+            },
+        ),
+    ]
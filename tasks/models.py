@@ -1,6 +1,11 @@
 import uuid
 
-from django.db import models
+from django.contrib.postgres.search import SearchVectorField
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import models, router
+from django.db.models import Q
+from django.db.models.signals import post_save
+from django.utils import timezone
 
 
 class Task(models.Model):
@@ -12,6 +17,11 @@ class Task(models.Model):
         title (CharField): Название задачи (обязательное поле)
         description (TextField): Описание задачи (опциональное)
         status (CharField): Статус задачи с choices: created, underway, completed
+        created_at (DateTimeField): Дата создания, монотонный ключ для курсорной пагинации
+        updated_at (DateTimeField): Дата последнего изменения (Last-Modified)
+        version (PositiveIntegerField): Версия для оптимистичной блокировки (ETag)
+        search_vector (SearchVectorField): Полнотекстовый индекс названия и описания,
+            на PostgreSQL заполняется триггером (миграция 0006_task_search_vector)
     """
 
     STATUS_CHOICES = [
@@ -24,7 +34,10 @@ class Task(models.Model):
         primary_key=True, default=uuid.uuid4, editable=False, verbose_name="UUID"
     )
     title = models.CharField(
-        max_length=100, verbose_name="Название задачи", blank=False, null=False
+        max_length=100,
+        verbose_name="Название задачи",
+        blank=False,
+        null=False,
     )
     description = models.TextField(
         max_length=500, blank=True, null=True, verbose_name="Описание задачи"
@@ -32,11 +45,311 @@ class Task(models.Model):
     status = models.CharField(
         choices=STATUS_CHOICES, default="created", verbose_name="Статус задачи"
     )
+    created_at = models.DateTimeField(auto_now_add=True, verbose_name="Дата создания")
+    updated_at = models.DateTimeField(auto_now=True, verbose_name="Дата изменения")
+    version = models.PositiveIntegerField(
+        default=1, editable=False, verbose_name="Версия"
+    )
+    search_vector = SearchVectorField(
+        null=True, editable=False, verbose_name="Поисковый вектор"
+    )
 
     def __str__(self):
         """Строковое представление задачи."""
         return f"Задача {self.title}. Статус: {self.status}"
 
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        """Запоминает статус из базы данных для счетчиков TaskStatusCounter."""
+        instance = super().from_db(db, field_names, values)
+        instance._loaded_status = instance.__dict__.get("status")
+        return instance
+
+    def save(self, *args, **kwargs):
+        """Сохранение задачи с увеличением версии при изменении."""
+        if not self._state.adding:
+            self.version += 1
+            update_fields = kwargs.get("update_fields")
+            if update_fields is not None:
+                kwargs["update_fields"] = {*update_fields, "version"}
+        super().save(*args, **kwargs)
+
+    def save_versioned(self, expected_version, update_fields):
+        """
+        Условное сохранение без блокировки строки.
+
+        Выполняет UPDATE ... WHERE uuid = %s AND version = expected_version,
+        увеличивая версию. Так как update() не отправляет сигналы, post_save
+        отправляется вручную после успешной записи.
+
+        Args:
+            expected_version (int): Версия, прочитанная перед изменением
+            update_fields (Iterable[str]): Изменяемые поля
+
+        Returns:
+            bool: False, если задача была изменена параллельно
+        """
+        queryset, values = self._prepare_versioned(expected_version, update_fields)
+        if not queryset.update(**values):
+            self.version = expected_version
+            return False
+        post_save.send(**self._post_save_kwargs(values))
+        return True
+
+    async def asave_versioned(self, expected_version, update_fields):
+        """Асинхронная версия save_versioned для async views."""
+        queryset, values = self._prepare_versioned(expected_version, update_fields)
+        if not await queryset.aupdate(**values):
+            self.version = expected_version
+            return False
+        await post_save.asend(**self._post_save_kwargs(values))
+        return True
+
+    def _prepare_versioned(self, expected_version, update_fields):
+        """QuerySet условного UPDATE и значения полей для записи."""
+        self.version = expected_version + 1
+        self.updated_at = timezone.now()
+        fields = {*update_fields, "version", "updated_at"}
+        queryset = type(self)._default_manager.filter(
+            pk=self.pk, version=expected_version
+        )
+        return queryset, {field: getattr(self, field) for field in fields}
+
+    def _post_save_kwargs(self, values):
+        """Аргументы сигнала post_save, который update() не отправляет сам."""
+        return {
+            "sender": type(self),
+            "instance": self,
+            "created": False,
+            "update_fields": frozenset(values),
+            "raw": False,
+            "using": router.db_for_write(type(self), instance=self),
+        }
+
     class Meta:
         verbose_name = "Задача"
         verbose_name_plural = "Задачи"
+        indexes = [
+            models.Index(
+                fields=["-created_at", "uuid"], name="task_created_at_uuid_idx"
+            ),
+            models.Index(
+                fields=["status", "-created_at"], name="task_status_created_at_idx"
+            ),
+            models.Index(
+                fields=["-created_at"],
+                name="task_open_created_at_idx",
+                condition=~Q(status="completed"),
+            ),
+            models.Index(fields=["title", "uuid"], name="task_title_uuid_idx"),
+            models.Index(fields=["status", "uuid"], name="task_status_uuid_idx"),
+        ]
+
+
+class TaskStatusCounter(models.Model):
+    """
+    Предрассчитанное количество задач в одном статусе.
+
+    Одна строка на каждое значение Task.STATUS_CHOICES. Счетчики изменяются
+    инкрементально при создании, смене статуса и удалении задач
+    (см. tasks.counters), поэтому сводка читается без GROUP BY по задачам.
+    Расхождения исправляет команда reconcile_task_counters.
+
+    Attributes:
+        status (CharField): Статус задачи (primary key)
+        count (BigIntegerField): Количество задач в статусе
+    """
+
+    status = models.CharField(
+        primary_key=True,
+        max_length=20,
+        choices=Task.STATUS_CHOICES,
+        verbose_name="Статус задачи",
+    )
+    count = models.BigIntegerField(default=0, verbose_name="Количество задач")
+
+    def __str__(self):
+        """Строковое представление счетчика."""
+        return f"Статус {self.status}: {self.count}"
+
+    class Meta:
+        verbose_name = "Счетчик задач по статусу"
+        verbose_name_plural = "Счетчики задач по статусам"
+
+
+class TaskChange(models.Model):
+    """
+    Запись журнала изменений задач (append-only).
+
+    Пишется при создании, изменении и удалении задач через модели и
+    пакетные операции (см. tasks.changes) в той же транзакции, что и
+    сама запись. Порядковый номер seq монотонно растет, поэтому клиенты
+    синхронизируют копию таблицы запросами changes/?since=<seq> и получают
+    только изменения после seq. Старые записи удаляет команда
+    prune_task_changes.
+
+    Attributes:
+        seq (BigAutoField): Порядковый номер изменения (primary key)
+        task_uuid (UUIDField): UUID задачи; задача может быть уже удалена
+        action (CharField): Тип изменения: created, updated, deleted
+        changed_at (DateTimeField): Время записи изменения
+    """
+
+    ACTION_CHOICES = [
+        ("created", "создание"),
+        ("updated", "изменение"),
+        ("deleted", "удаление"),
+    ]
+
+    seq = models.BigAutoField(primary_key=True, verbose_name="Номер изменения")
+    task_uuid = models.UUIDField(verbose_name="UUID задачи")
+    action = models.CharField(
+        max_length=10, choices=ACTION_CHOICES, verbose_name="Тип изменения"
+    )
+    changed_at = models.DateTimeField(
+        default=timezone.now, db_index=True, verbose_name="Время изменения"
+    )
+
+    def __str__(self):
+        """Строковое представление изменения."""
+        return f"Изменение {self.seq}: {self.action} {self.task_uuid}"
+
+    class Meta:
+        verbose_name = "Изменение задачи"
+        verbose_name_plural = "Изменения задач"
+
+
+class TaskIdempotencyKey(models.Model):
+    """
+    Сохраненный ответ на запрос с заголовком Idempotency-Key.
+
+    Повтор запроса с тем же ключом к тому же endpoint возвращает
+    сохраненный ответ без валидации и записи в базу данных (см.
+    tasks.idempotency). Запись добавляется в той же транзакции, что
+    и изменение задачи, поэтому параллельный повтор упирается в
+    уникальный индекс (key, scope) и получает ответ первого запроса.
+    Ключи старше TASKS_IDEMPOTENCY_TTL не используются и удаляются
+    командой prune_idempotency_keys.
+
+    Attributes:
+        key (CharField): Значение заголовка Idempotency-Key
+        scope (CharField): Путь запроса, для которого действует ключ
+        fingerprint (CharField): SHA-256 метода и тела запроса
+        status_code (PositiveSmallIntegerField): HTTP-статус ответа
+        response (JSONField): Данные ответа
+        headers (JSONField): Заголовки ответа, установленные view (ETag и др.)
+        created_at (DateTimeField): Время сохранения ответа
+    """
+
+    key = models.CharField(max_length=255, verbose_name="Ключ идемпотентности")
+    scope = models.CharField(max_length=255, verbose_name="Путь запроса")
+    fingerprint = models.CharField(max_length=64, verbose_name="Хэш запроса")
+    status_code = models.PositiveSmallIntegerField(verbose_name="HTTP-статус")
+    response = models.JSONField(
+        encoder=DjangoJSONEncoder, null=True, verbose_name="Данные ответа"
+    )
+    headers = models.JSONField(default=dict, verbose_name="Заголовки ответа")
+    created_at = models.DateTimeField(
+        default=timezone.now, db_index=True, verbose_name="Время сохранения"
+    )
+
+    def __str__(self):
+        """Строковое представление ключа."""
+        return f"Ключ {self.key}: {self.scope}"
+
+    class Meta:
+        verbose_name = "Ключ идемпотентности"
+        verbose_name_plural = "Ключи идемпотентности"
+        constraints = [
+            models.UniqueConstraint(
+                fields=["key", "scope"], name="task_idempotency_key_scope_uniq"
+            ),
+        ]
+
+
+class TaskJob(models.Model):
+    """
+    Фоновая операция над задачами (очередь заданий в базе данных).
+
+    Задание ставится в очередь endpoint jobs/ и выполняется командой
+    run_task_worker вне веб-процесса (см. tasks.jobs). Воркеры забирают
+    задания запросом SELECT ... FOR UPDATE SKIP LOCKED, поэтому несколько
+    воркеров не получают одно задание и не ждут блокировок друг друга.
+    Задание, воркер которого не обновлял heartbeat_at дольше
+    TASKS_JOBS_TIMEOUT, считается прерванным и выполняется повторно.
+
+    Attributes:
+        uuid (UUIDField): Уникальный идентификатор задания (первичный ключ)
+        kind (CharField): Тип операции: bulk_status, export, purge_completed
+        params (JSONField): Параметры операции
+        status (CharField): Состояние: queued, running, succeeded, failed
+        attempts (PositiveSmallIntegerField): Количество запусков
+        progress (PositiveIntegerField): Количество обработанных задач
+        result (JSONField): Результат выполнения
+        error (TextField): Текст ошибки для failed
+        created_at (DateTimeField): Время постановки в очередь
+        started_at (DateTimeField): Время последнего запуска
+        heartbeat_at (DateTimeField): Время последнего сигнала воркера
+        finished_at (DateTimeField): Время завершения
+    """
+
+    KIND_CHOICES = [
+        ("bulk_status", "смена статуса"),
+        ("export", "выгрузка"),
+        ("purge_completed", "удаление завершенных"),
+    ]
+
+    STATUS_CHOICES = [
+        ("queued", "в очереди"),
+        ("running", "выполняется"),
+        ("succeeded", "выполнено"),
+        ("failed", "ошибка"),
+    ]
+
+    uuid = models.UUIDField(
+        primary_key=True, default=uuid.uuid4, editable=False, verbose_name="UUID"
+    )
+    kind = models.CharField(
+        max_length=20, choices=KIND_CHOICES, verbose_name="Тип операции"
+    )
+    params = models.JSONField(default=dict, blank=True, verbose_name="Параметры")
+    status = models.CharField(
+        max_length=10,
+        choices=STATUS_CHOICES,
+        default="queued",
+        verbose_name="Состояние",
+    )
+    attempts = models.PositiveSmallIntegerField(
+        default=0, verbose_name="Количество запусков"
+    )
+    progress = models.PositiveIntegerField(default=0, verbose_name="Обработано задач")
+    result = models.JSONField(null=True, blank=True, verbose_name="Результат")
+    error = models.TextField(blank=True, verbose_name="Ошибка")
+    created_at = models.DateTimeField(
+        default=timezone.now, verbose_name="Время постановки в очередь"
+    )
+    started_at = models.DateTimeField(
+        null=True, blank=True, verbose_name="Время запуска"
+    )
+    heartbeat_at = models.DateTimeField(
+        null=True, blank=True, verbose_name="Время сигнала воркера"
+    )
+    finished_at = models.DateTimeField(
+        null=True, blank=True, verbose_name="Время завершения"
+    )
+
+    def __str__(self):
+        """Строковое представление задания."""
+        return f"Задание {self.kind}: {self.status}"
+
+    class Meta:
+        verbose_name = "Фоновое задание"
+        verbose_name_plural = "Фоновые задания"
+        indexes = [
+            # Очередь: воркеры читают только незавершенные задания.
+            models.Index(
+                fields=["created_at"],
+                name="task_job_pending_idx",
+                condition=Q(status__in=["queued", "running"]),
+            ),
+        ]
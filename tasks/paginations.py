@@ -1,4 +1,16 @@
-from rest_framework.pagination import PageNumberPagination
+import hashlib
+import json
+
+from django.conf import settings
+from django.core.exceptions import ValidationError as DjangoValidationError
+from django.core.paginator import EmptyPage, Page, PageNotAnInteger, Paginator
+from django.db import connections
+from django.db.models import Q
+from django.utils.functional import cached_property
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import CursorPagination, PageNumberPagination
+
+from tasks.cache import get_task_cache
 
 
 class CustomPagination(PageNumberPagination):
@@ -14,3 +26,275 @@ class CustomPagination(PageNumberPagination):
     page_size = 5
     page_size_query_param = "page_size"
     max_page_size = 10
+
+
+class TaskCursorPagination(CursorPagination):
+    """
+    Курсорная (keyset) пагинация для списка задач.
+
+    Страницы выбираются по индексу (created_at, uuid) без COUNT(*) и OFFSET,
+    поэтому время ответа не зависит от глубины страницы.
+
+    В отличие от CursorPagination, позиция курсора - значения всех полей
+    сортировки последней задачи страницы (например, created_at и uuid),
+    а следующая страница выбирается условием по всему ключу:
+    (created_at < c) OR (created_at = c AND uuid > u). Позиция уникальна,
+    поэтому задачи с одинаковым значением первого поля (общий created_at
+    после миграции 0002, одинаковый status) не пропускаются смещением
+    offset, ограниченным offset_cutoff, и переход по next не зацикливается.
+
+    Настройки:
+        page_size (int): Количество элементов на странице по умолчанию
+        page_size_query_param (str): Параметр для изменения размера страницы
+        max_page_size (int): Максимальный размер страницы
+        ordering (tuple): Стабильный порядок, совпадающий с индексом
+    """
+
+    page_size = 5
+    page_size_query_param = "page_size"
+    max_page_size = 10
+    ordering = ("-created_at", "uuid")
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.request = request
+        self.page_size = self.get_page_size(request)
+        if not self.page_size:
+            return None
+
+        self.base_url = request.build_absolute_uri()
+        self.ordering = self.get_ordering(request, queryset, view)
+        self.cursor = self.decode_cursor(request)
+        if self.cursor is None:
+            offset, reverse, current_position = 0, False, None
+        else:
+            offset, reverse, current_position = self.cursor
+
+        # Для курсора previous запрос идет в обратном порядке.
+        ordering = reverse_ordering(self.ordering) if reverse else self.ordering
+        queryset = queryset.order_by(*ordering)
+        if current_position is not None:
+            queryset = self.filter_after_position(queryset, ordering, current_position)
+
+        # Лишняя строка показывает, есть ли следующая страница; offset у курсоров
+        # этого класса всегда 0, но старые курсоры с offset обрабатываются.
+        results = list(queryset[offset : offset + self.page_size + 1])
+        self.page = results[: self.page_size]
+        if len(results) > len(self.page):
+            following_position = self._get_position_from_instance(
+                results[-1], self.ordering
+            )
+        else:
+            following_position = None
+
+        has_following = following_position is not None
+        has_current = current_position is not None or offset > 0
+        if reverse:
+            self.page.reverse()
+            self.has_next, self.has_previous = has_current, has_following
+            self.next_position = current_position
+            self.previous_position = following_position
+        else:
+            self.has_next, self.has_previous = has_following, has_current
+            self.next_position = following_position
+            self.previous_position = current_position
+
+        if (self.has_previous or self.has_next) and self.template is not None:
+            self.display_page_controls = True
+        return self.page
+
+    def filter_after_position(self, queryset, ordering, position):
+        """
+        Оставляет строки, которые в порядке ordering идут после позиции.
+
+        Для порядка (a, -b) условие - a > x OR (a = x AND b < y); первое поле
+        дополнительно ограничено a >= x, чтобы PostgreSQL читал диапазон индекса.
+
+        Raises:
+            NotFound: Позиция курсора не разбирается
+        """
+        try:
+            values = json.loads(position)
+            if not isinstance(values, list) or len(values) != len(ordering):
+                raise ValueError(position)
+            condition = None
+            for field, value in reversed(list(zip(ordering, values))):
+                name = field.lstrip("-")
+                lookup = "lt" if field.startswith("-") else "gt"
+                after = Q(**{f"{name}__{lookup}": value})
+                if condition is not None:
+                    after |= Q(**{name: value}) & condition
+                condition = after
+            first = ordering[0]
+            bound = "lte" if first.startswith("-") else "gte"
+            return queryset.filter(
+                Q(**{f"{first.lstrip('-')}__{bound}": values[0]}) & condition
+            )
+        except (TypeError, ValueError, DjangoValidationError):
+            raise NotFound(self.invalid_cursor_message)
+
+    def _get_position_from_instance(self, instance, ordering):
+        names = [field.lstrip("-") for field in ordering]
+        if isinstance(instance, dict):
+            values = [instance[name] for name in names]
+        else:
+            values = [getattr(instance, name) for name in names]
+        return json.dumps([str(value) for value in values], separators=(",", ":"))
+
+
+def reverse_ordering(ordering):
+    """Порядок с противоположным направлением каждого поля."""
+    return tuple(
+        field[1:] if field.startswith("-") else "-" + field for field in ordering
+    )
+
+
+def get_count_estimate(queryset):
+    """
+    Оценка количества строк QuerySet планировщиком PostgreSQL.
+
+    Для таблицы без фильтров берется pg_class.reltuples, для запроса
+    с фильтрами - Plan Rows из EXPLAIN. Оценка кэшируется на
+    TASKS_COUNT_ESTIMATE_TIMEOUT секунд.
+
+    Returns:
+        int | None: Оценка или None, если она недоступна (не PostgreSQL,
+            таблица еще не анализировалась)
+    """
+    connection = connections[queryset.db]
+    if connection.vendor != "postgresql":
+        return None
+    queryset = queryset.order_by()
+    cache_key = "tasks:count:" + hashlib.md5(str(queryset.query).encode()).hexdigest()
+    cache = get_task_cache()
+    estimate = cache.get(cache_key)
+    if estimate is not None:
+        return estimate
+
+    if queryset.query.where:
+        # Django разворачивает JSON-массив плана, но строка может прийти и целиком.
+        plan = json.loads(queryset.explain(format="json"))
+        if isinstance(plan, list):
+            plan = plan[0]
+        estimate = int(plan["Plan"]["Plan Rows"])
+    else:
+        with connection.cursor() as cursor:
+            cursor.execute(
+                "SELECT reltuples::bigint FROM pg_class WHERE oid = %s::regclass",
+                [queryset.model._meta.db_table],
+            )
+            row = cursor.fetchone()
+        estimate = int(row[0]) if row else -1
+        if estimate < 0:
+            return None
+    cache.set(
+        cache_key, estimate, getattr(settings, "TASKS_COUNT_ESTIMATE_TIMEOUT", 60)
+    )
+    return estimate
+
+
+class EstimatedCountPage(Page):
+    """Страница, наличие следующей страницы у которой известно по лишней строке."""
+
+    has_more = False
+
+    def has_next(self):
+        if self.paginator.count_is_estimated:
+            return self.has_more
+        return super().has_next()
+
+
+class EstimatedCountPaginator(Paginator):
+    """
+    Paginator с приблизительным количеством для больших таблиц.
+
+    Если оценка планировщика не меньше TASKS_COUNT_ESTIMATE_THRESHOLD,
+    count берется из оценки без COUNT(*), иначе считается точно.
+    При оценочном count номер страницы не ограничивается сверху:
+    страница читается с одной лишней строкой, по которой определяется,
+    есть ли следующая, а пустая страница отвечает 404.
+    """
+
+    count_is_estimated = False
+
+    @cached_property
+    def count(self):
+        estimate = get_count_estimate(self.object_list)
+        threshold = getattr(settings, "TASKS_COUNT_ESTIMATE_THRESHOLD", 100000)
+        if estimate is None or estimate < threshold:
+            return super().count
+        self.count_is_estimated = True
+        return estimate
+
+    def validate_number(self, number):
+        if not self.count or not self.count_is_estimated:
+            return super().validate_number(number)
+        try:
+            number = int(number)
+        except (TypeError, ValueError):
+            raise PageNotAnInteger(self.error_messages["invalid_page"])
+        if number < 1:
+            raise EmptyPage(self.error_messages["min_page"])
+        return number
+
+    def page(self, number):
+        number = self.validate_number(number)
+        if not self.count_is_estimated:
+            return super().page(number)
+        bottom = (number - 1) * self.per_page
+        rows = list(self.object_list[bottom : bottom + self.per_page + 1])
+        if not rows and number > 1:
+            raise EmptyPage(self.error_messages["no_results"])
+        page = self._get_page(rows[: self.per_page], number, self)
+        page.has_more = len(rows) > self.per_page
+        return page
+
+    def _get_page(self, *args, **kwargs):
+        return EstimatedCountPage(*args, **kwargs)
+
+
+class EstimatedCountPagination(CustomPagination):
+    """
+    Пагинация по номеру страницы с приблизительным count.
+
+    На больших таблицах PostgreSQL точный COUNT(*) - полный проход
+    по таблице на каждый запрос списка; здесь он заменяется оценкой
+    планировщика (см. EstimatedCountPaginator). Поле count_is_estimated
+    в ответе показывает, является ли count оценкой.
+    """
+
+    django_paginator_class = EstimatedCountPaginator
+
+    def get_paginated_response(self, data):
+        response = super().get_paginated_response(data)
+        response.data["count_is_estimated"] = self.page.paginator.count_is_estimated
+        return response
+
+    def get_paginated_response_schema(self, schema):
+        schema = super().get_paginated_response_schema(schema)
+        schema["properties"]["count_is_estimated"] = {"type": "boolean"}
+        return schema
+
+
+PAGINATION_MODES = {
+    "page": CustomPagination,
+    "cursor": TaskCursorPagination,
+    "estimated": EstimatedCountPagination,
+}
+
+PAGINATION_MODE_QUERY_PARAM = "pagination"
+
+
+def get_pagination_class(request=None):
+    """
+    Возвращает класс пагинации для запроса.
+
+    Режим берется из параметра запроса ``pagination`` (page/cursor),
+    а при его отсутствии или неизвестном значении - из настройки
+    TASKS_PAGINATION_MODE.
+    """
+    default_mode = getattr(settings, "TASKS_PAGINATION_MODE", "page")
+    query_params = getattr(request, "query_params", {})
+    mode = query_params.get(PAGINATION_MODE_QUERY_PARAM, default_mode)
+    return PAGINATION_MODES.get(
+        mode, PAGINATION_MODES.get(default_mode, CustomPagination)
+    )
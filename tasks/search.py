@@ -0,0 +1,45 @@
+from django.contrib.postgres.search import SearchQuery, SearchRank
+from django.db import connection
+from django.db.models import BooleanField, Case, F, Q, Value, When
+
+# Конфигурация to_tsvector, совпадает с триггером миграции 0006_task_search_vector.
+SEARCH_CONFIG = "russian"
+
+SEARCH_QUERY_PARAM = "q"
+
+
+def search_tasks(queryset, query):
+    """
+    Полнотекстовый поиск задач по названию и описанию.
+
+    На PostgreSQL запрос разбирается websearch_to_tsquery (поддерживаются
+    "фразы", OR и -исключения) и сравнивается с search_vector по GIN-индексу;
+    результаты упорядочены по релевантности ts_rank, совпадения в названии
+    весят больше совпадений в описании.
+
+    На других СУБД (SQLite в тестах) используется простой путь: каждое слово
+    запроса должно встречаться в названии или описании (icontains),
+    задачи с совпадением в названии идут первыми.
+    """
+    if connection.vendor == "postgresql":
+        search_query = SearchQuery(query, config=SEARCH_CONFIG, search_type="websearch")
+        return (
+            queryset.filter(search_vector=search_query)
+            .annotate(rank=SearchRank(F("search_vector"), search_query))
+            .order_by("-rank", "-created_at", "uuid")
+        )
+
+    terms = query.split()
+    title_match = Q()
+    for term in terms:
+        queryset = queryset.filter(
+            Q(title__icontains=term) | Q(description__icontains=term)
+        )
+        title_match &= Q(title__icontains=term)
+    return queryset.annotate(
+        title_match=Case(
+            When(title_match, then=Value(True)),
+            default=Value(False),
+            output_field=BooleanField(),
+        )
+    ).order_by("-title_match", "-created_at", "uuid")
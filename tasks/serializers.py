@@ -1,6 +1,88 @@
-from rest_framework.serializers import ModelSerializer
+from collections import Counter
 
-from tasks.models import Task
+from django.conf import settings
+from django.db.models import F
+from django.utils import timezone
+from rest_framework.exceptions import ValidationError
+from rest_framework.fields import DateTimeField
+from rest_framework.serializers import ListSerializer, ModelSerializer
+
+from tasks.cache import invalidate_tasks
+from tasks.changes import record_task_changes
+from tasks.counters import get_status_deltas, update_status_counts
+from tasks.exceptions import TaskVersionConflict
+from tasks.models import Task, TaskJob
+
+
+class TaskListSerializer(ListSerializer):
+    """
+    Списочный сериализатор для пакетных операций с задачами.
+
+    Создает задачи одним bulk_create и обновляет одним bulk_update
+    вместо отдельного запроса к базе данных на каждую задачу.
+    bulk-операции не отправляют сигналы, поэтому счетчики по статусам
+    обновляются здесь же, одним UPDATE на статус, а журнал изменений
+    пополняется одним INSERT на пакет.
+    Ошибки валидации возвращаются списком, по одному элементу на задачу.
+    """
+
+    def create(self, validated_data):
+        """Пакетное создание задач через bulk_create."""
+        tasks = [Task(**attrs) for attrs in validated_data]
+        tasks = Task.objects.bulk_create(
+            tasks, batch_size=getattr(settings, "TASKS_BULK_BATCH_SIZE", 1000)
+        )
+        update_status_counts(Counter(task.status for task in tasks))
+        record_task_changes("created", [task.pk for task in tasks])
+        return tasks
+
+    def update(self, instance, validated_data):
+        """
+        Пакетное обновление задач через bulk_update.
+
+        instance - список задач в том же порядке, что и validated_data.
+        bulk_update не вызывает auto_now и не отправляет сигналы, поэтому
+        updated_at и version проставляются, а кэш сбрасывается явно.
+        Пакетное обновление не проверяет версии: побеждает последняя запись.
+        Версия увеличивается выражением version + 1 в UPDATE, а не по
+        прочитанному значению, чтобы запись поверх параллельного изменения
+        не повторила уже выданную версию (и ETag); новые версии читаются
+        после UPDATE одним SELECT.
+        """
+        fields = set()
+        deltas = Counter()
+        changed = []
+        now = timezone.now()
+        for task, attrs in zip(instance, validated_data):
+            previous = getattr(task, "_loaded_status", None)
+            for attr, value in attrs.items():
+                setattr(task, attr, value)
+                fields.add(attr)
+            if attrs:
+                task.updated_at = now
+                changed.append((task, task.version))
+                task.version = F("version") + 1
+            if previous is not None:
+                deltas.update(get_status_deltas(previous, task.status))
+                task._loaded_status = task.status
+        if fields:
+            fields.update(("updated_at", "version"))
+            Task.objects.bulk_update(
+                [task for task, _ in changed],
+                sorted(fields),
+                batch_size=getattr(settings, "TASKS_BULK_BATCH_SIZE", 1000),
+            )
+            pks = [task.pk for task, _ in changed]
+            versions = dict(
+                Task.objects.filter(pk__in=pks).values_list("pk", "version")
+            )
+            for task, version in changed:
+                # Задача, удаленная параллельно, сохраняет прочитанную версию.
+                task.version = versions.get(task.pk, version)
+            invalidate_tasks({task.pk: task.version for task in instance})
+            update_status_counts(deltas)
+            record_task_changes("updated", pks)
+        return instance
 
 
 class TaskSerializer(ModelSerializer):
@@ -9,12 +91,138 @@ class TaskSerializer(ModelSerializer):
 
     Обеспечивает преобразование объектов Task в JSON и обратно.
     Включает валидацию данных и обработку статусов задач.
+    При many=True используется TaskListSerializer для пакетной записи.
 
     Fields:
-        Все поля модели Task, поле uuid только для чтения
+        Все поля модели Task, кроме служебного search_vector;
+        поле uuid только для чтения
+
+    Обновление выполняется условным UPDATE по версии задачи, прочитанной
+    вместе с instance; при параллельном изменении - TaskVersionConflict (409).
     """
 
     class Meta:
         model = Task
-        fields = "__all__"
+        exclude = ("search_vector",)
         read_only_fields = ("uuid",)
+        list_serializer_class = TaskListSerializer
+
+    def update(self, instance, validated_data):
+        expected_version = instance.version
+        for attr, value in validated_data.items():
+            setattr(instance, attr, value)
+        if not instance.save_versioned(expected_version, validated_data.keys()):
+            raise TaskVersionConflict()
+        return instance
+
+
+class TaskJobSerializer(ModelSerializer):
+    """
+    Сериализатор фонового задания TaskJob.
+
+    При создании принимаются только kind и params; параметры проверяются
+    для конкретного типа задания в tasks.jobs.clean_job_params.
+    Остальные поля только для чтения и показывают ход выполнения.
+    """
+
+    class Meta:
+        model = TaskJob
+        fields = (
+            "uuid",
+            "kind",
+            "params",
+            "status",
+            "attempts",
+            "progress",
+            "result",
+            "error",
+            "created_at",
+            "started_at",
+            "finished_at",
+        )
+        read_only_fields = tuple(
+            field for field in fields if field not in ("kind", "params")
+        )
+
+
+TASK_FIELDS = (
+    "uuid",
+    "title",
+    "description",
+    "status",
+    "created_at",
+    "updated_at",
+    "version",
+)
+
+FIELDS_QUERY_PARAM = "fields"
+
+_datetime_field = DateTimeField()
+
+_FIELD_REPRESENTATIONS = {
+    "uuid": str,
+    "created_at": _datetime_field.to_representation,
+    "updated_at": _datetime_field.to_representation,
+}
+
+
+def get_sparse_fields(params):
+    """
+    Поля ответа из параметра fields (например, fields=uuid,title,status).
+
+    Returns:
+        tuple: Запрошенные поля в порядке TASK_FIELDS или TASK_FIELDS,
+            если параметр не передан
+
+    Raises:
+        ValidationError: Если запрошено неизвестное поле
+    """
+    value = params.get(FIELDS_QUERY_PARAM, "")
+    requested = {field.strip() for field in value.split(",") if field.strip()}
+    if not requested:
+        return TASK_FIELDS
+    invalid = sorted(requested.difference(TASK_FIELDS))
+    if invalid:
+        raise ValidationError(
+            {
+                FIELDS_QUERY_PARAM: [
+                    f'"{field}" is not a valid field.' for field in invalid
+                ]
+            }
+        )
+    return tuple(field for field in TASK_FIELDS if field in requested)
+
+
+def get_query_fields(fields, *required):
+    """Столбцы для .values(): поля ответа и служебные поля (ETag, пагинация)."""
+    columns = {*fields, *required}
+    return tuple(field for field in TASK_FIELDS if field in columns)
+
+
+def task_to_representation(row, fields=TASK_FIELDS):
+    """
+    Быстрое read-only представление задачи.
+
+    Строит словарь напрямую из строки .values(*TASK_FIELDS) без
+    пополевого to_representation DRF. Результат совпадает с
+    TaskSerializer(task).data, включая порядок ключей и формат дат.
+    С fields возвращаются только указанные поля (sparse fieldset).
+    """
+    if fields != TASK_FIELDS:
+        return {
+            field: (
+                _FIELD_REPRESENTATIONS[field](row[field])
+                if field in _FIELD_REPRESENTATIONS
+                else row[field]
+            )
+            for field in fields
+        }
+    return {
+        "uuid": str(row["uuid"]),
+        "title": row["title"],
+        "description": row["description"],
+        "status": row["status"],
+        "created_at": _datetime_field.to_representation(row["created_at"]),
+        "updated_at": _datetime_field.to_representation(row["updated_at"]),
+        "version": row["version"],
+    }
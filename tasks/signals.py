@@ -0,0 +1,46 @@
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from tasks.cache import invalidate_tasks
+from tasks.changes import record_task_changes
+from tasks.counters import get_status_deltas, update_status_counts
+from tasks.models import Task
+
+
+@receiver(post_save, sender=Task)
+def invalidate_saved_task(sender, instance, **kwargs):
+    """Сбрасывает кэш задачи при сохранении."""
+    invalidate_tasks({instance.pk: instance.version})
+
+
+@receiver(post_delete, sender=Task)
+def invalidate_deleted_task(sender, instance, **kwargs):
+    """Сбрасывает кэш задачи при удалении."""
+    invalidate_tasks({instance.pk: None})
+
+
+@receiver(post_save, sender=Task)
+def count_saved_task(sender, instance, created, **kwargs):
+    """Обновляет счетчики по статусам при создании задачи или смене статуса."""
+    previous = None if created else getattr(instance, "_loaded_status", None)
+    if created or previous is not None:
+        update_status_counts(get_status_deltas(previous, instance.status))
+    instance._loaded_status = instance.status
+
+
+@receiver(post_delete, sender=Task)
+def count_deleted_task(sender, instance, **kwargs):
+    """Уменьшает счетчик статуса удаленной задачи."""
+    update_status_counts({instance.status: -1})
+
+
+@receiver(post_save, sender=Task)
+def log_saved_task(sender, instance, created, **kwargs):
+    """Добавляет создание или изменение задачи в журнал изменений."""
+    record_task_changes("created" if created else "updated", [instance.pk])
+
+
+@receiver(post_delete, sender=Task)
+def log_deleted_task(sender, instance, **kwargs):
+    """Добавляет удаление задачи в журнал изменений."""
+    record_task_changes("deleted", [instance.pk])
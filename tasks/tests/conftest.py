@@ -1,6 +1,7 @@
 import pytest
 from rest_framework.test import APIClient
 
+from tasks.cache import get_task_cache, reset_cache_stats
 from tasks.models import Task
 
 
@@ -45,3 +46,12 @@ def multiple_tasks(db):
 @pytest.fixture
 def fake_uuid():
     return "12345678-1234-1234-1234-123456789012"
+
+
+@pytest.fixture(autouse=True)
+def clear_task_cache():
+    """Очистка кэша задач и его счетчиков между тестами"""
+    get_task_cache().clear()
+    reset_cache_stats()
+    yield
+    get_task_cache().clear()
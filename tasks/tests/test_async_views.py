@@ -0,0 +1,117 @@
+import pytest
+from django.urls import reverse
+from rest_framework import status
+
+from tasks.models import Task
+
+
+@pytest.mark.django_db
+class TestAsyncTaskViews:
+    """
+    Тесты асинхронных API endpoints для ASGI-стека.
+
+    Класс проверяет, что асинхронные view выполняют те же CRUD операции
+    и возвращают тот же формат ответа, что и синхронные.
+    """
+
+    def test_async_list_matches_sync(self, api_client, multiple_tasks):
+        """
+        Тест совпадения асинхронного списка с синхронным.
+
+        Проверяет одинаковые count и набор задач в results.
+        """
+        sync_response = api_client.get(reverse("tasks:tasks_list"))
+        async_response = api_client.get(reverse("tasks:async_tasks_list"))
+
+        assert async_response.status_code == status.HTTP_200_OK
+        data = async_response.json()
+        assert data["count"] == sync_response.data["count"]
+        assert data["next"] is None
+        assert sorted(data["results"], key=lambda task: task["uuid"]) == sorted(
+            sync_response.json()["results"], key=lambda task: task["uuid"]
+        )
+
+    def test_async_list_pagination(self, api_client, multiple_tasks):
+        """
+        Тест пагинации асинхронного списка.
+
+        Проверяет ограничение page_size и ссылки на соседние страницы.
+        """
+        url = reverse("tasks:async_tasks_list")
+
+        first = api_client.get(url, {"page_size": 2}).json()
+        second = api_client.get(first["next"]).json()
+
+        assert len(first["results"]) == 2
+        assert first["previous"] is None
+        assert len(second["results"]) == 1
+        assert second["previous"] is not None
+
+    def test_async_retrieve(self, api_client, task_object, fake_uuid):
+        """
+        Тест получения задачи асинхронным view.
+
+        Проверяет данные задачи, ETag и ответ 404 для несуществующей задачи.
+        """
+        url = reverse("tasks:async_task_detail", kwargs={"pk": task_object.uuid})
+        response = api_client.get(url)
+        missing = api_client.get(
+            reverse("tasks:async_task_detail", kwargs={"pk": fake_uuid})
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json()["title"] == task_object.title
+        assert response["ETag"] == f'"{task_object.version}"'
+        assert missing.status_code == status.HTTP_404_NOT_FOUND
+
+    def test_async_create(self, api_client, task_data):
+        """
+        Тест создания задачи асинхронным view.
+
+        Проверяет статус 201 Created и ошибку 400 для невалидных данных.
+        """
+        url = reverse("tasks:async_task_create")
+
+        response = api_client.post(url, task_data, format="json")
+        invalid = api_client.post(url, {"status": "invalid"}, format="json")
+
+        assert response.status_code == status.HTTP_201_CREATED
+        assert response.json()["title"] == task_data["title"]
+        assert Task.objects.count() == 1
+        assert invalid.status_code == status.HTTP_400_BAD_REQUEST
+        assert "title" in invalid.json()
+
+    def test_async_update_with_if_match(self, api_client, task_object):
+        """
+        Тест обновления задачи асинхронным view с If-Match.
+
+        Проверяет успешное обновление и 412 для устаревшего ETag.
+        """
+        url = reverse("tasks:async_task_update", kwargs={"pk": task_object.uuid})
+        etag = f'"{task_object.version}"'
+
+        response = api_client.patch(
+            url, {"status": "completed"}, format="json", HTTP_IF_MATCH=etag
+        )
+        stale = api_client.patch(
+            url, {"status": "created"}, format="json", HTTP_IF_MATCH=etag
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json()["version"] == task_object.version + 1
+        assert stale.status_code == status.HTTP_412_PRECONDITION_FAILED
+        task_object.refresh_from_db()
+        assert task_object.status == "completed"
+
+    def test_async_delete(self, api_client, task_object):
+        """
+        Тест удаления задачи асинхронным view.
+
+        Проверяет статус 204 No Content и удаление записи.
+        """
+        url = reverse("tasks:async_task_delete", kwargs={"pk": task_object.uuid})
+
+        response = api_client.delete(url)
+
+        assert response.status_code == status.HTTP_204_NO_CONTENT
+        assert Task.objects.count() == 0
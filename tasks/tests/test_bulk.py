@@ -0,0 +1,191 @@
+import uuid
+
+import pytest
+from django.db.models import F
+from django.urls import reverse
+from rest_framework import status
+
+from tasks.models import Task
+from tasks.serializers import TaskSerializer
+
+
+@pytest.mark.django_db
+class TestTaskBulkViews:
+    """
+    Тесты для пакетных API endpoints.
+
+    Класс содержит тесты пакетного создания, обновления, удаления
+    и получения задач, включая возврат ошибок валидации по каждой задаче.
+    """
+
+    def test_bulk_create_success(self, api_client, task_data):
+        """
+        Тест пакетного создания задач.
+
+        Проверяет:
+        - Корректный HTTP статус 201 Created
+        - Возврат списка созданных задач с UUID
+        - Фактическое создание всех записей в базе данных
+        """
+        url = reverse("tasks:task_bulk_create")
+        data = [dict(task_data, title=f"Задача {i}") for i in range(3)]
+
+        response = api_client.post(url, data, format="json")
+
+        assert response.status_code == status.HTTP_201_CREATED
+        assert len(response.data) == 3
+        assert all("uuid" in task for task in response.data)
+        assert Task.objects.count() == 3
+
+    def test_bulk_create_item_errors(self, api_client, task_data):
+        """
+        Тест пакетного создания с невалидной задачей в списке.
+
+        Проверяет, что ошибки возвращаются по позиции задачи в списке
+        и ни одна задача не создается.
+        """
+        url = reverse("tasks:task_bulk_create")
+        data = [task_data, {"title": "Задача", "status": "invalid_status"}]
+
+        response = api_client.post(url, data, format="json")
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert response.data[0] == {}
+        assert "status" in response.data[1]
+        assert Task.objects.count() == 0
+
+    def test_bulk_update_success(self, api_client, multiple_tasks):
+        """
+        Тест пакетного частичного обновления задач.
+
+        Проверяет, что каждая задача получает свои изменения,
+        а не переданные поля остаются прежними.
+        """
+        url = reverse("tasks:task_bulk_update")
+        data = [
+            {"uuid": str(multiple_tasks[0].uuid), "status": "completed"},
+            {"uuid": str(multiple_tasks[1].uuid), "title": "Новое название"},
+        ]
+
+        response = api_client.patch(url, data, format="json")
+
+        assert response.status_code == status.HTTP_200_OK
+        multiple_tasks[0].refresh_from_db()
+        multiple_tasks[1].refresh_from_db()
+        assert multiple_tasks[0].status == "completed"
+        assert multiple_tasks[0].title == "Задача 1"
+        assert multiple_tasks[1].title == "Новое название"
+
+    def test_bulk_update_stale_version(self, multiple_tasks):
+        """
+        Тест пакетного обновления задачи, измененной после чтения.
+
+        Проверяет, что версия увеличивается от значения в базе данных,
+        а не от прочитанного, и не повторяет уже выданную версию (ETag).
+        """
+        tasks = list(Task.objects.filter(pk=multiple_tasks[0].pk))
+        Task.objects.filter(pk=multiple_tasks[0].pk).update(version=F("version") + 1)
+        serializer = TaskSerializer(
+            tasks, data=[{"status": "completed"}], many=True, partial=True
+        )
+        serializer.is_valid(raise_exception=True)
+
+        serializer.save()
+
+        multiple_tasks[0].refresh_from_db()
+        assert multiple_tasks[0].version == 3
+        assert serializer.data[0]["version"] == 3
+
+    def test_bulk_update_nonexistent_task(self, api_client, task_object, fake_uuid):
+        """
+        Тест пакетного обновления со списком, содержащим несуществующий UUID.
+
+        Проверяет, что возвращается ошибка для конкретной позиции
+        и существующая задача не изменяется.
+        """
+        url = reverse("tasks:task_bulk_update")
+        data = [
+            {"uuid": str(task_object.uuid), "status": "completed"},
+            {"uuid": fake_uuid, "status": "completed"},
+        ]
+
+        response = api_client.patch(url, data, format="json")
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert response.data[0] == {}
+        assert "uuid" in response.data[1]
+        task_object.refresh_from_db()
+        assert task_object.status == "underway"
+
+    def test_bulk_delete(self, api_client, multiple_tasks, fake_uuid):
+        """
+        Тест пакетного удаления задач.
+
+        Проверяет удаление только перечисленных задач
+        и возврат количества удаленных записей.
+        """
+        url = reverse("tasks:task_bulk_delete")
+        data = {"uuids": [str(task.uuid) for task in multiple_tasks[:2]] + [fake_uuid]}
+
+        response = api_client.post(url, data, format="json")
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data["deleted"] == 2
+        assert list(Task.objects.all()) == [multiple_tasks[2]]
+
+    def test_bulk_retrieve(self, api_client, multiple_tasks, fake_uuid):
+        """
+        Тест получения задач по списку UUID.
+
+        Проверяет:
+        - Порядок результатов как в запросе, включая повторы
+        - Маркер для несуществующей задачи
+        - Совпадение данных с детальным просмотром
+        """
+        url = reverse("tasks:task_bulk_retrieve")
+        first, second = str(multiple_tasks[0].uuid), str(multiple_tasks[2].uuid)
+        detail = api_client.get(reverse("tasks:task_detail", args=[second])).json()
+
+        response = api_client.post(
+            url, {"uuids": [second, fake_uuid, first, second]}, format="json"
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        results = response.json()["results"]
+        assert [item["uuid"] for item in results] == [second, fake_uuid, first, second]
+        assert results[0] == results[3] == detail
+        assert results[1] == {"uuid": fake_uuid, "detail": "Not found."}
+        assert results[2]["title"] == multiple_tasks[0].title
+
+    def test_bulk_retrieve_fields(self, api_client, multiple_tasks):
+        """
+        Тест получения задач по списку UUID с параметром fields.
+
+        Проверяет, что результаты содержат только запрошенные поля.
+        """
+        url = reverse("tasks:task_bulk_retrieve") + "?fields=title"
+
+        response = api_client.post(
+            url, {"uuids": [str(multiple_tasks[1].uuid)]}, format="json"
+        )
+
+        assert response.json()["results"] == [{"title": multiple_tasks[1].title}]
+
+    def test_bulk_retrieve_invalid(self, api_client, settings):
+        """
+        Тест валидации списка UUID.
+
+        Проверяет ошибки для некорректного UUID и превышения
+        TASKS_BULK_RETRIEVE_MAX_ITEMS.
+        """
+        settings.TASKS_BULK_RETRIEVE_MAX_ITEMS = 2
+        url = reverse("tasks:task_bulk_retrieve")
+
+        invalid = api_client.post(url, {"uuids": ["abc"]}, format="json")
+        too_many = api_client.post(
+            url, {"uuids": [str(uuid.uuid4()) for _ in range(3)]}, format="json"
+        )
+
+        assert invalid.status_code == status.HTTP_400_BAD_REQUEST
+        assert invalid.json() == {"uuids": {"0": ["Некорректный UUID."]}}
+        assert too_many.status_code == status.HTTP_400_BAD_REQUEST
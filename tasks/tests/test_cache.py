@@ -0,0 +1,164 @@
+from unittest import mock
+
+import pytest
+from django.core.cache.backends.locmem import LocMemCache
+from django.urls import reverse
+from rest_framework import status
+
+from tasks.cache import (LRUCache, get_cache_stats, get_cached_task,
+                         task_cache_key)
+from tasks.models import Task
+from tasks.serializers import task_to_representation
+
+
+@pytest.mark.django_db
+class TestTaskCache:
+    """
+    Тесты read-through кэша детальной информации о задаче.
+
+    Класс содержит тесты попаданий в кэш, сброса записей при изменении
+    и удалении задачи, а также счетчиков кэша.
+    """
+
+    def test_retrieve_uses_cache(
+        self, api_client, task_object, django_assert_num_queries
+    ):
+        """
+        Тест повторного чтения задачи из кэша.
+
+        Проверяет:
+        - Первый запрос обращается к базе данных и заполняет кэш
+        - Повторный запрос не выполняет SQL-запросов
+        - Счетчики попаданий и промахов
+        """
+        url = reverse("tasks:task_detail", kwargs={"pk": task_object.uuid})
+
+        api_client.get(url)
+        with django_assert_num_queries(0):
+            response = api_client.get(url)
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data["title"] == task_object.title
+        stats = get_cache_stats()
+        assert stats["hits"] == 1
+        assert stats["misses"] == 1
+
+    def test_update_invalidates_cache(self, api_client, task_object):
+        """
+        Тест сброса кэша при обновлении задачи через API.
+
+        Проверяет, что после обновления детальный запрос возвращает новые данные.
+        """
+        detail_url = reverse("tasks:task_detail", kwargs={"pk": task_object.uuid})
+        update_url = reverse("tasks:task_update", kwargs={"pk": task_object.uuid})
+        api_client.get(detail_url)
+
+        api_client.patch(update_url, {"status": "completed"}, format="json")
+        response = api_client.get(detail_url)
+
+        assert response.data["status"] == "completed"
+
+    def test_bulk_update_invalidates_cache(self, api_client, task_object):
+        """
+        Тест сброса кэша при пакетном обновлении (bulk_update без сигналов).
+
+        Проверяет, что закэшированная задача удаляется из кэша.
+        """
+        api_client.get(reverse("tasks:task_detail", kwargs={"pk": task_object.uuid}))
+        assert get_cached_task(task_object.uuid) is not None
+
+        api_client.patch(
+            reverse("tasks:task_bulk_update"),
+            [{"uuid": str(task_object.uuid), "status": "completed"}],
+            format="json",
+        )
+
+        assert get_cached_task(task_object.uuid) is None
+
+    def test_stale_read_after_update(
+        self, api_client, task_object, django_capture_on_commit_callbacks
+    ):
+        """
+        Тест чтения, завершившегося после параллельного обновления.
+
+        Строка прочитана до фиксации обновления, а в кэш записывается уже
+        после сброса записи. Проверяет, что устаревшая версия не попадает
+        в кэш и следующий запрос возвращает новые данные и ETag.
+        """
+        url = reverse("tasks:task_detail", kwargs={"pk": task_object.uuid})
+
+        def update_concurrently(row, columns):
+            data = task_to_representation(row, columns)
+            with django_capture_on_commit_callbacks(execute=True):
+                task = Task.objects.get(pk=task_object.pk)
+                task.status = "completed"
+                task.save_versioned(task.version, ["status"])
+            return data
+
+        with mock.patch(
+            "tasks.views.task_to_representation", side_effect=update_concurrently
+        ):
+            stale = api_client.get(url)
+        response = api_client.get(url)
+
+        assert stale["ETag"] == '"1"'
+        assert response["ETag"] == '"2"'
+        assert response.data["status"] == "completed"
+        assert get_cached_task(task_object.uuid)["version"] == 2
+
+    def test_delete_invalidates_cache(self, api_client, task_object):
+        """
+        Тест сброса кэша при удалении задачи.
+
+        Проверяет, что после удаления детальный запрос возвращает 404 Not Found.
+        """
+        detail_url = reverse("tasks:task_detail", kwargs={"pk": task_object.uuid})
+        api_client.get(detail_url)
+
+        api_client.delete(reverse("tasks:task_delete", kwargs={"pk": task_object.uuid}))
+        response = api_client.get(detail_url)
+
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+
+    def test_cache_stats_endpoint(self, api_client):
+        """
+        Тест endpoint статистики кэша.
+
+        Проверяет наличие счетчиков попаданий, промахов и вытеснений.
+        """
+        response = api_client.get(reverse("tasks:task_cache_stats"))
+
+        assert response.status_code == status.HTTP_200_OK
+        for key in ("hits", "misses", "hit_ratio", "evictions", "size"):
+            assert key in response.data
+
+
+class TestLRUCache:
+    """
+    Тесты бэкенда LRUCache.
+
+    Проверяет ограничение размера и подсчет вытеснений.
+    """
+
+    def test_lru_eviction(self):
+        """
+        Тест вытеснения давно не использованной записи.
+
+        Проверяет, что при переполнении удаляется самая старая по обращению
+        запись, а счетчик вытеснений увеличивается.
+        """
+        cache = LRUCache(
+            "test-lru", {"OPTIONS": {"MAX_ENTRIES": 2, "CULL_FREQUENCY": 2}}
+        )
+        cache.clear()
+        cache.set(task_cache_key(1), {"title": "1"})
+        cache.set(task_cache_key(2), {"title": "2"})
+        cache.get(task_cache_key(1))
+
+        cache.set(task_cache_key(3), {"title": "3"})
+
+        assert isinstance(cache, LocMemCache)
+        assert cache.get(task_cache_key(2)) is None
+        assert cache.get(task_cache_key(1)) is not None
+        assert cache.evictions == 1
+        assert len(cache) == 2
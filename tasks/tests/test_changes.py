@@ -0,0 +1,212 @@
+import time
+from datetime import timedelta
+from io import StringIO
+from uuid import uuid4
+
+import pytest
+from django.core.management import call_command
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework import status
+
+from tasks.feed import get_visible_changes
+from tasks.models import Task, TaskChange
+
+
+@pytest.mark.django_db
+class TestTaskChanges:
+    """
+    Тесты журнала изменений задач и endpoint changes/.
+
+    Класс содержит тесты записи изменений одиночными и пакетными
+    операциями, инкрементального чтения по since, long-poll,
+    пропусков в нумерации и удаления старых записей.
+    """
+
+    url = reverse("tasks:task_changes")
+
+    def get_changes(self, api_client, **params):
+        response = api_client.get(self.url, params)
+        assert response.status_code == status.HTTP_200_OK
+        return response.json()
+
+    def test_changes_since(self, api_client, task_data):
+        """
+        Тест чтения изменений после since.
+
+        Проверяет:
+        - Текущую позицию журнала в ответе без since
+        - Порядок и типы изменений после создания, обновления и удаления
+        - Текущие данные задачи в изменении или None для удаленной задачи
+        """
+        since = self.get_changes(api_client)["next"]
+        first = api_client.post(reverse("tasks:task_create"), task_data).data["uuid"]
+        api_client.patch(
+            reverse("tasks:task_update", kwargs={"pk": first}), {"status": "completed"}
+        )
+        second = api_client.post(reverse("tasks:task_create"), task_data).data["uuid"]
+        api_client.delete(reverse("tasks:task_delete", kwargs={"pk": second}))
+
+        data = self.get_changes(api_client, since=since)
+
+        assert [(change["action"], change["uuid"]) for change in data["changes"]] == [
+            ("created", first),
+            ("updated", first),
+            ("created", second),
+            ("deleted", second),
+        ]
+        assert data["changes"][0]["task"]["status"] == "completed"
+        assert data["changes"][2]["task"] is None
+        assert data["next"] == data["changes"][-1]["seq"]
+        assert data["has_more"] is False
+        assert self.get_changes(api_client, since=data["next"])["changes"] == []
+
+    def test_bulk_operations_logged(self, api_client, task_data):
+        """
+        Тест записи изменений пакетными endpoints.
+
+        Проверяет, что bulk_create, bulk_update и пакетное удаление
+        добавляют в журнал по одной записи на задачу.
+        """
+        response = api_client.post(
+            reverse("tasks:task_bulk_create"), [task_data] * 3, format="json"
+        )
+        uuids = [item["uuid"] for item in response.data]
+        api_client.patch(
+            reverse("tasks:task_bulk_update"),
+            [{"uuid": pk, "status": "underway"} for pk in uuids[:2]],
+            format="json",
+        )
+        api_client.post(
+            reverse("tasks:task_bulk_delete"), {"uuids": uuids}, format="json"
+        )
+
+        actions = list(TaskChange.objects.order_by("seq").values_list("action"))
+        assert actions == [("created",)] * 3 + [("updated",)] * 2 + [("deleted",)] * 3
+
+    def test_rejected_bulk_create_not_logged(self, api_client, task_data):
+        """
+        Тест отклоненного пакетного создания.
+
+        Проверяет, что при ошибке валидации журнал не пополняется.
+        """
+        api_client.post(
+            reverse("tasks:task_bulk_create"),
+            [task_data, {"title": ""}],
+            format="json",
+        )
+
+        assert not TaskChange.objects.exists()
+
+    def test_import_logged(self, tmp_path):
+        """
+        Тест записи изменений командой import_tasks.
+
+        Проверяет, что импортированные задачи попадают в журнал как созданные.
+        """
+        path = tmp_path / "tasks.ndjson"
+        path.write_text('{"title": "Первая"}\n{"title": "Вторая"}\n', encoding="utf-8")
+
+        call_command("import_tasks", str(path), stdout=StringIO())
+
+        assert sorted(TaskChange.objects.values_list("task_uuid", flat=True)) == sorted(
+            Task.objects.values_list("uuid", flat=True)
+        )
+
+    def test_limit(self, api_client, multiple_tasks):
+        """
+        Тест ограничения количества изменений.
+
+        Проверяет has_more и продолжение чтения с next.
+        """
+        data = self.get_changes(api_client, since=0, limit=2)
+        assert len(data["changes"]) == 2
+        assert data["has_more"] is True
+
+        rest = self.get_changes(api_client, since=data["next"], limit=2)
+        assert len(rest["changes"]) == 1
+        assert rest["has_more"] is False
+
+    def test_long_poll_timeout(self, api_client, multiple_tasks, settings):
+        """
+        Тест long-poll без новых изменений.
+
+        Проверяет, что endpoint ждет wait секунд и возвращает пустой ответ
+        с прежним next.
+        """
+        settings.TASKS_CHANGES_POLL_INTERVAL = 0.01
+        since = self.get_changes(api_client)["next"]
+
+        started = time.monotonic()
+        data = self.get_changes(api_client, since=since, wait=0.1)
+
+        assert time.monotonic() - started >= 0.1
+        assert data == {"changes": [], "next": since, "has_more": False}
+
+    def test_gap_hidden_until_timeout(self, settings):
+        """
+        Тест пропуска в нумерации seq.
+
+        Проверяет, что изменения после пропуска не возвращаются, пока
+        пропуск моложе TASKS_CHANGES_GAP_TIMEOUT (транзакция с пропущенным
+        seq может быть еще не зафиксирована).
+        """
+        settings.TASKS_CHANGES_GAP_TIMEOUT = 10
+        now = timezone.now()
+        rows = [{"seq": 1, "changed_at": now}, {"seq": 3, "changed_at": now}]
+
+        assert get_visible_changes(rows, 0, now) == rows[:1]
+        assert get_visible_changes(rows, 0, now + timedelta(seconds=11)) == rows
+
+    def test_start_position_before_gap(self, api_client, settings):
+        """
+        Тест позиции журнала без since при пропуске в нумерации.
+
+        Проверяет, что next указывает на seq перед свежим пропуском
+        (транзакция с пропущенным seq может быть еще не зафиксирована),
+        а после TASKS_CHANGES_GAP_TIMEOUT - на последнее изменение.
+        """
+        settings.TASKS_CHANGES_GAP_TIMEOUT = 10
+        now = timezone.now()
+        for seq, changed_at in ((1, now - timedelta(seconds=60)), (2, now), (4, now)):
+            TaskChange.objects.create(
+                seq=seq, task_uuid=uuid4(), action="created", changed_at=changed_at
+            )
+
+        assert self.get_changes(api_client)["next"] == 2
+
+        TaskChange.objects.update(changed_at=now - timedelta(seconds=60))
+        assert self.get_changes(api_client)["next"] == 4
+
+    def test_expired_since(self, api_client, multiple_tasks):
+        """
+        Тест чтения удаленной части журнала.
+
+        Проверяет, что prune_task_changes сохраняет последнюю запись,
+        а клиент со старым since получает 410 Gone.
+        """
+        last = TaskChange.objects.order_by("seq").last().seq
+        out = StringIO()
+        TaskChange.objects.update(changed_at=timezone.now() - timedelta(days=30))
+
+        call_command("prune_task_changes", days=7, stdout=out)
+
+        assert "Удалено записей журнала: 2" in out.getvalue()
+        assert list(TaskChange.objects.values_list("seq", flat=True)) == [last]
+        response = api_client.get(self.url, {"since": 0})
+        assert response.status_code == status.HTTP_410_GONE
+        assert self.get_changes(api_client, since=last)["changes"] == []
+
+    @pytest.mark.parametrize(
+        "params", [{"since": "abc"}, {"since": -1}, {"limit": 0}, {"wait": "nan"}]
+    )
+    def test_invalid_params(self, api_client, params):
+        """
+        Тест некорректных параметров.
+
+        Проверяет ответ 400 Bad Request с ошибкой по параметру.
+        """
+        response = api_client.get(self.url, params)
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert set(response.json()) == set(params)
@@ -0,0 +1,130 @@
+import json
+from io import StringIO
+from unittest import mock
+
+import pytest
+from django.core.management import CommandError, call_command
+
+from tasks.management.commands.import_tasks import \
+    Command as ImportTasksCommand
+from tasks.models import Task
+
+
+@pytest.mark.django_db
+class TestImportTasksCommand:
+    """
+    Тесты management-команды import_tasks.
+
+    Класс содержит тесты потокового импорта из NDJSON и CSV,
+    обработки невалидных строк и продолжения по контрольной точке.
+    """
+
+    def write_ndjson(self, path, rows):
+        path.write_text(
+            "\n".join(json.dumps(row, ensure_ascii=False) for row in rows),
+            encoding="utf-8",
+        )
+        return path
+
+    def test_import_ndjson(self, tmp_path):
+        """
+        Тест импорта задач из NDJSON пачками.
+
+        Проверяет:
+        - Создание всех задач
+        - Сохранение UUID из файла
+        - Удаление файла контрольной точки после успешного импорта
+        """
+        rows = [{"title": f"Задача {i}", "status": "underway"} for i in range(5)]
+        rows[0]["uuid"] = "12345678-1234-1234-1234-123456789012"
+        path = self.write_ndjson(tmp_path / "tasks.ndjson", rows)
+
+        call_command("import_tasks", str(path), batch_size=2, stdout=StringIO())
+
+        assert Task.objects.count() == 5
+        assert Task.objects.filter(uuid=rows[0]["uuid"]).exists()
+        assert not (tmp_path / "tasks.ndjson.progress").exists()
+
+    def test_import_csv(self, tmp_path):
+        """
+        Тест импорта задач из CSV.
+
+        Проверяет, что пустое описание сохраняется как None.
+        """
+        path = tmp_path / "tasks.csv"
+        path.write_text(
+            "title,description,status\nЗадача,,created\nЗадача 2,Описание,completed\n",
+            encoding="utf-8",
+        )
+
+        call_command("import_tasks", str(path), stdout=StringIO())
+
+        assert Task.objects.get(title="Задача").description is None
+        assert Task.objects.get(title="Задача 2").status == "completed"
+
+    def test_import_invalid_row(self, tmp_path):
+        """
+        Тест остановки импорта на невалидной строке.
+
+        Проверяет, что предыдущие пачки сохранены, а контрольная точка
+        указывает на последнюю зафиксированную строку.
+        """
+        rows = [{"title": "Задача 1"}, {"title": "Задача 2"}, {"status": "invalid"}]
+        path = self.write_ndjson(tmp_path / "tasks.ndjson", rows)
+
+        with pytest.raises(CommandError, match="Строка 3"):
+            call_command("import_tasks", str(path), batch_size=2, stdout=StringIO())
+
+        assert Task.objects.count() == 2
+        assert (tmp_path / "tasks.ndjson.progress").read_text() == "2"
+
+    def test_import_resume_from_checkpoint(self, tmp_path):
+        """
+        Тест продолжения импорта по контрольной точке.
+
+        Проверяет, что уже импортированные строки пропускаются.
+        """
+        rows = [{"title": f"Задача {i}"} for i in range(4)]
+        path = self.write_ndjson(tmp_path / "tasks.ndjson", rows)
+        (tmp_path / "tasks.ndjson.progress").write_text("3")
+
+        call_command("import_tasks", str(path), stdout=StringIO())
+
+        assert list(Task.objects.values_list("title", flat=True)) == ["Задача 3"]
+
+    def test_import_skip_invalid(self, tmp_path):
+        """
+        Тест импорта с пропуском невалидных строк.
+
+        Проверяет, что валидные строки той же пачки импортируются.
+        """
+        rows = [{"title": "Задача 1"}, {"title": ""}, {"title": "Задача 3"}]
+        path = self.write_ndjson(tmp_path / "tasks.ndjson", rows)
+
+        call_command("import_tasks", str(path), skip_invalid=True, stdout=StringIO())
+
+        assert Task.objects.count() == 2
+
+    def test_copy_batch(self):
+        """
+        Тест записи пачки через COPY.
+
+        COPY доступен только на PostgreSQL, поэтому курсор подменяется.
+        Проверяет, что строки получают разные возрастающие created_at
+        (в том числе между пачками) и переносятся из временной таблицы
+        INSERT ... ON CONFLICT DO NOTHING.
+        """
+        command = ImportTasksCommand()
+        batches = [[Task(title=f"Задача {i}") for i in range(3)] for _ in range(2)]
+
+        with mock.patch(
+            "tasks.management.commands.import_tasks.connection.cursor"
+        ) as cursor:
+            for batch in batches:
+                command.copy_batch(batch)
+
+        created = [task.created_at for batch in batches for task in batch]
+        assert created == sorted(set(created))
+        sql = [call.args[0] for call in cursor().__enter__().execute.call_args_list]
+        assert sql[0].startswith("CREATE TEMPORARY TABLE tasks_task_import")
+        assert sql[1].endswith("ON CONFLICT DO NOTHING")
@@ -0,0 +1,217 @@
+import gzip
+import json
+from unittest import mock
+
+import brotli
+import pytest
+from django.http import StreamingHttpResponse
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.renderers import JSONRenderer
+from rest_framework.request import Request
+
+from tasks import renderers
+from tasks.conditional import get_not_modified_response
+from tasks.middleware import CompressionMiddleware, get_accepted_encoding
+from tasks.renderers import CompactJSONRenderer
+
+
+@pytest.mark.django_db
+class TestCompression:
+    """
+    Тесты сжатия ответов и компактного JSON-рендерера.
+
+    Класс содержит тесты выбора кодирования по Accept-Encoding,
+    порога размера, потоковых ответов и условных запросов
+    к сжатым ответам.
+    """
+
+    @pytest.fixture
+    def no_threshold(self, settings):
+        """Сжатие ответов любого размера"""
+        settings.TASKS_COMPRESSION_MIN_SIZE = 0
+
+    @pytest.mark.parametrize(
+        "header, expected",
+        [
+            ("gzip, deflate, br", "br"),
+            ("gzip", "gzip"),
+            ("br;q=0.5, gzip", "gzip"),
+            ("br;q=0, gzip;q=0", None),
+            ("*", "br"),
+            ("identity", None),
+            ("", None),
+        ],
+    )
+    def test_accepted_encoding(self, header, expected):
+        """
+        Тест выбора кодирования по заголовку Accept-Encoding.
+
+        Проверяет предпочтение brotli, учет q-значений и запрет кодирования.
+        """
+        assert get_accepted_encoding(header) == expected
+
+    @pytest.mark.parametrize(
+        "encoding, decompress",
+        [("br", brotli.decompress), ("gzip", gzip.decompress)],
+    )
+    def test_list_compressed(
+        self, api_client, no_threshold, multiple_tasks, encoding, decompress
+    ):
+        """
+        Тест сжатия списка задач.
+
+        Проверяет заголовки Content-Encoding, Vary и Content-Length
+        и то, что распакованное тело совпадает с несжатым ответом.
+        """
+        url = reverse("tasks:tasks_list")
+        plain = api_client.get(url)
+
+        response = api_client.get(url, HTTP_ACCEPT_ENCODING=encoding)
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response["Content-Encoding"] == encoding
+        assert "Accept-Encoding" in response["Vary"]
+        assert response["Content-Length"] == str(len(response.content))
+        assert response["ETag"] == f"W/{plain['ETag']}"
+        assert decompress(response.content) == plain.content
+
+    def test_small_response_not_compressed(self, api_client, task_object, settings):
+        """
+        Тест порога размера.
+
+        Проверяет, что ответ короче TASKS_COMPRESSION_MIN_SIZE не сжимается.
+        """
+        settings.TASKS_COMPRESSION_MIN_SIZE = 10000
+        url = reverse("tasks:task_detail", kwargs={"pk": task_object.uuid})
+
+        response = api_client.get(url, HTTP_ACCEPT_ENCODING="gzip, br")
+
+        assert not response.has_header("Content-Encoding")
+        assert response.json()["uuid"] == str(task_object.uuid)
+
+    def test_not_compressed_without_accept_encoding(
+        self, api_client, no_threshold, multiple_tasks
+    ):
+        """
+        Тест ответа клиенту без Accept-Encoding.
+
+        Проверяет, что ответ не сжат, но содержит Vary: Accept-Encoding
+        для кэширующих прокси.
+        """
+        response = api_client.get(reverse("tasks:tasks_list"))
+
+        assert not response.has_header("Content-Encoding")
+        assert "Accept-Encoding" in response["Vary"]
+        assert response.json()["count"] == len(multiple_tasks)
+
+    def test_streaming_export_compressed(
+        self, api_client, no_threshold, multiple_tasks
+    ):
+        """
+        Тест сжатия потоковой выгрузки задач brotli.
+
+        Проверяет, что поток сжимается целиком и Content-Length не задан.
+        """
+        response = api_client.get(
+            reverse("tasks:task_export"), HTTP_ACCEPT_ENCODING="br"
+        )
+
+        assert response["Content-Encoding"] == "br"
+        assert not response.has_header("Content-Length")
+        body = brotli.decompress(b"".join(response.streaming_content))
+        assert body.count(b'"uuid"') == len(multiple_tasks)
+
+    def test_event_stream_not_compressed(self, rf, no_threshold):
+        """
+        Тест пропуска text/event-stream.
+
+        Проверяет, что поток событий отдается без сжатия.
+        """
+        response = StreamingHttpResponse(
+            iter([b"data: 1\n\n"]), content_type="text/event-stream"
+        )
+        middleware = CompressionMiddleware(lambda request: response)
+
+        result = middleware(rf.get("/", HTTP_ACCEPT_ENCODING="br"))
+
+        assert not result.has_header("Content-Encoding")
+        assert b"".join(result.streaming_content) == b"data: 1\n\n"
+
+    def test_if_match_weak_etag(self, api_client, no_threshold, task_object):
+        """
+        Тест обновления с ETag сжатого ответа.
+
+        Проверяет, что слабый ETag версии задачи принимается в If-Match,
+        а устаревший отклоняется с 412 Precondition Failed.
+        """
+        # GZipMiddleware добавляет до 100 случайных байт (защита от BREACH),
+        # поэтому короткое описание могло бы остаться несжатым.
+        task_object.description = "Описание задачи " * 20
+        task_object.save()
+        detail_url = reverse("tasks:task_detail", kwargs={"pk": task_object.uuid})
+        update_url = reverse("tasks:task_update", kwargs={"pk": task_object.uuid})
+        etag = api_client.get(detail_url, HTTP_ACCEPT_ENCODING="gzip")["ETag"]
+        assert etag.startswith("W/")
+
+        response = api_client.patch(
+            update_url, {"title": "Первое"}, format="json", HTTP_IF_MATCH=etag
+        )
+        stale_response = api_client.patch(
+            update_url, {"title": "Второе"}, format="json", HTTP_IF_MATCH=etag
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        assert stale_response.status_code == status.HTTP_412_PRECONDITION_FAILED
+
+    @pytest.mark.parametrize("wrap", [False, True])
+    def test_weak_if_match_keeps_request(self, rf, wrap):
+        """
+        Тест проверки слабого ETag в If-Match.
+
+        Проверяет, что ETag версии принимается, а заголовок If-Match
+        в request.META (и в DRF Request) остается исходным.
+        """
+        request = rf.patch("/", HTTP_IF_MATCH='W/"3"')
+        if wrap:
+            request = Request(request)
+
+        assert get_not_modified_response(request, '"3"') is None
+        assert get_not_modified_response(request, '"4"').status_code == 412
+        assert request.META["HTTP_IF_MATCH"] == 'W/"3"'
+
+    def test_compact_renderer(self, api_client, multiple_tasks):
+        """
+        Тест компактного JSON-рендерера.
+
+        Проверяет, что ответ без отступов совпадает с выводом JSONRenderer DRF,
+        а параметр indent в Accept игнорируется.
+        """
+        response = api_client.get(
+            reverse("tasks:tasks_list"), HTTP_ACCEPT="application/json; indent=4"
+        )
+
+        assert response["Content-Type"] == "application/json"
+        assert b"\n" not in response.content
+        data = json.loads(response.content)
+        assert CompactJSONRenderer().render(data) == JSONRenderer().render(data)
+
+    @pytest.mark.parametrize("use_orjson", [True, False])
+    def test_compact_renderer_line_separators(self, use_orjson):
+        """
+        Тест символов U+2028 и U+2029 в компактном JSON-рендерере.
+
+        Проверяет, что с orjson и без него они экранируются так же,
+        как в JSONRenderer DRF, а остальной Unicode не экранируется.
+        """
+        data = {"title": "Строка\u2028абзац\u2029конец", "tags": ["\u2028"]}
+
+        with mock.patch(
+            "tasks.renderers.orjson", renderers.orjson if use_orjson else None
+        ):
+            content = CompactJSONRenderer().render(data)
+
+        assert content == JSONRenderer().render(data)
+        assert b"\\u2028" in content and b"\\u2029" in content
+        assert "Строка".encode() in content
+        assert json.loads(content) == data
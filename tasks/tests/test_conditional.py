@@ -0,0 +1,90 @@
+import pytest
+from django.urls import reverse
+from rest_framework import status
+
+from tasks.cache import get_task_cache
+from tasks.models import Task
+
+
+@pytest.mark.django_db
+class TestConditionalGet:
+    """
+    Тесты условного GET (ETag / Last-Modified).
+
+    Класс содержит тесты заголовков валидаторов и ответов 304 Not Modified
+    для детальной информации о задаче и списка задач.
+    """
+
+    def test_detail_etag_not_modified(self, api_client, task_object):
+        """
+        Тест ответа 304 на If-None-Match для задачи.
+
+        Проверяет:
+        - Наличие ETag и Last-Modified в полном ответе
+        - Ответ 304 Not Modified без тела при совпадении ETag
+        """
+        url = reverse("tasks:task_detail", kwargs={"pk": task_object.uuid})
+        response = api_client.get(url)
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.has_header("Last-Modified")
+
+        not_modified = api_client.get(url, HTTP_IF_NONE_MATCH=response["ETag"])
+
+        assert not_modified.status_code == status.HTTP_304_NOT_MODIFIED
+        assert not_modified["ETag"] == response["ETag"]
+        assert not_modified.content == b""
+
+    def test_detail_not_modified_reads_only_validators(
+        self, api_client, task_object, django_assert_num_queries
+    ):
+        """
+        Тест проверки условия без загрузки всей строки задачи.
+
+        Проверяет, что при пустом кэше выполняется один запрос,
+        выбирающий только version и updated_at.
+        """
+        url = reverse("tasks:task_detail", kwargs={"pk": task_object.uuid})
+        etag = api_client.get(url)["ETag"]
+        api_client.get(url)
+        get_task_cache().clear()
+
+        with django_assert_num_queries(1) as captured:
+            response = api_client.get(url, HTTP_IF_NONE_MATCH=etag)
+
+        assert response.status_code == status.HTTP_304_NOT_MODIFIED
+        assert '"description"' not in captured.captured_queries[0]["sql"]
+
+    def test_detail_etag_changes_after_update(self, api_client, task_object):
+        """
+        Тест смены ETag после изменения задачи.
+
+        Проверяет, что старый ETag больше не дает 304 Not Modified.
+        """
+        url = reverse("tasks:task_detail", kwargs={"pk": task_object.uuid})
+        etag = api_client.get(url)["ETag"]
+
+        task_object.status = "completed"
+        task_object.save()
+        response = api_client.get(url, HTTP_IF_NONE_MATCH=etag)
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response["ETag"] != etag
+        assert response.data["status"] == "completed"
+
+    def test_list_etag_not_modified(self, api_client, multiple_tasks):
+        """
+        Тест ответа 304 для неизменившейся страницы списка.
+
+        Проверяет, что удаление задачи со страницы меняет ETag.
+        """
+        url = reverse("tasks:tasks_list")
+        etag = api_client.get(url)["ETag"]
+
+        not_modified = api_client.get(url, HTTP_IF_NONE_MATCH=etag)
+        Task.objects.filter(pk=multiple_tasks[0].pk).delete()
+        changed = api_client.get(url, HTTP_IF_NONE_MATCH=etag)
+
+        assert not_modified.status_code == status.HTTP_304_NOT_MODIFIED
+        assert changed.status_code == status.HTTP_200_OK
+        assert changed.data["count"] == 2
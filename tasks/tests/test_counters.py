@@ -0,0 +1,107 @@
+from io import StringIO
+
+import pytest
+from django.core.management import call_command
+from django.urls import reverse
+from rest_framework import status
+
+from tasks.models import Task, TaskStatusCounter
+
+
+@pytest.mark.django_db
+class TestTaskStatusCounters:
+    """
+    Тесты предрассчитанных счетчиков задач по статусам.
+
+    Класс содержит тесты endpoint сводки, инкрементального обновления
+    счетчиков через API и команды reconcile_task_counters.
+    """
+
+    def get_summary(self, api_client):
+        response = api_client.get(reverse("tasks:task_summary"))
+        assert response.status_code == status.HTTP_200_OK
+        return response.data
+
+    def test_summary_follows_single_task_changes(self, api_client, task_data):
+        """
+        Тест обновления счетчиков при создании, смене статуса и удалении.
+
+        Проверяет, что сводка меняется без пересчета по таблице задач.
+        """
+        response = api_client.post(reverse("tasks:task_create"), task_data)
+        pk = response.data["uuid"]
+        assert self.get_summary(api_client) == {
+            "created": 1,
+            "underway": 0,
+            "completed": 0,
+            "total": 1,
+        }
+
+        api_client.patch(
+            reverse("tasks:task_update", kwargs={"pk": pk}), {"status": "completed"}
+        )
+        api_client.patch(
+            reverse("tasks:task_update", kwargs={"pk": pk}), {"title": "Новое"}
+        )
+        summary = self.get_summary(api_client)
+        assert (summary["created"], summary["completed"]) == (0, 1)
+
+        api_client.delete(reverse("tasks:task_delete", kwargs={"pk": pk}))
+        assert self.get_summary(api_client)["total"] == 0
+
+    def test_summary_follows_bulk_operations(self, api_client, task_data):
+        """
+        Тест обновления счетчиков пакетными endpoints.
+
+        Проверяет bulk_create, bulk_update и пакетное удаление,
+        которые пишут в базу данных в обход save().
+        """
+        items = [task_data, {**task_data, "status": "underway"}, task_data]
+        response = api_client.post(
+            reverse("tasks:task_bulk_create"), items, format="json"
+        )
+        uuids = [task["uuid"] for task in response.data]
+        assert self.get_summary(api_client)["created"] == 2
+
+        api_client.patch(
+            reverse("tasks:task_bulk_update"),
+            [{"uuid": pk, "status": "completed"} for pk in uuids[:2]],
+            format="json",
+        )
+        assert self.get_summary(api_client) == {
+            "created": 1,
+            "underway": 0,
+            "completed": 2,
+            "total": 3,
+        }
+
+        api_client.post(
+            reverse("tasks:task_bulk_delete"), {"uuids": uuids[1:]}, format="json"
+        )
+        assert self.get_summary(api_client) == {
+            "created": 0,
+            "underway": 0,
+            "completed": 1,
+            "total": 1,
+        }
+
+    def test_reconcile_command_fixes_drift(self, api_client, multiple_tasks):
+        """
+        Тест команды reconcile_task_counters.
+
+        Проверяет, что после изменения задач в обход моделей
+        команда восстанавливает правильные значения счетчиков.
+        """
+        Task.objects.filter(status="created").update(status="completed")
+        TaskStatusCounter.objects.filter(status="underway").delete()
+        stdout = StringIO()
+
+        call_command("reconcile_task_counters", stdout=stdout)
+
+        assert self.get_summary(api_client) == {
+            "created": 0,
+            "underway": 1,
+            "completed": 2,
+            "total": 3,
+        }
+        assert "расхождение" in stdout.getvalue()
@@ -0,0 +1,193 @@
+import asyncio
+import json
+from unittest import mock
+
+import pytest
+from asgiref.sync import async_to_sync, sync_to_async
+from django.test import AsyncClient
+from django.urls import reverse
+from rest_framework import status
+
+from tasks.broker import TaskChangeBroker
+from tasks.models import Task, TaskChange
+
+
+def parse_events(body):
+    """Разбирает поток SSE на список (id, event, data)."""
+    events = []
+    for block in body.decode().split("\n\n"):
+        fields = dict(
+            line.split(": ", 1) for line in block.splitlines() if ": " in line
+        )
+        if "id" in fields:
+            events.append(
+                (int(fields["id"]), fields["event"], json.loads(fields["data"]))
+            )
+    return events
+
+
+async def read_content(content):
+    """Читает асинхронный поток ответа целиком."""
+    return b"".join([chunk async for chunk in content])
+
+
+@pytest.mark.django_db
+class TestTaskEvents:
+    """
+    Тесты потока событий изменения задач (Server-Sent Events) и брокера.
+
+    Класс содержит тесты дочитывания пропущенных событий по since
+    и Last-Event-ID, heartbeat, рассылки брокером новых изменений
+    и отключения отстающих подписчиков.
+    """
+
+    url = reverse("tasks:task_events")
+
+    @pytest.fixture
+    def short_stream(self, settings):
+        """Короткий поток с частым опросом журнала"""
+        settings.TASKS_EVENTS_MAX_DURATION = 0.1
+        settings.TASKS_EVENTS_HEARTBEAT = 0.02
+        settings.TASKS_CHANGES_POLL_INTERVAL = 0.01
+
+    def get(self, **kwargs):
+        """GET через AsyncClient: запрос проходит через ASGI-обработчик."""
+
+        async def request():
+            response = await AsyncClient().get(self.url, **kwargs)
+            if response.streaming:
+                response.body = await read_content(response.streaming_content)
+            return response
+
+        return async_to_sync(request)()
+
+    def read_stream(self, **kwargs):
+        response = self.get(**kwargs)
+        assert response.status_code == status.HTTP_200_OK
+        assert response["Content-Type"] == "text/event-stream"
+        return response.body
+
+    def test_backlog_since(self, short_stream, multiple_tasks):
+        """
+        Тест дочитывания изменений после since.
+
+        Проверяет id, тип и данные событий, строку retry и heartbeat.
+        """
+        seqs = list(TaskChange.objects.order_by("seq").values_list("seq", flat=True))
+
+        body = self.read_stream(data={"since": seqs[0]})
+
+        events = parse_events(body)
+        assert [seq for seq, _, _ in events] == seqs[1:]
+        assert {event for _, event, _ in events} == {"created"}
+        assert events[0][2]["task"]["title"] == multiple_tasks[1].title
+        assert body.startswith(b"retry: ")
+        assert b": keepalive\n\n" in body
+
+    def test_last_event_id(self, short_stream, multiple_tasks):
+        """
+        Тест переподключения с заголовком Last-Event-ID.
+
+        Проверяет, что отправляются только изменения после Last-Event-ID.
+        """
+        last = TaskChange.objects.order_by("seq").last().seq
+
+        body = self.read_stream(headers={"Last-Event-ID": str(last - 1)})
+
+        assert [seq for seq, _, _ in parse_events(body)] == [last]
+
+    def test_change_before_subscribe(self, short_stream, multiple_tasks):
+        """
+        Тест изменения между чтением журнала и подпиской на брокер.
+
+        Изменение уже не попадает ни в прочитанный журнал, ни в рассылку
+        брокера; проверяет, что оно дочитывается из журнала после подписки.
+        """
+        last = TaskChange.objects.order_by("seq").last().seq
+        subscribe = TaskChangeBroker.subscribe
+
+        async def create_and_subscribe(broker):
+            await sync_to_async(Task.objects.create)(title="Новая")
+            return await subscribe(broker)
+
+        with mock.patch.object(TaskChangeBroker, "subscribe", create_and_subscribe):
+            body = self.read_stream(headers={"Last-Event-ID": str(last)})
+
+        events = parse_events(body)
+        assert [(seq, event) for seq, event, _ in events] == [(last + 1, "created")]
+        assert events[0][2]["task"]["title"] == "Новая"
+
+    def test_without_since(self, short_stream, multiple_tasks):
+        """
+        Тест подключения без since.
+
+        Проверяет, что существующие изменения не отправляются.
+        """
+        assert parse_events(self.read_stream()) == []
+
+    def test_invalid_since(self):
+        """Тест некорректного Last-Event-ID: 400 Bad Request."""
+        response = self.get(headers={"Last-Event-ID": "abc"})
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+    def test_wsgi_not_supported(self, api_client):
+        """
+        Тест подключения через WSGI.
+
+        Проверяет, что вместо буферизованного потока возвращается 501.
+        """
+        response = api_client.get(self.url)
+
+        assert response.status_code == status.HTTP_501_NOT_IMPLEMENTED
+        assert "ASGI" in response.json()["detail"]
+
+    def test_broker_publishes_new_changes(self, short_stream):
+        """
+        Тест рассылки брокером.
+
+        Проверяет, что оба подписчика получают изменение, записанное
+        после подписки, а брокер останавливается без подписчиков.
+        """
+
+        async def scenario():
+            broker = TaskChangeBroker()
+            first, position = await broker.subscribe()
+            second, _ = await broker.subscribe()
+            task = await sync_to_async(Task.objects.create)(title="Новая")
+            changes = [
+                await asyncio.wait_for(queue.get(), 1) for queue in (first, second)
+            ]
+            broker.unsubscribe(first)
+            broker.unsubscribe(second)
+            await asyncio.wait_for(asyncio.shield(broker.task), 1)
+            return position, task, changes, broker
+
+        position, task, changes, broker = async_to_sync(scenario)()
+
+        for change in changes:
+            assert change["seq"] > position
+            assert (change["action"], change["uuid"]) == ("created", str(task.uuid))
+        assert broker.task is None
+
+    def test_slow_subscriber_disconnected(self):
+        """
+        Тест отставшего подписчика.
+
+        Проверяет, что при переполнении очереди подписчик получает None
+        и отключается от брокера.
+        """
+
+        async def scenario():
+            broker = TaskChangeBroker()
+            broker.position = 0
+            queue = asyncio.Queue(maxsize=2)
+            broker.subscribers.add(queue)
+            for seq in range(1, 4):
+                broker.publish({"seq": seq})
+            return broker, [queue.get_nowait() for _ in range(queue.qsize())]
+
+        broker, received = async_to_sync(scenario)()
+
+        assert received == [None]
+        assert not broker.subscribers
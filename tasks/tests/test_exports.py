@@ -0,0 +1,93 @@
+import csv
+import io
+import json
+import warnings
+
+import pytest
+from asgiref.sync import async_to_sync
+from django.test import AsyncClient
+from django.urls import reverse
+from rest_framework import status
+
+
+@pytest.mark.django_db
+class TestTaskExport:
+    """
+    Тесты потоковой выгрузки задач.
+
+    Класс содержит тесты выгрузки в NDJSON и CSV, фильтрации
+    и обработки неизвестного формата.
+    """
+
+    def get_content(self, response):
+        return b"".join(response.streaming_content).decode()
+
+    def test_export_ndjson(self, api_client, multiple_tasks):
+        """
+        Тест выгрузки задач в NDJSON.
+
+        Проверяет:
+        - Потоковый ответ с типом application/x-ndjson
+        - По одной задаче на строку со всеми полями
+        """
+        response = api_client.get(reverse("tasks:task_export"))
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.streaming
+        assert response["Content-Type"].startswith("application/x-ndjson")
+        tasks = [json.loads(line) for line in self.get_content(response).splitlines()]
+        assert sorted(task["title"] for task in tasks) == [
+            "Задача 1",
+            "Задача 2",
+            "Задача 3",
+        ]
+        assert "uuid" in tasks[0]
+
+    def test_export_csv_with_filter(self, api_client, multiple_tasks):
+        """
+        Тест выгрузки задач в CSV с фильтром по статусу.
+
+        Проверяет наличие заголовка и только отфильтрованные задачи.
+        """
+        response = api_client.get(
+            reverse("tasks:task_export"),
+            {"export_format": "csv", "status": "underway"},
+            HTTP_ACCEPT="text/csv",
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        rows = list(csv.DictReader(io.StringIO(self.get_content(response))))
+        assert [row["title"] for row in rows] == ["Задача 2"]
+
+    def test_export_asgi(self, multiple_tasks):
+        """
+        Тест выгрузки через ASGI.
+
+        Проверяет, что ответ строится из асинхронного итератора
+        (Django не читает выгрузку целиком до отправки) и содержит все задачи.
+        """
+
+        async def export():
+            response = await AsyncClient().get(reverse("tasks:task_export"))
+            chunks = [chunk async for chunk in response]
+            return response, b"".join(chunks).decode()
+
+        with warnings.catch_warnings():
+            warnings.simplefilter("error")
+            response, content = async_to_sync(export)()
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.is_async
+        assert len(content.splitlines()) == len(multiple_tasks)
+
+    def test_export_invalid_format(self, api_client):
+        """
+        Тест выгрузки в неизвестном формате.
+
+        Проверяет, что API возвращает ошибку 400 Bad Request.
+        """
+        response = api_client.get(
+            reverse("tasks:task_export"), {"export_format": "xml"}
+        )
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
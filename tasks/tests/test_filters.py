@@ -0,0 +1,228 @@
+import pytest
+from django.db import connection
+from django.urls import reverse
+from rest_framework import status
+
+from tasks.filters import TaskOrderingFilter
+from tasks.models import Task
+
+
+@pytest.mark.django_db
+class TestTaskFilters:
+    """
+    Тесты серверной фильтрации списка задач.
+
+    Класс содержит тесты фильтров по статусу и названию задачи.
+    """
+
+    @pytest.fixture
+    def filter_tasks(self):
+        """Задачи с разными статусами и названиями"""
+        return [
+            Task.objects.create(title="Отчет за май", status="created"),
+            Task.objects.create(title="Отчет за июнь", status="underway"),
+            Task.objects.create(title="Релиз", status="completed"),
+        ]
+
+    def get_titles(self, api_client, params):
+        response = api_client.get(reverse("tasks:tasks_list"), params)
+        assert response.status_code == status.HTTP_200_OK
+        return sorted(task["title"] for task in response.data["results"])
+
+    def test_filter_by_status(self, api_client, filter_tasks):
+        """
+        Тест фильтрации по одному и нескольким статусам.
+
+        Проверяет, что в выдаче остаются только задачи с указанными статусами.
+        """
+        assert self.get_titles(api_client, {"status": "completed"}) == ["Релиз"]
+        assert self.get_titles(api_client, {"status": "created,underway"}) == [
+            "Отчет за июнь",
+            "Отчет за май",
+        ]
+
+    def test_filter_open_tasks(self, api_client, filter_tasks):
+        """
+        Тест выборки открытых задач через exclude_status=completed.
+
+        Проверяет, что завершенные задачи исключаются из выдачи.
+        """
+        titles = self.get_titles(api_client, {"exclude_status": "completed"})
+
+        assert titles == ["Отчет за июнь", "Отчет за май"]
+
+    def test_filter_by_title(self, api_client, filter_tasks):
+        """
+        Тест фильтрации по префиксу и вхождению подстроки в название.
+
+        Проверяет, что title_prefix учитывает начало строки,
+        а title_contains ищет подстроку в любом месте названия.
+        """
+        assert self.get_titles(api_client, {"title_prefix": "Рел"}) == ["Релиз"]
+        assert self.get_titles(api_client, {"title_contains": "июн"}) == [
+            "Отчет за июнь"
+        ]
+        assert self.get_titles(api_client, {"title_prefix": "июн"}) == []
+
+    def test_filter_invalid_status(self, api_client, filter_tasks):
+        """
+        Тест фильтрации по недопустимому статусу.
+
+        Проверяет, что API возвращает ошибку 400 Bad Request.
+        """
+        response = api_client.get(
+            reverse("tasks:tasks_list"), {"status": "invalid_status"}
+        )
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert "status" in response.data
+
+
+@pytest.mark.django_db
+class TestTaskOrdering:
+    """
+    Тесты сортировки списка задач параметром ordering.
+
+    Класс содержит тесты допустимых значений сортировки, порядка
+    по умолчанию и использования индексов для каждой сортировки.
+    """
+
+    @pytest.fixture
+    def ordering_tasks(self):
+        """Задачи с разными названиями и статусами"""
+        return [
+            Task.objects.create(title="Бета", status="underway"),
+            Task.objects.create(title="Альфа", status="completed"),
+            Task.objects.create(title="Гамма", status="created"),
+            Task.objects.create(title="Альфа", status="created"),
+        ]
+
+    def get_titles(self, api_client, url_name, params):
+        response = api_client.get(reverse(url_name), {"page_size": 10, **params})
+        assert response.status_code == status.HTTP_200_OK
+        return [task["title"] for task in response.json()["results"]]
+
+    @pytest.mark.parametrize("url_name", ["tasks:tasks_list", "tasks:async_tasks_list"])
+    def test_ordering(self, api_client, ordering_tasks, url_name):
+        """
+        Тест сортировки по названию, статусу и дате создания.
+
+        Проверяет, что синхронный и асинхронный список сортируются
+        одинаково, а по умолчанию новые задачи идут первыми.
+        """
+        assert self.get_titles(api_client, url_name, {"ordering": "title"}) == [
+            "Альфа",
+            "Альфа",
+            "Бета",
+            "Гамма",
+        ]
+        assert self.get_titles(api_client, url_name, {"ordering": "-title"}) == [
+            "Гамма",
+            "Бета",
+            "Альфа",
+            "Альфа",
+        ]
+        titles = self.get_titles(api_client, url_name, {"ordering": "status"})
+        assert (titles[0], titles[3]) == ("Альфа", "Бета")
+        assert self.get_titles(api_client, url_name, {}) == [
+            "Альфа",
+            "Гамма",
+            "Альфа",
+            "Бета",
+        ]
+        assert self.get_titles(api_client, url_name, {"ordering": "created_at"}) == [
+            "Бета",
+            "Альфа",
+            "Гамма",
+            "Альфа",
+        ]
+
+    def test_ordering_ties_are_deterministic(self, api_client, ordering_tasks):
+        """
+        Тест однозначного порядка задач с одинаковым названием.
+
+        Проверяет, что при равных названиях задачи упорядочены по uuid,
+        и страницы не повторяют и не пропускают задачи.
+        """
+        url = reverse("tasks:tasks_list")
+        uuids = [
+            task["uuid"]
+            for page in (1, 2)
+            for task in api_client.get(
+                url, {"ordering": "title", "page_size": 2, "page": page}
+            ).data["results"]
+        ]
+
+        duplicates = sorted(str(task.uuid) for task in ordering_tasks[1::2])
+        assert uuids[:2] == duplicates
+        assert len(set(uuids)) == 4
+
+    @pytest.mark.parametrize("ordering", list(TaskOrderingFilter.ORDERINGS))
+    def test_cursor_pagination_walk(self, api_client, ordering):
+        """
+        Тест курсорной пагинации с сортировкой по полю с повторами.
+
+        Задач с одинаковым статусом и названием больше, чем на странице.
+        Проверяет, что переход по next проходит все задачи в порядке
+        сортировки без повторов, а переход по previous с последней
+        страницы - в обратном порядке.
+        """
+        Task.objects.bulk_create(
+            Task(title=f"Задача {i % 2}", status=Task.STATUS_CHOICES[i % 3][0])
+            for i in range(20)
+        )
+        expected = [
+            str(uuid)
+            for uuid in Task.objects.order_by(
+                *TaskOrderingFilter.ORDERINGS[ordering]
+            ).values_list("uuid", flat=True)
+        ]
+        response = api_client.get(
+            reverse("tasks:tasks_list"),
+            {"pagination": "cursor", "ordering": ordering, "page_size": 3},
+        )
+
+        forward = [task["uuid"] for task in response.data["results"]]
+        for _ in range(len(expected)):
+            if response.data["next"] is None:
+                break
+            response = api_client.get(response.data["next"])
+            forward += [task["uuid"] for task in response.data["results"]]
+        last_page = len(response.data["results"])
+        backward = []
+        for _ in range(len(expected)):
+            if response.data["previous"] is None:
+                break
+            response = api_client.get(response.data["previous"])
+            backward = [task["uuid"] for task in response.data["results"]] + backward
+
+        assert forward == expected
+        assert backward == expected[:-last_page]
+
+    def test_invalid_ordering(self, api_client, ordering_tasks):
+        """
+        Тест сортировки по полю не из белого списка.
+
+        Проверяет, что API возвращает ошибку 400 Bad Request.
+        """
+        response = api_client.get(
+            reverse("tasks:tasks_list"), {"ordering": "description"}
+        )
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert "ordering" in response.data
+
+    @pytest.mark.skipif(
+        connection.vendor != "sqlite", reason="План запроса проверяется на SQLite"
+    )
+    def test_ordering_uses_index(self):
+        """
+        Тест использования индекса для каждой сортировки.
+
+        Проверяет, что план запроса страницы не содержит сортировки
+        во временном B-дереве, то есть порядок берется из индекса.
+        """
+        for ordering in TaskOrderingFilter.ORDERINGS.values():
+            plan = Task.objects.order_by(*ordering)[:10].explain()
+            assert "USING INDEX" in plan
+            assert "TEMP B-TREE" not in plan
@@ -0,0 +1,171 @@
+from datetime import timedelta
+from io import StringIO
+from unittest import mock
+
+import pytest
+from django.core.management import call_command
+from django.db import IntegrityError
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework import status
+
+from tasks.models import Task, TaskIdempotencyKey
+
+
+@pytest.mark.django_db
+class TestIdempotencyKey:
+    """
+    Тесты заголовка Idempotency-Key для создания и обновления задач.
+
+    Класс содержит тесты повтора запроса без повторной записи,
+    повторного использования ключа с другим телом, несохраняемых
+    ошибок, срока хранения и параллельного повтора.
+    """
+
+    url = reverse("tasks:task_create")
+
+    def post(self, api_client, data, key="key-1"):
+        return api_client.post(self.url, data, format="json", HTTP_IDEMPOTENCY_KEY=key)
+
+    def test_create_replayed(self, api_client, task_data):
+        """
+        Тест повтора создания с тем же ключом.
+
+        Проверяет, что задача создается один раз, а повтор возвращает
+        тот же ответ с заголовком Idempotent-Replayed.
+        """
+        first = self.post(api_client, task_data)
+        second = self.post(api_client, task_data)
+
+        assert first.status_code == second.status_code == status.HTTP_201_CREATED
+        assert second.json() == first.json()
+        assert second["Idempotent-Replayed"] == "true"
+        assert "Idempotent-Replayed" not in first
+        assert Task.objects.count() == 1
+
+    def test_different_keys(self, api_client, task_data):
+        """Тест разных ключей: создаются разные задачи."""
+        self.post(api_client, task_data, key="key-1")
+        self.post(api_client, task_data, key="key-2")
+
+        assert Task.objects.count() == 2
+
+    def test_without_key(self, api_client, task_data):
+        """Тест запроса без ключа: ответ не сохраняется."""
+        api_client.post(self.url, task_data, format="json")
+
+        assert not TaskIdempotencyKey.objects.exists()
+
+    def test_key_reused_with_other_body(self, api_client, task_data):
+        """Тест повторного использования ключа с другим телом: 422."""
+        self.post(api_client, task_data)
+
+        response = self.post(api_client, {**task_data, "title": "Другая"})
+
+        assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+        assert Task.objects.count() == 1
+
+    def test_error_not_stored(self, api_client, task_data):
+        """
+        Тест ответа с ошибкой валидации.
+
+        Проверяет, что ошибка не сохраняется и исправленный повтор
+        с тем же ключом создает задачу.
+        """
+        invalid = self.post(api_client, {"title": ""})
+        assert invalid.status_code == status.HTTP_400_BAD_REQUEST
+        assert not TaskIdempotencyKey.objects.exists()
+
+        response = self.post(api_client, task_data)
+        assert response.status_code == status.HTTP_201_CREATED
+        assert Task.objects.count() == 1
+
+    def test_update_replayed(self, api_client, task_object):
+        """
+        Тест повтора обновления.
+
+        Проверяет, что версия увеличивается один раз, а повтор возвращает
+        прежний ETag.
+        """
+        url = reverse("tasks:task_update", kwargs={"pk": task_object.pk})
+
+        responses = [
+            api_client.patch(
+                url, {"status": "completed"}, format="json", HTTP_IDEMPOTENCY_KEY="k"
+            )
+            for _ in range(2)
+        ]
+
+        task_object.refresh_from_db()
+        assert task_object.version == 2
+        assert responses[0]["ETag"] == responses[1]["ETag"] == '"2"'
+        assert responses[1].json() == responses[0].json()
+
+    def test_scope_by_path(self, api_client, task_data, task_object):
+        """Тест одного ключа для разных endpoints: ключи не пересекаются."""
+        self.post(api_client, task_data, key="k")
+        response = api_client.patch(
+            reverse("tasks:task_update", kwargs={"pk": task_object.pk}),
+            {"title": "Новое"},
+            format="json",
+            HTTP_IDEMPOTENCY_KEY="k",
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        assert "Idempotent-Replayed" not in response
+
+    def test_expired_key(self, api_client, task_data, settings):
+        """
+        Тест просроченного ключа.
+
+        Проверяет, что после TASKS_IDEMPOTENCY_TTL запрос выполняется
+        заново, а prune_idempotency_keys удаляет просроченные ключи.
+        """
+        settings.TASKS_IDEMPOTENCY_TTL = 60
+        self.post(api_client, task_data)
+        TaskIdempotencyKey.objects.update(
+            created_at=timezone.now() - timedelta(seconds=61)
+        )
+
+        response = self.post(api_client, task_data)
+
+        assert "Idempotent-Replayed" not in response
+        assert Task.objects.count() == 2
+        TaskIdempotencyKey.objects.update(
+            created_at=timezone.now() - timedelta(seconds=61)
+        )
+        out = StringIO()
+        call_command("prune_idempotency_keys", stdout=out)
+        assert "Удалено ключей: 1" in out.getvalue()
+
+    def test_concurrent_duplicate(self, api_client, task_data):
+        """
+        Тест параллельного повтора.
+
+        Имитирует запрос, зафиксировавший ключ между проверкой и записью:
+        задача текущего запроса откатывается, возвращается ответ первого.
+        """
+        first = self.post(api_client, task_data)
+        stored = TaskIdempotencyKey.objects.get()
+        lookups = iter([None, stored])
+
+        with mock.patch(
+            "tasks.idempotency.TaskIdempotencyKey.objects.filter"
+        ) as filter_keys, mock.patch(
+            "tasks.idempotency.TaskIdempotencyKey.objects.create",
+            side_effect=IntegrityError,
+        ):
+            filter_keys.return_value.first.side_effect = lambda: next(lookups)
+            response = self.post(api_client, task_data)
+
+        assert response["Idempotent-Replayed"] == "true"
+        assert response.json() == first.json()
+        assert Task.objects.count() == 1
+
+    @pytest.mark.parametrize("key", ["", "x" * 256])
+    def test_invalid_key(self, api_client, task_data, key):
+        """Тест пустого или слишком длинного ключа: 400 Bad Request."""
+        response = self.post(api_client, task_data, key=key)
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert "Idempotency-Key" in response.json()
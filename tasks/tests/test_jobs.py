@@ -0,0 +1,245 @@
+import json
+from datetime import timedelta
+from io import StringIO
+from unittest import mock
+
+import pytest
+from asgiref.sync import async_to_sync
+from django.core.management import call_command
+from django.test import AsyncClient
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework import status
+
+from tasks.counters import get_status_summary
+from tasks.jobs import claim_job, enqueue_job, work
+from tasks.models import Task, TaskChange, TaskJob
+
+
+@pytest.mark.django_db
+class TestTaskJobs:
+    """
+    Тесты фоновых заданий: очереди TaskJob, endpoints jobs/ и
+    команды run_task_worker.
+
+    Класс содержит тесты постановки в очередь и проверки параметров,
+    выполнения смены статуса, выгрузки и удаления завершенных задач
+    пачками, повторного запуска прерванных заданий и обработки ошибок.
+    """
+
+    url = reverse("tasks:task_job_create")
+
+    @pytest.fixture(autouse=True)
+    def job_settings(self, settings, tmp_path):
+        """Маленькие пачки и временный каталог выгрузки"""
+        settings.TASKS_BULK_BATCH_SIZE = 2
+        settings.TASKS_JOBS_EXPORT_DIR = tmp_path
+
+    def run_worker(self):
+        out = StringIO()
+        call_command("run_task_worker", once=True, stdout=out)
+        return out.getvalue()
+
+    def test_enqueue(self, api_client):
+        """
+        Тест постановки задания в очередь.
+
+        Проверяет ответ 202 Accepted, ссылку на статус в Location
+        и состояние queued в endpoint статуса.
+        """
+        response = api_client.post(
+            self.url,
+            {"kind": "bulk_status", "params": {"status": "completed"}},
+            format="json",
+        )
+
+        assert response.status_code == status.HTTP_202_ACCEPTED
+        job = api_client.get(response["Location"]).json()
+        assert job["uuid"] == response.json()["uuid"]
+        assert job["status"] == "queued"
+        assert job["params"] == {"status": "completed", "filters": {}}
+        assert job["progress"] == 0
+
+    @pytest.mark.parametrize(
+        "data, field",
+        [
+            ({"kind": "unknown"}, "kind"),
+            ({"kind": "bulk_status", "params": {"status": "done"}}, "params"),
+            ({"kind": "export", "params": {"export_format": "xml"}}, "params"),
+            ({"kind": "export", "params": {"filters": {"order": "x"}}}, "params"),
+            ({"kind": "purge_completed", "params": {"before": "вчера"}}, "params"),
+        ],
+    )
+    def test_invalid_job(self, api_client, data, field):
+        """Тест неизвестного типа или невалидных параметров: 400 Bad Request."""
+        response = api_client.post(self.url, data, format="json")
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert field in response.json()
+        assert not TaskJob.objects.exists()
+
+    def test_bulk_status(self, multiple_tasks):
+        """
+        Тест задания смены статуса.
+
+        Проверяет, что меняются только задачи под фильтром, пачками
+        по TASKS_BULK_BATCH_SIZE, со счетчиками и журналом изменений.
+        """
+        Task.objects.create(title="Другая")
+        job = enqueue_job(
+            "bulk_status",
+            {"status": "completed", "filters": {"title_prefix": "Задача"}},
+        )
+
+        out = self.run_worker()
+
+        job.refresh_from_db()
+        assert job.status == "succeeded"
+        assert job.result == {"updated": 3}
+        assert job.progress == 3
+        assert "Выполнено заданий: 1" in out
+        assert set(
+            Task.objects.filter(title__startswith="Задача").values_list(
+                "status", flat=True
+            )
+        ) == {"completed"}
+        assert Task.objects.get(title="Другая").status == "created"
+        assert get_status_summary()["completed"] == 3
+        assert TaskChange.objects.filter(action="updated").count() == 3
+
+    @pytest.mark.parametrize("export_format", ["ndjson", "csv"])
+    def test_export(self, api_client, multiple_tasks, export_format):
+        """
+        Тест задания выгрузки.
+
+        Проверяет результат задания и скачивание файла через
+        jobs/<uuid>/download/.
+        """
+        job = enqueue_job("export", {"export_format": export_format})
+        self.run_worker()
+        job.refresh_from_db()
+
+        response = api_client.get(
+            reverse("tasks:task_job_download", kwargs={"pk": job.pk})
+        )
+
+        assert job.result["rows"] == 3
+        assert response.status_code == status.HTTP_200_OK
+        lines = b"".join(response.streaming_content).decode().splitlines()
+        if export_format == "csv":
+            assert lines[0].startswith("uuid,title")
+            lines = lines[1:]
+        else:
+            lines = [json.loads(line)["title"] for line in lines]
+        assert len(lines) == 3
+
+    def test_download_asgi(self, multiple_tasks):
+        """
+        Тест скачивания выгрузки через ASGI.
+
+        Проверяет, что файл отдается асинхронным итератором, а заголовки
+        Content-Length и Content-Disposition сохраняются.
+        """
+        job = enqueue_job("export", {})
+        self.run_worker()
+        url = reverse("tasks:task_job_download", kwargs={"pk": job.pk})
+
+        async def download():
+            response = await AsyncClient().get(url)
+            return response, b"".join([chunk async for chunk in response])
+
+        response, content = async_to_sync(download)()
+
+        assert response.is_async
+        assert int(response["Content-Length"]) == len(content)
+        assert "tasks.ndjson" in response["Content-Disposition"]
+        assert len(content.decode().splitlines()) == len(multiple_tasks)
+
+    def test_download_not_ready(self, api_client):
+        """Тест скачивания невыполненной выгрузки: 404 Not Found."""
+        job = enqueue_job("export", {})
+
+        response = api_client.get(
+            reverse("tasks:task_job_download", kwargs={"pk": job.pk})
+        )
+
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+
+    def test_purge_completed(self, multiple_tasks):
+        """
+        Тест задания удаления завершенных задач.
+
+        Проверяет, что удаляются только завершенные задачи, измененные
+        до before, а счетчики уменьшаются.
+        """
+        Task.objects.update(status="completed")
+        call_command("reconcile_task_counters", stdout=StringIO())
+        Task.objects.filter(pk=multiple_tasks[0].pk).update(
+            updated_at=timezone.now() + timedelta(days=1)
+        )
+        job = enqueue_job("purge_completed", {"before": timezone.now().isoformat()})
+
+        self.run_worker()
+
+        job.refresh_from_db()
+        assert job.result == {"deleted": 2}
+        assert list(Task.objects.values_list("pk", flat=True)) == [multiple_tasks[0].pk]
+        assert get_status_summary()["completed"] == 1
+
+    def test_claim_order_and_stale(self, settings):
+        """
+        Тест выбора задания из очереди.
+
+        Проверяет, что задания забираются по порядку постановки,
+        running-задание без heartbeat забирается повторно, а после
+        TASKS_JOBS_MAX_ATTEMPTS запусков завершается с ошибкой.
+        """
+        settings.TASKS_JOBS_MAX_ATTEMPTS = 2
+        first = enqueue_job("export", {})
+        second = enqueue_job("export", {})
+
+        assert claim_job().pk == first.pk
+        assert claim_job().pk == second.pk
+        assert claim_job() is None
+
+        stale = timezone.now() - timedelta(hours=1)
+        TaskJob.objects.filter(pk=first.pk).update(heartbeat_at=stale)
+        reclaimed = claim_job()
+        assert (reclaimed.pk, reclaimed.attempts) == (first.pk, 2)
+
+        TaskJob.objects.filter(pk=first.pk).update(heartbeat_at=stale)
+        assert claim_job() is None
+        first.refresh_from_db()
+        assert first.status == "failed"
+
+    def test_failed_job(self):
+        """Тест ошибки выполнения: задание failed с текстом ошибки."""
+        job = enqueue_job("export", {})
+
+        with mock.patch.dict(
+            "tasks.jobs.JOB_KINDS",
+            {"export": (None, mock.Mock(side_effect=OSError("Нет места")))},
+        ):
+            self.run_worker()
+
+        job.refresh_from_db()
+        assert job.status == "failed"
+        assert job.error == "Нет места"
+        assert job.finished_at is not None
+
+    def test_work_loop(self, multiple_tasks):
+        """
+        Тест цикла воркера.
+
+        Проверяет, что цикл выполняет задание, ждет poll_interval
+        при пустой очереди и завершается по сигналу остановки.
+        """
+        job = enqueue_job("bulk_status", {"status": "underway"})
+        stop = mock.Mock()
+        stop.is_set.side_effect = [False, False, True]
+
+        work(stop, 0.5)
+
+        job.refresh_from_db()
+        assert job.status == "succeeded"
+        stop.wait.assert_called_once_with(0.5)
@@ -0,0 +1,106 @@
+import json
+
+import pytest
+from django.urls import reverse
+from rest_framework import status
+
+from tasks.metrics import DURATION_BUCKETS, reset_metrics
+
+
+@pytest.mark.django_db
+class TestTaskMetrics:
+    """
+    Тесты middleware метрик запросов.
+
+    Класс содержит тесты заголовка Server-Timing, endpoint метрик
+    в формате Prometheus и отключения middleware настройкой.
+    """
+
+    @pytest.fixture
+    def metrics_enabled(self, settings):
+        """Включенный сбор метрик с пустыми агрегатами"""
+        settings.TASKS_METRICS_ENABLED = True
+        reset_metrics()
+        yield
+        reset_metrics()
+
+    def test_server_timing_header(self, api_client, metrics_enabled, multiple_tasks):
+        """
+        Тест заголовка Server-Timing.
+
+        Проверяет, что ответ содержит время в базе данных с количеством
+        SQL-запросов, время рендеринга и полную длительность.
+        """
+        response = api_client.get(reverse("tasks:tasks_list"))
+
+        assert response.status_code == status.HTTP_200_OK
+        timing = response["Server-Timing"]
+        assert 'desc="2 queries"' in timing
+        assert "render;dur=" in timing
+        assert "total;dur=" in timing
+
+    def test_prometheus_endpoint(self, api_client, metrics_enabled, multiple_tasks):
+        """
+        Тест агрегированных метрик в формате Prometheus.
+
+        Проверяет счетчики запросов, SQL-запросов и гистограмму
+        длительности по имени view и методу.
+        """
+        api_client.get(reverse("tasks:tasks_list"))
+        api_client.get(reverse("tasks:tasks_list"))
+
+        response = api_client.get(reverse("tasks:task_metrics"))
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response["Content-Type"].startswith("text/plain; version=0.0.4")
+        body = response.content.decode()
+        labels = 'view="tasks:tasks_list",method="GET"'
+        assert f"tasks_http_requests_total{{{labels}}} 2" in body
+        assert f"tasks_db_queries_total{{{labels}}} 4" in body
+        assert (
+            f'tasks_http_request_duration_seconds_bucket{{{labels},le="+Inf"}} 2'
+            in body
+        )
+        assert "# TYPE tasks_http_request_duration_seconds histogram" in body
+
+    def test_prometheus_across_processes(
+        self, api_client, metrics_enabled, multiple_tasks, settings, tmp_path
+    ):
+        """
+        Тест суммирования метрик процессов через TASKS_METRICS_DIR.
+
+        Имитирует файл агрегатов другого процесса gunicorn и проверяет,
+        что endpoint возвращает сумму по процессам, а агрегаты текущего
+        процесса записываются в свой файл.
+        """
+        settings.TASKS_METRICS_DIR = str(tmp_path)
+        other = {
+            "requests": 3,
+            "duration": 0.3,
+            "queries": 6,
+            "db_time": 0.01,
+            "render_time": 0.02,
+            "buckets": [3] + [0] * len(DURATION_BUCKETS),
+        }
+        (tmp_path / "1-1.json").write_text(
+            json.dumps([["tasks:tasks_list", "GET", other]])
+        )
+        api_client.get(reverse("tasks:tasks_list"))
+
+        body = api_client.get(reverse("tasks:task_metrics")).content.decode()
+
+        labels = 'view="tasks:tasks_list",method="GET"'
+        assert f"tasks_http_requests_total{{{labels}}} 4" in body
+        assert f"tasks_db_queries_total{{{labels}}} 8" in body
+        assert len(list(tmp_path.glob("*.json"))) == 2
+
+    def test_disabled_by_default(self, api_client, multiple_tasks):
+        """
+        Тест выключенного сбора метрик.
+
+        Проверяет, что без TASKS_METRICS_ENABLED middleware не подключается
+        и заголовок Server-Timing не добавляется.
+        """
+        response = api_client.get(reverse("tasks:tasks_list"))
+
+        assert "Server-Timing" not in response
@@ -1,5 +1,9 @@
+from base64 import b64encode
+from urllib.parse import urlencode
+
 import pytest
 from django.urls import reverse
+from django.utils import timezone
 from rest_framework import status
 
 from tasks.models import Task
@@ -56,3 +60,161 @@ class TestTaskPagination:
         assert len(response.data["results"]) == 0
         assert response.data["next"] is None
         assert response.data["previous"] is None
+
+    def test_cursor_pagination(self, api_client):
+        """
+        Тест курсорной пагинации по параметру pagination=cursor.
+
+        Проверяет:
+        - Отсутствие поля count (COUNT(*) не выполняется)
+        - Порядок от новых задач к старым
+        - Переход по ссылке next без пропусков и повторов
+        """
+        for i in range(7):
+            Task.objects.create(title=f"Задача {i + 1}", status="created")
+
+        url = reverse("tasks:tasks_list")
+        response = api_client.get(url, {"pagination": "cursor"})
+
+        assert response.status_code == status.HTTP_200_OK
+        assert "count" not in response.data
+        assert len(response.data["results"]) == 5
+        assert response.data["results"][0]["title"] == "Задача 7"
+        assert response.data["previous"] is None
+
+        next_response = api_client.get(response.data["next"])
+        titles = [task["title"] for task in response.data["results"]]
+        titles += [task["title"] for task in next_response.data["results"]]
+
+        assert next_response.status_code == status.HTTP_200_OK
+        assert next_response.data["next"] is None
+        assert titles == [f"Задача {i}" for i in range(7, 0, -1)]
+
+    def test_cursor_pagination_from_settings(self, api_client, settings):
+        """
+        Тест выбора курсорной пагинации через настройку TASKS_PAGINATION_MODE.
+
+        Проверяет, что режим по умолчанию берется из настроек,
+        а параметр запроса pagination=page его переопределяет.
+        """
+        settings.TASKS_PAGINATION_MODE = "cursor"
+        Task.objects.create(title="Задача", status="created")
+        url = reverse("tasks:tasks_list")
+
+        response = api_client.get(url)
+        page_response = api_client.get(url, {"pagination": "page"})
+
+        assert "count" not in response.data
+        assert page_response.data["count"] == 1
+
+    def test_cursor_pagination_tied_created_at(self, api_client):
+        """
+        Тест курсорной пагинации по задачам с одинаковым created_at.
+
+        Задач с общим created_at (как после миграции 0002) больше, чем
+        offset_cutoff CursorPagination (1000). Проверяет, что переход
+        по next проходит все задачи без повторов и завершается.
+        """
+        tasks = Task.objects.bulk_create(Task(title=f"Задача {i}") for i in range(1100))
+        Task.objects.update(created_at=timezone.now())
+        url = reverse("tasks:tasks_list")
+        params = {"pagination": "cursor", "page_size": 10}
+
+        uuids = []
+        response = api_client.get(url, params)
+        for _ in range(len(tasks)):
+            uuids += [task["uuid"] for task in response.data["results"]]
+            if response.data["next"] is None:
+                break
+            response = api_client.get(response.data["next"])
+
+        assert response.data["next"] is None
+        assert len(uuids) == len(set(uuids)) == len(tasks)
+        assert uuids == sorted(uuids)
+
+    def test_invalid_cursor(self, api_client):
+        """Тест курсора с неразбираемой позицией: 404 Not Found."""
+        Task.objects.create(title="Задача")
+        url = reverse("tasks:tasks_list")
+        position = urlencode({"p": '["не дата","не uuid"]'})
+        cursor = b64encode(position.encode()).decode()
+
+        response = api_client.get(url, {"pagination": "cursor", "cursor": cursor})
+
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+
+
+@pytest.mark.django_db
+class TestEstimatedCountPagination:
+    """
+    Тесты пагинации с приблизительным count (pagination=estimated).
+
+    Оценка планировщика доступна только на PostgreSQL, поэтому в тестах
+    get_count_estimate подменяется фиксированным значением.
+    """
+
+    @pytest.fixture
+    def estimated_tasks(self):
+        """7 задач"""
+        return Task.objects.bulk_create(
+            Task(title=f"Задача {i + 1}", status="created") for i in range(7)
+        )
+
+    def get_page(self, api_client, page):
+        return api_client.get(
+            reverse("tasks:tasks_list"), {"pagination": "estimated", "page": page}
+        )
+
+    def test_exact_count_below_threshold(
+        self, api_client, estimated_tasks, monkeypatch, settings
+    ):
+        """
+        Тест точного count при оценке меньше порога.
+
+        Проверяет, что count считается COUNT(*) и count_is_estimated ложно.
+        """
+        settings.TASKS_COUNT_ESTIMATE_THRESHOLD = 1000
+        monkeypatch.setattr("tasks.paginations.get_count_estimate", lambda qs: 5)
+
+        response = self.get_page(api_client, 1)
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data["count"] == 7
+        assert response.data["count_is_estimated"] is False
+
+    def test_estimated_count_above_threshold(
+        self, api_client, estimated_tasks, monkeypatch, settings
+    ):
+        """
+        Тест оценочного count при оценке не меньше порога.
+
+        Проверяет:
+        - count берется из оценки без COUNT(*)
+        - Ссылка на следующую страницу определяется по фактическим строкам
+        - Страница за пределами данных возвращает 404
+        """
+        settings.TASKS_COUNT_ESTIMATE_THRESHOLD = 3
+        monkeypatch.setattr("tasks.paginations.get_count_estimate", lambda qs: 3)
+
+        response = self.get_page(api_client, 1)
+        assert response.data["count"] == 3
+        assert response.data["count_is_estimated"] is True
+        assert response.data["next"] is not None
+
+        response = self.get_page(api_client, 2)
+        assert response.status_code == status.HTTP_200_OK
+        assert len(response.data["results"]) == 2
+        assert response.data["next"] is None
+
+        assert self.get_page(api_client, 3).status_code == status.HTTP_404_NOT_FOUND
+
+    def test_no_estimate_outside_postgresql(self, api_client, estimated_tasks):
+        """
+        Тест режима estimated без оценки планировщика.
+
+        Проверяет, что на SQLite используется точный count.
+        """
+        response = self.get_page(api_client, 1)
+
+        assert response.data["count"] == 7
+        assert response.data["count_is_estimated"] is False
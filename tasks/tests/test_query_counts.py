@@ -0,0 +1,213 @@
+import pytest
+from django.urls import reverse
+from rest_framework import status
+
+from tasks.cache import get_task_cache
+from tasks.models import Task
+from tasks.tests.utils import assert_num_queries
+
+# Размеры таблицы: количество запросов не должно зависеть от количества задач.
+TABLE_SIZES = (1, 10, 50)
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize("size", TABLE_SIZES)
+class TestQueryCounts:
+    """
+    Тесты точного количества SQL-запросов каждого endpoint из tasks/urls.py.
+
+    Тесты падают со списком выполненных запросов, если изменение
+    сериализатора или view добавило лишний запрос (N+1, повторный COUNT).
+    В пакетных endpoints количество запросов не зависит от размера пакета.
+    SAVEPOINT/RELEASE - это transaction.atomic() внутри транзакции теста.
+    """
+
+    @pytest.fixture
+    def tasks(self, size):
+        """size задач в статусе created"""
+        return Task.objects.bulk_create(
+            Task(title=f"Задача {index}", description="Квартальный отчет")
+            for index in range(size)
+        )
+
+    @pytest.fixture
+    def uuids(self, tasks):
+        return [str(task.uuid) for task in tasks]
+
+    def test_list(self, api_client, tasks):
+        """Страница списка: COUNT и SELECT страницы."""
+        with assert_num_queries(2):
+            response = api_client.get(reverse("tasks:tasks_list"))
+        assert response.status_code == status.HTTP_200_OK
+
+    def test_list_cursor(self, api_client, tasks):
+        """Курсорная страница списка: только SELECT страницы."""
+        with assert_num_queries(1):
+            api_client.get(reverse("tasks:tasks_list"), {"pagination": "cursor"})
+
+    def test_detail(self, api_client, uuids):
+        """
+        Детальный просмотр: SELECT при промахе кэша, без запросов
+        при попадании, только версия и дата изменения для If-None-Match.
+        """
+        url = reverse("tasks:task_detail", args=[uuids[0]])
+        with assert_num_queries(1):
+            response = api_client.get(url)
+        with assert_num_queries(0):
+            api_client.get(url)
+
+        get_task_cache().clear()
+        with assert_num_queries(1):
+            response = api_client.get(url, HTTP_IF_NONE_MATCH=response["ETag"])
+        assert response.status_code == status.HTTP_304_NOT_MODIFIED
+
+    def test_search(self, api_client, tasks):
+        """Поиск: COUNT и SELECT страницы."""
+        with assert_num_queries(2):
+            api_client.get(reverse("tasks:task_search"), {"q": "отчет"})
+
+    def test_summary(self, api_client, tasks):
+        """Сводка по статусам: один SELECT по счетчикам."""
+        with assert_num_queries(1):
+            api_client.get(reverse("tasks:task_summary"))
+
+    def test_export(self, api_client, tasks):
+        """Потоковая выгрузка: один SELECT серверным курсором."""
+        with assert_num_queries(1):
+            response = api_client.get(reverse("tasks:task_export"))
+            b"".join(response.streaming_content)
+
+    def test_process_stats(self, api_client, tasks):
+        """Статистика кэша и метрики процесса не обращаются к базе данных."""
+        with assert_num_queries(0):
+            api_client.get(reverse("tasks:task_cache_stats"))
+            api_client.get(reverse("tasks:task_metrics"))
+
+    def test_create(self, api_client, tasks):
+        """Создание: INSERT, UPDATE счетчика статуса и INSERT в журнал изменений."""
+        with assert_num_queries(3):
+            api_client.post(reverse("tasks:task_create"), {"title": "Новая"})
+
+    def test_create_idempotent(self, api_client, tasks):
+        """
+        Создание с Idempotency-Key: SELECT ключа, SAVEPOINT, запросы создания,
+        INSERT ключа и RELEASE SAVEPOINT; повтор - только SELECT ключа.
+        """
+        url = reverse("tasks:task_create")
+        with assert_num_queries(7):
+            api_client.post(url, {"title": "Новая"}, HTTP_IDEMPOTENCY_KEY="key")
+        with assert_num_queries(1):
+            api_client.post(url, {"title": "Новая"}, HTTP_IDEMPOTENCY_KEY="key")
+
+    def test_update(self, api_client, uuids):
+        """
+        Обновление: SELECT, условный UPDATE по версии, по UPDATE на каждый
+        из двух счетчиков при смене статуса и INSERT в журнал изменений.
+        """
+        url = reverse("tasks:task_update", args=[uuids[0]])
+        with assert_num_queries(5):
+            api_client.patch(url, {"status": "completed"})
+        with assert_num_queries(3):
+            api_client.patch(url, {"title": "Новое"})
+
+    def test_delete(self, api_client, uuids):
+        """Удаление: SELECT, DELETE, UPDATE счетчика статуса и INSERT в журнал."""
+        with assert_num_queries(4):
+            api_client.delete(reverse("tasks:task_delete", args=[uuids[0]]))
+
+    def test_bulk_create(self, api_client, size):
+        """
+        Пакетное создание: один INSERT задач, один UPDATE счетчика
+        и один INSERT в журнал изменений на пакет.
+        """
+        items = [{"title": f"Задача {index}"} for index in range(size)]
+        with assert_num_queries(5):
+            api_client.post(reverse("tasks:task_bulk_create"), items, format="json")
+
+    def test_bulk_update(self, api_client, uuids):
+        """
+        Пакетное обновление: SELECT, один UPDATE, SELECT новых версий,
+        UPDATE двух счетчиков и один INSERT в журнал изменений.
+        """
+        items = [{"uuid": pk, "status": "underway"} for pk in uuids]
+        with assert_num_queries(8):
+            api_client.patch(reverse("tasks:task_bulk_update"), items, format="json")
+
+    def test_bulk_delete(self, api_client, uuids):
+        """
+        Пакетное удаление: SELECT, DELETE, один INSERT в журнал изменений
+        и один UPDATE счетчика на пакет.
+        """
+        with assert_num_queries(6):
+            api_client.post(
+                reverse("tasks:task_bulk_delete"), {"uuids": uuids}, format="json"
+            )
+
+    def test_bulk_retrieve(self, api_client, uuids):
+        """
+        Получение по списку UUID: один SELECT ... IN при промахе кэша,
+        без запросов, когда все задачи в кэше.
+        """
+        url = reverse("tasks:task_bulk_retrieve")
+        with assert_num_queries(1):
+            api_client.post(url, {"uuids": uuids}, format="json")
+        with assert_num_queries(0):
+            response = api_client.post(url, {"uuids": uuids}, format="json")
+        assert len(response.json()["results"]) == len(uuids)
+
+    def test_jobs(self, api_client, tasks):
+        """
+        Фоновое задание: постановка в очередь - один INSERT без чтения задач,
+        статус - один SELECT задания.
+        """
+        with assert_num_queries(1):
+            response = api_client.post(
+                reverse("tasks:task_job_create"),
+                {"kind": "bulk_status", "params": {"status": "completed"}},
+                format="json",
+            )
+        with assert_num_queries(1):
+            api_client.get(response["Location"])
+
+    def test_async_endpoints(self, api_client, uuids):
+        """Асинхронные endpoints выполняют столько же запросов, сколько синхронные."""
+        with assert_num_queries(2):
+            api_client.get(reverse("tasks:async_tasks_list"))
+        with assert_num_queries(1):
+            api_client.get(reverse("tasks:async_task_detail", args=[uuids[0]]))
+        with assert_num_queries(3):
+            api_client.post(
+                reverse("tasks:async_task_create"), {"title": "Новая"}, format="json"
+            )
+        with assert_num_queries(5):
+            api_client.patch(
+                reverse("tasks:async_task_update", args=[uuids[0]]),
+                {"status": "completed"},
+                format="json",
+            )
+        with assert_num_queries(4):
+            api_client.delete(reverse("tasks:async_task_delete", args=[uuids[0]]))
+
+    def test_changes(self, api_client, uuids):
+        """
+        Журнал изменений: MIN/MAX(seq), если изменений нет; иначе еще
+        SELECT изменений и один SELECT задач по UUID независимо от их количества.
+        Без since при свежих записях еще два запроса: последняя запись старше
+        таймаута и записи после нее для проверки пропусков в нумерации.
+        """
+        url = reverse("tasks:task_changes")
+        with assert_num_queries(1):
+            since = api_client.get(url).json()["next"]
+        with assert_num_queries(1):
+            api_client.get(url, {"since": since})
+
+        api_client.patch(
+            reverse("tasks:task_bulk_update"),
+            [{"uuid": pk, "status": "underway"} for pk in uuids],
+            format="json",
+        )
+        with assert_num_queries(3):
+            response = api_client.get(url, {"since": since})
+        assert len(response.json()["changes"]) == len(uuids)
+        with assert_num_queries(3):
+            api_client.get(url)
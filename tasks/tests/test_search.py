@@ -0,0 +1,72 @@
+import pytest
+from django.urls import reverse
+from rest_framework import status
+
+from tasks.models import Task
+
+
+@pytest.mark.django_db
+class TestTaskSearch:
+    """
+    Тесты полнотекстового поиска задач.
+
+    В тестах используется SQLite, поэтому проверяется простой путь поиска
+    по вхождению слов; поиск PostgreSQL по search_vector идет тем же endpoint.
+    """
+
+    @pytest.fixture
+    def search_tasks(self):
+        """Задачи с совпадениями в названии и в описании"""
+        return [
+            Task.objects.create(
+                title="Квартальный отчет", description="Собрать цифры", status="created"
+            ),
+            Task.objects.create(
+                title="Релиз",
+                description="Приложить отчет к релизу",
+                status="completed",
+            ),
+            Task.objects.create(title="Созвон", description="Обсудить план"),
+        ]
+
+    def test_search_by_title_and_description(self, api_client, search_tasks):
+        """
+        Тест поиска по названию и описанию.
+
+        Проверяет, что находятся задачи с совпадением в любом из полей,
+        а совпадение в названии ранжируется выше.
+        """
+        response = api_client.get(reverse("tasks:task_search"), {"q": "отчет"})
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data["count"] == 2
+        titles = [task["title"] for task in response.data["results"]]
+        assert titles == ["Квартальный отчет", "Релиз"]
+
+    def test_search_all_terms_and_filters(self, api_client, search_tasks):
+        """
+        Тест поиска по нескольким словам с фильтром по статусу.
+
+        Проверяет, что каждое слово запроса должно совпасть
+        и что фильтры списка применяются к результатам поиска.
+        """
+        url = reverse("tasks:task_search")
+
+        response = api_client.get(url, {"q": "отчет цифры"})
+        assert [task["title"] for task in response.data["results"]] == [
+            "Квартальный отчет"
+        ]
+
+        response = api_client.get(url, {"q": "отчет", "status": "completed"})
+        assert [task["title"] for task in response.data["results"]] == ["Релиз"]
+
+    def test_search_requires_query(self, api_client, search_tasks):
+        """
+        Тест поиска без запроса.
+
+        Проверяет, что пустой параметр q возвращает 400.
+        """
+        response = api_client.get(reverse("tasks:task_search"), {"q": "  "})
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert "q" in response.data
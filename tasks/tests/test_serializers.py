@@ -1,4 +1,10 @@
-from tasks.serializers import TaskSerializer
+import pytest
+from rest_framework.renderers import JSONRenderer
+
+from tasks.exceptions import TaskVersionConflict
+from tasks.models import Task
+from tasks.serializers import (TASK_FIELDS, TaskSerializer,
+                               task_to_representation)
 
 
 class TestTaskSerializer:
@@ -54,3 +60,42 @@ class TestTaskSerializer:
         assert 'invalid_status" is not a valid choice.' in str(
             serializer.errors["status"][0]
         )
+
+    def test_serializer_update_version_conflict(self, task_object):
+        """
+        Тест обнаружения параллельного изменения при обновлении.
+
+        Проверяет, что если задача изменилась между чтением и записью,
+        условный UPDATE по версии не применяется и возникает TaskVersionConflict.
+        """
+        concurrent = Task.objects.get(pk=task_object.pk)
+        concurrent.status = "completed"
+        concurrent.save()
+
+        serializer = TaskSerializer(
+            task_object, data={"title": "Потерянное обновление"}, partial=True
+        )
+        assert serializer.is_valid()
+
+        with pytest.raises(TaskVersionConflict):
+            serializer.save()
+
+        task_object.refresh_from_db()
+        assert task_object.title == "Тестовая задача в БД"
+        assert task_object.status == "completed"
+
+    def test_fast_representation_matches_serializer(self, task_object):
+        """
+        Тест совместимости быстрого представления с TaskSerializer.
+
+        Проверяет, что task_to_representation для строки .values()
+        дает тот же JSON побайтно, включая порядок полей и формат дат.
+        """
+        row = Task.objects.values(*TASK_FIELDS).get(pk=task_object.pk)
+        task = Task.objects.get(pk=task_object.pk)
+        renderer = JSONRenderer()
+
+        assert tuple(TaskSerializer().fields) == TASK_FIELDS
+        assert renderer.render(task_to_representation(row)) == renderer.render(
+            TaskSerializer(task).data
+        )
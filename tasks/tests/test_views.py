@@ -1,7 +1,10 @@
 import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 from rest_framework import status
 
+from tasks.cache import get_cached_task
 from tasks.models import Task
 
 
@@ -202,3 +205,121 @@ class TestTaskViews:
 
         assert response.status_code == status.HTTP_200_OK
         assert len(response.data["results"]) == 0
+
+    def test_update_task_increments_version(self, api_client, task_object):
+        """
+        Тест увеличения версии задачи при обновлении.
+
+        Проверяет, что ответ содержит новую версию и соответствующий ETag.
+        """
+        url = reverse("tasks:task_update", kwargs={"pk": task_object.uuid})
+
+        response = api_client.patch(url, {"status": "completed"}, format="json")
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data["version"] == task_object.version + 1
+        assert response["ETag"] == f'"{task_object.version + 1}"'
+
+    def test_update_task_if_match(self, api_client, task_object):
+        """
+        Тест обновления с заголовком If-Match.
+
+        Проверяет:
+        - Успешное обновление при совпадении ETag
+        - Ошибку 412 Precondition Failed при устаревшем ETag
+        - Неизменность задачи после отклоненного обновления
+        """
+        detail_url = reverse("tasks:task_detail", kwargs={"pk": task_object.uuid})
+        update_url = reverse("tasks:task_update", kwargs={"pk": task_object.uuid})
+        etag = api_client.get(detail_url)["ETag"]
+
+        response = api_client.patch(
+            update_url, {"title": "Первое"}, format="json", HTTP_IF_MATCH=etag
+        )
+        stale_response = api_client.patch(
+            update_url, {"title": "Второе"}, format="json", HTTP_IF_MATCH=etag
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        assert stale_response.status_code == status.HTTP_412_PRECONDITION_FAILED
+        task_object.refresh_from_db()
+        assert task_object.title == "Первое"
+
+
+@pytest.mark.django_db
+class TestSparseFieldsets:
+    """
+    Тесты параметра fields для списка и детального просмотра.
+
+    Класс проверяет, что ответ и SQL-запрос содержат только запрошенные поля.
+    """
+
+    def test_list_fields(self, api_client, multiple_tasks):
+        """
+        Тест списка с fields=uuid,title,status.
+
+        Проверяет состав полей ответа и то, что описание
+        не читается из базы данных.
+        """
+        url = reverse("tasks:tasks_list")
+        with CaptureQueriesContext(connection) as queries:
+            response = api_client.get(url, {"fields": "status,uuid,title"})
+
+        assert response.status_code == status.HTTP_200_OK
+        for task in response.data["results"]:
+            assert list(task) == ["uuid", "title", "status"]
+        assert all("description" not in query["sql"] for query in queries)
+
+    def test_list_fields_cursor(self, api_client, multiple_tasks):
+        """
+        Тест курсорной пагинации с fields без поля сортировки.
+
+        Проверяет, что ссылка на следующую страницу строится, хотя
+        created_at не входит в ответ.
+        """
+        response = api_client.get(
+            reverse("tasks:tasks_list"),
+            {"pagination": "cursor", "page_size": 2, "fields": "title"},
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data["next"] is not None
+        assert list(response.data["results"][0]) == ["title"]
+
+    def test_retrieve_fields(self, api_client, task_object):
+        """
+        Тест детального просмотра с fields.
+
+        Проверяет:
+        - При промахе кэша описание не читается, неполный ответ не кэшируется
+        - Из кэша возвращаются только запрошенные поля
+        - ETag совпадает с полным ответом
+        """
+        url = reverse("tasks:task_detail", kwargs={"pk": task_object.uuid})
+
+        with CaptureQueriesContext(connection) as queries:
+            response = api_client.get(url, {"fields": "uuid,status"})
+        assert response.data == {"uuid": str(task_object.uuid), "status": "underway"}
+        assert "description" not in queries[0]["sql"]
+        assert get_cached_task(task_object.uuid) is None
+
+        full_response = api_client.get(url)
+        cached_response = api_client.get(url, {"fields": "title"})
+        assert cached_response.data == {"title": task_object.title}
+        assert cached_response["ETag"] == full_response["ETag"] == response["ETag"]
+
+    def test_invalid_fields(self, api_client, task_object):
+        """
+        Тест неизвестного поля в fields.
+
+        Проверяет, что список и детальный просмотр возвращают 400.
+        """
+        list_response = api_client.get(reverse("tasks:tasks_list"), {"fields": "owner"})
+        detail_response = api_client.get(
+            reverse("tasks:task_detail", kwargs={"pk": task_object.uuid}),
+            {"fields": "title,owner"},
+        )
+
+        assert list_response.status_code == status.HTTP_400_BAD_REQUEST
+        assert detail_response.status_code == status.HTTP_400_BAD_REQUEST
+        assert "fields" in detail_response.data
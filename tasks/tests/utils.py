@@ -0,0 +1,35 @@
+from contextlib import contextmanager
+
+import pytest
+from django.db import connections
+from django.test.utils import CaptureQueriesContext
+
+
+@contextmanager
+def assert_num_queries(expected, using="default"):
+    """
+    Проверяет точное количество SQL-запросов внутри блока.
+
+    При расхождении тест падает со списком выполненных запросов, чтобы
+    сразу было видно лишний COUNT или N+1. Если запросов стало меньше,
+    ожидаемое значение в тесте нужно уменьшить.
+
+    Args:
+        expected (int): Ожидаемое количество запросов
+        using (str): Алиас базы данных
+
+    Yields:
+        CaptureQueriesContext: Захваченные запросы (captured_queries)
+    """
+    with CaptureQueriesContext(connections[using]) as context:
+        yield context
+    executed = len(context.captured_queries)
+    if executed != expected:
+        queries = "\n".join(
+            f"{index}. {query['sql']}"
+            for index, query in enumerate(context.captured_queries, start=1)
+        )
+        pytest.fail(
+            f"Ожидалось SQL-запросов: {expected}, выполнено: {executed}\n{queries}",
+            pytrace=False,
+        )
@@ -1,13 +1,25 @@
 from django.urls import path
 
 from tasks.apps import TasksConfig
-from tasks.views import (TaskCreateApiView, TaskDeleteApiView, TaskListApiView,
-                         TaskRetrieveApiView, TaskUpdateApiView)
+from tasks.async_views import (AsyncTaskChangesView, AsyncTaskCreateView,
+                               AsyncTaskDeleteView, AsyncTaskEventsView,
+                               AsyncTaskListView, AsyncTaskRetrieveView,
+                               AsyncTaskUpdateView)
+from tasks.views import (TaskBulkCreateApiView, TaskBulkDeleteApiView,
+                         TaskBulkRetrieveApiView, TaskBulkUpdateApiView,
+                         TaskCacheStatsApiView, TaskCreateApiView,
+                         TaskDeleteApiView, TaskExportApiView,
+                         TaskJobCreateApiView, TaskJobDownloadApiView,
+                         TaskJobRetrieveApiView, TaskListApiView,
+                         TaskMetricsApiView, TaskRetrieveApiView,
+                         TaskSearchApiView, TaskSummaryApiView,
+                         TaskUpdateApiView)
 
 app_name = TasksConfig.name
 
 urlpatterns = [
     path("", TaskListApiView.as_view(), name="tasks_list"),
+    path("search/", TaskSearchApiView.as_view(), name="task_search"),
     path("<uuid:pk>/", TaskRetrieveApiView.as_view(), name="task_detail"),
     path("create/", TaskCreateApiView.as_view(), name="task_create"),
     path("<uuid:pk>/update/", TaskUpdateApiView.as_view(), name="task_update"),
@@ -16,4 +28,38 @@ urlpatterns = [
         TaskDeleteApiView.as_view(),
         name="task_delete",
     ),
+    path("bulk/create/", TaskBulkCreateApiView.as_view(), name="task_bulk_create"),
+    path("bulk/update/", TaskBulkUpdateApiView.as_view(), name="task_bulk_update"),
+    path("bulk/delete/", TaskBulkDeleteApiView.as_view(), name="task_bulk_delete"),
+    path(
+        "bulk/retrieve/",
+        TaskBulkRetrieveApiView.as_view(),
+        name="task_bulk_retrieve",
+    ),
+    path("export/", TaskExportApiView.as_view(), name="task_export"),
+    path("jobs/", TaskJobCreateApiView.as_view(), name="task_job_create"),
+    path("jobs/<uuid:pk>/", TaskJobRetrieveApiView.as_view(), name="task_job_detail"),
+    path(
+        "jobs/<uuid:pk>/download/",
+        TaskJobDownloadApiView.as_view(),
+        name="task_job_download",
+    ),
+    path("summary/", TaskSummaryApiView.as_view(), name="task_summary"),
+    path("metrics/", TaskMetricsApiView.as_view(), name="task_metrics"),
+    path("changes/", AsyncTaskChangesView.as_view(), name="task_changes"),
+    path("events/", AsyncTaskEventsView.as_view(), name="task_events"),
+    path("cache/stats/", TaskCacheStatsApiView.as_view(), name="task_cache_stats"),
+    path("async/", AsyncTaskListView.as_view(), name="async_tasks_list"),
+    path("async/<uuid:pk>/", AsyncTaskRetrieveView.as_view(), name="async_task_detail"),
+    path("async/create/", AsyncTaskCreateView.as_view(), name="async_task_create"),
+    path(
+        "async/<uuid:pk>/update/",
+        AsyncTaskUpdateView.as_view(),
+        name="async_task_update",
+    ),
+    path(
+        "async/<uuid:pk>/delete/",
+        AsyncTaskDeleteView.as_view(),
+        name="async_task_delete",
+    ),
 ]
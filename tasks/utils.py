@@ -0,0 +1,9 @@
+import uuid
+
+
+def parse_uuid(value):
+    """Преобразует значение в UUID, возвращает None для невалидных значений."""
+    try:
+        return uuid.UUID(str(value))
+    except (TypeError, ValueError, AttributeError):
+        return None
@@ -1,13 +1,76 @@
+from django.conf import settings
+from django.core.handlers.asgi import ASGIRequest
+from django.db import transaction
+from django.http import (FileResponse, Http404, HttpResponse,
+                         StreamingHttpResponse)
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.exceptions import ValidationError
 from rest_framework.generics import (CreateAPIView, DestroyAPIView,
-                                     ListAPIView, RetrieveAPIView,
-                                     UpdateAPIView)
-
-from tasks.models import Task
-from tasks.paginations import CustomPagination
-from tasks.serializers import TaskSerializer
-
+                                     GenericAPIView, ListAPIView,
+                                     RetrieveAPIView, UpdateAPIView)
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from tasks.cache import (get_cache_stats, get_cached_task, get_cached_tasks,
+                         set_cached_task, set_cached_tasks)
+from tasks.changes import defer_task_changes
+from tasks.conditional import (get_not_modified_response, get_page_validators,
+                               get_task_validators, has_conditional_headers,
+                               set_validator_headers)
+from tasks.counters import defer_status_counts, get_status_summary
+from tasks.exceptions import TaskPreconditionFailed
+from tasks.exports import (EXPORT_FORMATS, aread_file, astream_tasks,
+                           stream_tasks)
+from tasks.filters import TaskFilterBackend, TaskOrderingFilter
+from tasks.idempotency import IdempotentViewMixin
+from tasks.jobs import enqueue_job, get_export_path
+from tasks.metrics import PROMETHEUS_CONTENT_TYPE, render_prometheus
+from tasks.models import Task, TaskJob
+from tasks.paginations import CustomPagination, get_pagination_class
+from tasks.search import SEARCH_QUERY_PARAM, search_tasks
+from tasks.serializers import (TASK_FIELDS, TaskJobSerializer, TaskSerializer,
+                               get_query_fields, get_sparse_fields,
+                               task_to_representation)
+from tasks.utils import parse_uuid
+
+
+def get_bulk_max_items():
+    """Максимальное количество задач в одном пакетном запросе."""
+    return getattr(settings, "TASKS_BULK_MAX_ITEMS", 10000)
+
+
+def get_request_uuids(data, max_items):
+    """
+    Список UUID задач из тела пакетного запроса {"uuids": [...]}.
 
-class TaskCreateApiView(CreateAPIView):
+    Raises:
+        ValidationError: Не список, больше max_items элементов
+            или некорректные UUID (ошибки по индексам)
+    """
+    values = data.get("uuids") if isinstance(data, dict) else None
+    if not isinstance(values, list):
+        raise ValidationError({"uuids": ["Ожидается список UUID задач."]})
+    if len(values) > max_items:
+        raise ValidationError(
+            {"uuids": [f"Не более {max_items} UUID в одном запросе."]}
+        )
+
+    uuids = [parse_uuid(value) for value in values]
+    if None in uuids:
+        raise ValidationError(
+            {
+                "uuids": {
+                    index: ["Некорректный UUID."]
+                    for index, pk in enumerate(uuids)
+                    if pk is None
+                }
+            }
+        )
+    return uuids
+
+
+class TaskCreateApiView(IdempotentViewMixin, CreateAPIView):
     """
     API endpoint для создания новой задачи.
 
@@ -19,16 +82,23 @@ class TaskCreateApiView(CreateAPIView):
         - description (str): Описание задачи (опциональное)
         - status (str): Статус задачи (по умолчанию 'created')
 
+    Headers:
+        - Idempotency-Key (str): Ключ для безопасного повтора запроса (опционально)
+
     Response:
-        - 201 Created: Задача успешно создана
+        - 201 Created: Задача успешно создана или сохраненный ответ на повтор
         - 400 Bad Request: Невалидные данные
+        - 422 Unprocessable Entity: Idempotency-Key использован с другим телом
     """
 
     queryset = Task.objects.all()
     serializer_class = TaskSerializer
 
+    def post(self, request, *args, **kwargs):
+        return self.idempotent(super().post, request, *args, **kwargs)
+
 
-class TaskUpdateApiView(UpdateAPIView):
+class TaskUpdateApiView(IdempotentViewMixin, UpdateAPIView):
     """
     API endpoint для обновления существующей задачи.
 
@@ -39,18 +109,48 @@ class TaskUpdateApiView(UpdateAPIView):
     Path Parameters:
         - pk (UUID): UUID задачи для обновления
 
+    Headers:
+        - If-Match (str): ETag задачи из GET /tasks/{uuid}/ (опционально)
+        - Idempotency-Key (str): Ключ для безопасного повтора запроса (опционально)
+
     Request Body:
         Любые поля задачи для обновления
 
     Response:
-        - 200 OK: Задача успешно обновлена
+        - 200 OK: Задача успешно обновлена, новый ETag в заголовке
         - 400 Bad Request: Невалидные данные
         - 404 Not Found: Задача не найдена
+        - 409 Conflict: Задача изменена параллельным запросом
+        - 412 Precondition Failed: Версия не совпадает с If-Match
+        - 422 Unprocessable Entity: Idempotency-Key использован с другим телом
+
+    Используется оптимистичная блокировка без select_for_update:
+    запись выполняется условным UPDATE ... WHERE version = N.
     """
 
     queryset = Task.objects.all()
     serializer_class = TaskSerializer
 
+    def perform_update(self, serializer):
+        instance = serializer.instance
+        etag, last_modified = get_task_validators(instance.version, instance.updated_at)
+        if get_not_modified_response(self.request, etag, last_modified) is not None:
+            raise TaskPreconditionFailed()
+        serializer.save()
+
+    def put(self, request, *args, **kwargs):
+        return self.idempotent(super().put, request, *args, **kwargs)
+
+    def patch(self, request, *args, **kwargs):
+        return self.idempotent(super().patch, request, *args, **kwargs)
+
+    def update(self, request, *args, **kwargs):
+        response = super().update(request, *args, **kwargs)
+        return set_validator_headers(
+            response,
+            *get_task_validators(response.data["version"], response.data["updated_at"]),
+        )
+
 
 class TaskRetrieveApiView(RetrieveAPIView):
     """
@@ -62,14 +162,67 @@ class TaskRetrieveApiView(RetrieveAPIView):
     Path Parameters:
         - pk (UUID): UUID задачи
 
+    Query Parameters:
+        - fields (str): Поля задачи в ответе через запятую
+
     Response:
         - 200 OK: Данные задачи
+        - 400 Bad Request: Недопустимое поле в fields
         - 404 Not Found: Задача не найдена
+
+    Сериализованная задача читается через кэш (read-through), записи
+    сбрасываются сигналами post_save/post_delete модели Task.
+
+    Поддерживается условный GET: ответ содержит ETag (версия задачи) и Last-Modified,
+    при совпадении If-None-Match/If-Modified-Since возвращается
+    304 Not Modified без сериализации. Если задачи нет в кэше, для проверки
+    условия читаются только version и updated_at, а не вся строка.
+    Задача читается через .values() и представляется без ModelSerializer.
+
+    Параметр fields (например, fields=uuid,title,status) ограничивает поля
+    ответа; при промахе кэша из базы данных читаются только эти поля
+    и валидаторы, такой неполный ответ не кэшируется.
     """
 
     queryset = Task.objects.all()
     serializer_class = TaskSerializer
 
+    def retrieve(self, request, *args, **kwargs):
+        pk = kwargs[self.lookup_url_kwarg or self.lookup_field]
+        fields = get_sparse_fields(request.query_params)
+        data = get_cached_task(pk)
+
+        if data is None and has_conditional_headers(request):
+            validators = (
+                self.get_queryset()
+                .filter(pk=pk)
+                .values_list("version", "updated_at")
+                .first()
+            )
+            if validators is None:
+                raise Http404
+            etag, last_modified = get_task_validators(*validators)
+            response = get_not_modified_response(request, etag, last_modified)
+            if response is not None:
+                return response
+
+        if data is None:
+            columns = get_query_fields(fields, "version", "updated_at")
+            row = self.get_queryset().values(*columns).filter(pk=pk).first()
+            if row is None:
+                raise Http404
+            data = task_to_representation(row, columns)
+            if fields == TASK_FIELDS:
+                set_cached_task(pk, data)
+
+        etag, last_modified = get_task_validators(data["version"], data["updated_at"])
+        response = get_not_modified_response(request, etag, last_modified)
+        if response is not None:
+            return response
+        if fields != TASK_FIELDS:
+            data = {field: data[field] for field in fields}
+        return set_validator_headers(Response(data), etag, last_modified)
+
 
 class TaskListApiView(ListAPIView):
     """
@@ -79,17 +232,117 @@ class TaskListApiView(ListAPIView):
         GET: Получение списка задач
 
     Query Parameters:
-        - page (int): Номер страницы
+        - pagination (str): Режим пагинации: page (по умолчанию) или cursor
+        - page (int): Номер страницы (режим page)
+        - cursor (str): Курсор следующей/предыдущей страницы (режим cursor)
         - page_size (int): Количество задач на странице (макс. 10)
+        - status (str): Фильтр по статусам через запятую
+        - exclude_status (str): Исключаемые статусы через запятую
+        - title_prefix (str): Название начинается с подстроки
+        - title_contains (str): Название содержит подстроку (без учета регистра)
+        - ordering (str): Сортировка: created_at, title, status, с "-" по убыванию
+          (по умолчанию -created_at)
+        - fields (str): Поля задач в ответе через запятую (например, uuid,title,status),
+          из базы данных читаются только они и служебные поля для ETag и курсора
 
     Response:
         - 200 OK: Пагинированный список задач
+        - 304 Not Modified: Страница не изменилась (If-None-Match)
+        - 400 Bad Request: Недопустимый статус в фильтре, сортировка или поле
+
+    ETag страницы строится по UUID и updated_at ее задач и ссылкам
+    пагинации, 304 отдается до сериализации. Last-Modified передается
+    для информации: удаление задачи его не меняет, поэтому решение о 304
+    принимается только по ETag.
+
+    Задачи читаются через .values() и представляются функцией
+    task_to_representation без пополевого ModelSerializer.
     """
 
     queryset = Task.objects.all()
     serializer_class = TaskSerializer
+    filter_backends = [TaskFilterBackend, TaskOrderingFilter]
+
+    @property
+    def pagination_class(self):
+        """Класс пагинации выбирается по параметру запроса или настройке."""
+        return get_pagination_class(getattr(self, "request", None))
+
+    def get_pagination_state(self):
+        """Значения пагинации в теле ответа, от которых зависит ETag страницы."""
+        paginator = getattr(getattr(self.paginator, "page", None), "paginator", None)
+        return (
+            paginator.count if paginator is not None else None,
+            self.paginator.get_next_link(),
+            self.paginator.get_previous_link(),
+        )
+
+    def list(self, request, *args, **kwargs):
+        fields = get_sparse_fields(request.query_params)
+        ordering = TaskOrderingFilter.get_ordering_by_params(request.query_params)
+        # uuid и updated_at нужны для ETag, поле сортировки - для курсора.
+        columns = get_query_fields(
+            fields, "uuid", "updated_at", *(field.lstrip("-") for field in ordering)
+        )
+        queryset = self.filter_queryset(self.get_queryset()).values(*columns)
+        page = self.paginate_queryset(queryset)
+        rows = list(queryset) if page is None else page
+
+        extra = () if page is None else self.get_pagination_state()
+        etag, last_modified = get_page_validators(rows, *extra)
+        response = get_not_modified_response(request, etag)
+        if response is not None:
+            return set_validator_headers(response, etag, last_modified)
+
+        data = [task_to_representation(row, fields) for row in rows]
+        if page is None:
+            response = Response(data)
+        else:
+            response = self.get_paginated_response(data)
+        return set_validator_headers(response, etag, last_modified)
+
+
+class TaskSearchApiView(ListAPIView):
+    """
+    API endpoint для полнотекстового поиска задач.
+
+    Methods:
+        GET: Поиск задач по названию и описанию
+
+    Query Parameters:
+        - q (str): Поисковый запрос (обязательный), например
+          q=отчет -черновик или q="квартальный отчет"
+        - page (int): Номер страницы
+        - page_size (int): Количество задач на странице (макс. 10)
+        - status, exclude_status, title_prefix, title_contains: фильтры как у списка
+        - fields (str): Поля задач в ответе через запятую
+
+    Response:
+        - 200 OK: Пагинированный список задач, наиболее релевантные первыми
+        - 400 Bad Request: Пустой запрос, недопустимый статус в фильтре или поле
+
+    На PostgreSQL поиск идет по search_vector с GIN-индексом
+    (миграция 0006_task_search_vector), см. tasks.search.search_tasks.
+    """
+
+    queryset = Task.objects.all()
+    serializer_class = TaskSerializer
+    filter_backends = [TaskFilterBackend]
     pagination_class = CustomPagination
 
+    def filter_queryset(self, queryset):
+        query = self.request.query_params.get(SEARCH_QUERY_PARAM, "").strip()
+        if not query:
+            raise ValidationError({SEARCH_QUERY_PARAM: ["This field is required."]})
+        return search_tasks(super().filter_queryset(queryset), query)
+
+    def list(self, request, *args, **kwargs):
+        fields = get_sparse_fields(request.query_params)
+        queryset = self.filter_queryset(self.get_queryset()).values(*fields)
+        page = self.paginate_queryset(queryset)
+        data = [task_to_representation(row, fields) for row in page]
+        return self.get_paginated_response(data)
+
 
 class TaskDeleteApiView(DestroyAPIView):
     """
@@ -108,3 +361,380 @@ class TaskDeleteApiView(DestroyAPIView):
 
     queryset = Task.objects.all()
     serializer_class = TaskSerializer
+
+
+class TaskBulkCreateApiView(CreateAPIView):
+    """
+    API endpoint для пакетного создания задач.
+
+    Methods:
+        POST: Создание списка задач одним INSERT в одной транзакции
+
+    Request Body:
+        Список объектов задач (поля как у создания одной задачи)
+
+    Response:
+        - 201 Created: Все задачи созданы
+        - 400 Bad Request: Список ошибок валидации по каждой задаче,
+          ни одна задача не создана
+    """
+
+    queryset = Task.objects.all()
+    serializer_class = TaskSerializer
+
+    def get_serializer(self, *args, **kwargs):
+        """Сериализатор всегда работает со списком задач."""
+        kwargs["many"] = True
+        kwargs["max_length"] = get_bulk_max_items()
+        return super().get_serializer(*args, **kwargs)
+
+    def perform_create(self, serializer):
+        with transaction.atomic():
+            serializer.save()
+
+
+class TaskBulkUpdateApiView(GenericAPIView):
+    """
+    API endpoint для пакетного обновления задач.
+
+    Methods:
+        PATCH: Частичное обновление списка задач одним bulk_update
+
+    Request Body:
+        Список объектов с обязательным uuid и изменяемыми полями
+
+    Response:
+        - 200 OK: Обновленные задачи
+        - 400 Bad Request: Список ошибок по каждой задаче
+          (невалидные данные или несуществующий uuid), изменения не применяются
+    """
+
+    queryset = Task.objects.all()
+    serializer_class = TaskSerializer
+
+    def patch(self, request, *args, **kwargs):
+        items = request.data
+        if not isinstance(items, list):
+            raise ValidationError({"non_field_errors": ["Ожидается список задач."]})
+        if len(items) > get_bulk_max_items():
+            raise ValidationError(
+                {
+                    "non_field_errors": [
+                        f"Не более {get_bulk_max_items()} задач в одном запросе."
+                    ]
+                }
+            )
+
+        uuids = [
+            parse_uuid(item.get("uuid")) if isinstance(item, dict) else None
+            for item in items
+        ]
+        tasks = self.get_queryset().in_bulk([pk for pk in uuids if pk is not None])
+
+        errors = []
+        for pk in uuids:
+            if pk is None:
+                errors.append({"uuid": ["Требуется корректный UUID задачи."]})
+            elif pk not in tasks:
+                errors.append({"uuid": ["Задача не найдена."]})
+            else:
+                errors.append({})
+        if any(errors):
+            raise ValidationError(errors)
+
+        serializer = self.get_serializer(
+            [tasks[pk] for pk in uuids], data=items, many=True, partial=True
+        )
+        serializer.is_valid(raise_exception=True)
+        with transaction.atomic():
+            serializer.save()
+        return Response(serializer.data)
+
+
+class TaskBulkDeleteApiView(GenericAPIView):
+    """
+    API endpoint для пакетного удаления задач.
+
+    Methods:
+        POST: Удаление задач одним DELETE ... WHERE uuid IN (...)
+
+    Request Body:
+        - uuids (list[UUID]): Список UUID задач для удаления
+
+    Response:
+        - 200 OK: Количество удаленных задач
+        - 400 Bad Request: Невалидный список UUID
+    """
+
+    queryset = Task.objects.all()
+    serializer_class = TaskSerializer
+
+    def post(self, request, *args, **kwargs):
+        uuids = get_request_uuids(request.data, get_bulk_max_items())
+        with transaction.atomic(), defer_status_counts(), defer_task_changes():
+            deleted, _ = self.get_queryset().filter(pk__in=uuids).delete()
+        return Response({"deleted": deleted}, status=status.HTTP_200_OK)
+
+
+class TaskBulkRetrieveApiView(GenericAPIView):
+    """
+    API endpoint для получения нескольких задач по UUID.
+
+    Methods:
+        POST: Получение задач одним запросом вместо запроса на каждую задачу
+
+    Request Body:
+        - uuids (list[UUID]): UUID задач (не более TASKS_BULK_RETRIEVE_MAX_ITEMS)
+
+    Query Parameters:
+        - fields (str): Поля задачи в ответе через запятую
+
+    Response:
+        - 200 OK: results - задачи в порядке uuids; для несуществующей
+          задачи - {"uuid": ..., "detail": "Not found."}
+        - 400 Bad Request: Невалидный список UUID или поле в fields
+
+    Задачи сначала ищутся в кэше детального просмотра одним get_many,
+    остальные читаются запросами WHERE uuid IN (...) по
+    TASKS_BULK_BATCH_SIZE UUID и кэшируются (если запрошены все поля).
+    """
+
+    queryset = Task.objects.all()
+    serializer_class = TaskSerializer
+
+    def post(self, request, *args, **kwargs):
+        uuids = get_request_uuids(
+            request.data, getattr(settings, "TASKS_BULK_RETRIEVE_MAX_ITEMS", 1000)
+        )
+        fields = get_sparse_fields(request.query_params)
+
+        tasks = get_cached_tasks(set(uuids))
+        missing = sorted(set(uuids).difference(tasks))
+        if missing:
+            columns = get_query_fields(fields, "uuid")
+            batch_size = getattr(settings, "TASKS_BULK_BATCH_SIZE", 1000)
+            loaded = {}
+            for start in range(0, len(missing), batch_size):
+                for row in (
+                    self.get_queryset()
+                    .filter(pk__in=missing[start : start + batch_size])
+                    .values(*columns)
+                ):
+                    loaded[row["uuid"]] = task_to_representation(row, columns)
+            if fields == TASK_FIELDS:
+                set_cached_tasks(loaded)
+            tasks.update(loaded)
+
+        results = []
+        for pk in uuids:
+            data = tasks.get(pk)
+            if data is None:
+                results.append({"uuid": str(pk), "detail": "Not found."})
+            elif fields != TASK_FIELDS:
+                results.append({field: data[field] for field in fields})
+            else:
+                results.append(data)
+        return Response({"results": results})
+
+
+class TaskCacheStatsApiView(APIView):
+    """
+    API endpoint со статистикой кэша задач.
+
+    Methods:
+        GET: Счетчики кэша текущего процесса
+
+    Response:
+        - 200 OK: hits, misses, hit_ratio, evictions, size, max_entries
+    """
+
+    def get(self, request, *args, **kwargs):
+        return Response(get_cache_stats())
+
+
+class TaskMetricsApiView(APIView):
+    """
+    API endpoint с метриками запросов в формате Prometheus.
+
+    Methods:
+        GET: Количество запросов, гистограмма длительности, количество
+            и время SQL-запросов, время рендеринга по view и методу
+
+    Response:
+        - 200 OK: text/plain в формате Prometheus
+
+    Метрики собирает TaskMetricsMiddleware при TASKS_METRICS_ENABLED=True.
+    С TASKS_METRICS_DIR значения суммируются по всем процессам gunicorn,
+    без него относятся к текущему процессу.
+    """
+
+    def get(self, request, *args, **kwargs):
+        return HttpResponse(render_prometheus(), content_type=PROMETHEUS_CONTENT_TYPE)
+
+
+class TaskSummaryApiView(APIView):
+    """
+    API endpoint со сводкой по статусам задач.
+
+    Methods:
+        GET: Количество задач в каждом статусе и общее количество
+
+    Response:
+        - 200 OK: {"created": int, "underway": int, "completed": int, "total": int}
+
+    Сводка читается из предрассчитанных счетчиков TaskStatusCounter,
+    а не агрегатом по таблице задач.
+    """
+
+    def get(self, request, *args, **kwargs):
+        return Response(get_status_summary())
+
+
+class TaskExportApiView(GenericAPIView):
+    """
+    API endpoint для потоковой выгрузки всех задач.
+
+    Methods:
+        GET: Выгрузка задач в NDJSON или CSV
+
+    Query Parameters:
+        - export_format (str): ndjson (по умолчанию) или csv
+        - status, exclude_status, title_prefix, title_contains: фильтры как у списка
+
+    Response:
+        - 200 OK: StreamingHttpResponse с задачами
+        - 400 Bad Request: Неизвестный формат или недопустимый фильтр
+
+    Задачи читаются серверным курсором пачками, поэтому память не зависит
+    от размера таблицы, а первые байты отправляются сразу. Под ASGI ответ
+    строится из асинхронного итератора (astream_tasks), иначе Django
+    прочитал бы всю выгрузку в память до отправки.
+    """
+
+    queryset = Task.objects.all()
+    serializer_class = TaskSerializer
+    filter_backends = [TaskFilterBackend]
+
+    def perform_content_negotiation(self, request, force=False):
+        """Формат задается параметром export_format, а не заголовком Accept."""
+        return super().perform_content_negotiation(request, force=True)
+
+    def get(self, request, *args, **kwargs):
+        export_format = request.query_params.get("export_format", "ndjson")
+        if export_format not in EXPORT_FORMATS:
+            raise ValidationError(
+                {"export_format": [f'"{export_format}" is not a valid choice.']}
+            )
+        queryset = self.filter_queryset(self.get_queryset())
+        if isinstance(request._request, ASGIRequest):
+            content = astream_tasks(queryset, export_format)
+        else:
+            content = stream_tasks(queryset, export_format)
+        response = StreamingHttpResponse(
+            content, content_type=EXPORT_FORMATS[export_format]
+        )
+        response["Content-Disposition"] = (
+            f'attachment; filename="tasks.{export_format}"'
+        )
+        return response
+
+
+class TaskJobCreateApiView(CreateAPIView):
+    """
+    API endpoint для постановки фонового задания в очередь.
+
+    Methods:
+        POST: Создание задания; выполняет его воркер run_task_worker
+
+    Request Body:
+        - kind (str): bulk_status, export или purge_completed
+        - params (dict): Параметры задания:
+            - bulk_status: status и filters (фильтры как у списка)
+            - export: export_format (ndjson или csv) и filters
+            - purge_completed: before (ISO 8601, по updated_at, опционально)
+
+    Response:
+        - 202 Accepted: Задание в очереди, ссылка на статус в Location
+        - 400 Bad Request: Неизвестный тип или невалидные параметры
+
+    Запрос выполняет один INSERT, поэтому время ответа не зависит
+    от количества задач, которые обработает задание.
+    """
+
+    queryset = TaskJob.objects.all()
+    serializer_class = TaskJobSerializer
+
+    def perform_create(self, serializer):
+        serializer.instance = enqueue_job(
+            serializer.validated_data["kind"],
+            serializer.validated_data.get("params", {}),
+        )
+
+    def create(self, request, *args, **kwargs):
+        response = super().create(request, *args, **kwargs)
+        response.status_code = status.HTTP_202_ACCEPTED
+        response["Location"] = reverse(
+            "tasks:task_job_detail", kwargs={"pk": response.data["uuid"]}
+        )
+        return response
+
+
+class TaskJobRetrieveApiView(RetrieveAPIView):
+    """
+    API endpoint для получения состояния фонового задания.
+
+    Methods:
+        GET: Состояние, прогресс и результат задания
+
+    Path Parameters:
+        - pk (UUID): UUID задания
+
+    Response:
+        - 200 OK: Задание (status: queued, running, succeeded, failed)
+        - 404 Not Found: Задание не найдено
+    """
+
+    queryset = TaskJob.objects.all()
+    serializer_class = TaskJobSerializer
+
+
+class TaskJobDownloadApiView(GenericAPIView):
+    """
+    API endpoint для скачивания результата задания export.
+
+    Methods:
+        GET: Файл выгрузки в формате из параметров задания
+
+    Path Parameters:
+        - pk (UUID): UUID задания
+
+    Response:
+        - 200 OK: Файл выгрузки
+        - 404 Not Found: Задание не найдено, не является выгрузкой,
+          еще не выполнено или файл удален
+
+    Под ASGI файл отдается асинхронным итератором (aread_file), как
+    потоковая выгрузка export/.
+    """
+
+    queryset = TaskJob.objects.filter(kind="export", status="succeeded")
+    serializer_class = TaskJobSerializer
+
+    def get(self, request, *args, **kwargs):
+        job = self.get_object()
+        path = get_export_path(job)
+        if not path.is_file():
+            raise Http404
+        export_format = job.params["export_format"]
+        response = FileResponse(
+            open(path, "rb"),
+            as_attachment=True,
+            filename=f"tasks.{export_format}",
+            content_type=EXPORT_FORMATS[export_format],
+        )
+        if isinstance(request._request, ASGIRequest):
+            # Заголовки уже выставлены по файлу, заменяется только итератор.
+            response.streaming_content = aread_file(
+                response.file_to_stream, response.block_size
+            )
+        return response